@@ -4,20 +4,36 @@ Tüm analiz sürecini tek komutla çalıştırır.
 
 Kullanım:
     python main.py
+    python main.py --yenile     # Excel önbelleğini yok say, dosyayı yeniden ayrıştır
+    python main.py --artimli    # Sadece son çalıştırmadan sonra eklenen baskıları işle
+    python main.py --coklu "*Pres*.xlsx"   # Desene uyan tüm pres dosyalarını paralel yükle
+    python main.py --takip plc_export.csv  # PLC dışa aktarımını canlı izle, yeni baskıları kontrol et
+    python main.py --bellek     # Analiz adımlarının bellek kullanımını ölç ve raporla
 """
 
 import sys
 import os
+import argparse
 from datetime import datetime
 import warnings
 warnings.filterwarnings('ignore')
 
 # Modülleri içe aktar
 from src.veri_yukleme import VeriYukleyici
-from src.veri_temizleme import VeriTemizleyici
+from src.veri_temizleme import onbellekli_temizle
+from src.artimli_yukleme import ArtimliYukleyici
+from src.coklu_yukleme import CokluVeriYukleyici
 from src.anomali_tespiti import AnomaliBulucu
 from src.gorsellestirme import Gorselestirici
 from src.performans_analizi import PerformansAnalizci
+from src.veri_kumesi import TembelVeriKumesi
+from src.depo import PresDeposu
+from src.canli_takip import DosyaTakipci, CanliTakip
+from src.cevrimici_anomali import CevrimiciAnomaliBulucu
+from src.islem_baglami import IslemBaglami
+from src.kantil_ozeti import KantilOzetleri
+from src.kalip_temelleri import KalipTemelleri
+from src.onbellek import TemizlikOnbellegi
 
 def banner():
     """Başlangıç banner'ı"""
@@ -34,54 +50,216 @@ def adim_baslik(adim_no, baslik):
     print(f"ADIM {adim_no}: {baslik}")
     print("🔷"*40 + "\n")
 
-def main():
+def argumanlari_oku():
+    """Komut satırı argümanlarını okur"""
+    parser = argparse.ArgumentParser(description='Enjeksiyon presi veri analizi')
+    parser.add_argument('--yenile', action='store_true',
+                        help='Excel ve temizlik önbelleklerini yok say; dosyayı yeniden ayrıştır ve temizle')
+    parser.add_argument('--artimli', action='store_true',
+                        help='Sadece filigrandan sonra eklenen baskıları yükle ve temizle')
+    parser.add_argument('--coklu', nargs='?', const='*Pres*.xlsx', metavar='DESEN',
+                        help='data/raw altında desene uyan tüm pres dosyalarını paralel yükle')
+    parser.add_argument('--takip', metavar='DOSYA',
+                        help='Büyüyen PLC CSV dışa aktarımını izle ve yeni baskıları anlık kontrol et')
+    parser.add_argument('--aralik', type=float, default=1.0, metavar='SN',
+                        help='Canlı takipte dosyanın kontrol sıklığı (varsayılan: 1 sn)')
+    parser.add_argument('--cevrimici', action='store_true',
+                        help='Canlı takipte her baskıyı kayan (EWMA) temellere göre puanla')
+    parser.add_argument('--kalip-bazli', action='store_true',
+                        help='IQR anomalilerini her baskının kendi kalıbının (KALIP NO) sınırlarıyla bul')
+    parser.add_argument('--bellek', action='store_true',
+                        help='Analiz adımlarının bellek kullanımını tracemalloc ile ölç')
+    return parser.parse_args()
+
+def canli_takip(args):
+    """PLC dışa aktarımını canlı izler; sınırlar kayıtlı kantil özetlerinden gelir"""
+    referans = 'data/processed/enjeksiyon_temiz.parquet'
+    
+    if not os.path.exists(referans):
+        print(f"❌ HATA: {referans} bulunamadı! Önce main.py ile tam analiz çalıştırılmalı.")
+        return False
+    
+    ozetler = CanliTakip.referans_ozetleri(TembelVeriKumesi(referans))
+    
+    # Takip veritabanına ve özetlere yeni baskı ekler; sonraki tam analiz çıktıları yeniden yazmalı
+    TemizlikOnbellegi().isareti_kaldir()
+    
+    # Kalıp temelleri tam analizde kaydedilir; geçmiş yeniden hesaplanmaz
+    temeller = KalipTemelleri.yukle() if args.kalip_bazli else None
+    if args.kalip_bazli and temeller is None:
+        print("⚠️  Kalıp temelleri bulunamadı, genel sınırlar kullanılacak")
+    
+    depo = PresDeposu()
+    takip = CanliTakip(
+        DosyaTakipci(args.takip), ozetler.sinirlar(AnomaliBulucu.IQR_ESIKLERI),
+        depo=depo if depo.mevcut_mu() else None,
+        aralik=args.aralik,
+        ozetler=ozetler,
+        bulucu=CevrimiciAnomaliBulucu.ozetlerden(ozetler) if args.cevrimici else None,
+        temeller=temeller
+    )
+    takip.calistir()
+    
+    # Takip sırasında eklenen baskılar sonraki çalıştırmalarda da kullanılır
+    ozetler.kaydet()
+    
+    return True
+
+def main(args=None):
     """Ana çalıştırma fonksiyonu"""
     
+    if args is None:
+        args = argumanlari_oku()
+    
     # Banner göster
     banner()
     
+    if args.takip:
+        return canli_takip(args)
+    
     try:
-        # ADIM 1: VERİ YÜKLEME
-        adim_baslik(1, "VERİ YÜKLEME")
-        yukleyici = VeriYukleyici()
-        df = yukleyici.enjeksiyon_presi_yukle()
-        
-        if df is None:
-            print("❌ HATA: Veri yüklenemedi! İşlem durduruluyor.")
-            sys.exit(1)
+        if args.artimli:
+            # ADIM 1-2: ARTIMLI YÜKLEME VE TEMİZLEME
+            adim_baslik(1, "ARTIMLI VERİ YÜKLEME VE TEMİZLEME")
+            artimli = ArtimliYukleyici()
+            df_yeni = artimli.artimli_yukle()
+            
+            if df_yeni is None:
+                print("❌ HATA: Veri yüklenemedi! İşlem durduruluyor.")
+                sys.exit(1)
+            
+            # Analizler birikmiş temiz verinin tamamı üzerinde çalışır
+            df_temiz = artimli.temiz_veriyi_oku()
+            
+            # Yeni baskıları veritabanına ekle; veritabanı yoksa tüm geçmişi yaz
+            depo = PresDeposu()
+            if depo.mevcut_mu():
+                depo.baskilari_kaydet(df_yeni, ekle=True)
+            else:
+                depo.baskilari_kaydet(df_temiz)
+            ham_satir = len(df_temiz)
+            print(f"\n📊 Birikmiş temiz veri: {len(df_temiz)} satır ({len(df_yeni)} yeni)")
+            
+            # Temizlenmiş çıktılar artık tek bir ham veri dosyasına karşılık gelmiyor
+            TemizlikOnbellegi().isareti_kaldir()
+            ciktilar_guncel = False
+            
+            # Kantil özetlerine sadece yeni baskılar eklenir
+            ozetler = KantilOzetleri.yukle()
+            if ozetler is not None:
+                ozetler.guncelle(df_yeni, list(AnomaliBulucu.IQR_ESIKLERI))
+            
+            # Yeni baskılar, kendilerini henüz içermeyen kayıtlı kalıp temelleriyle kontrol edilir
+            temeller = KalipTemelleri.yukle()
+            if temeller is not None:
+                disarida = temeller.disarida_kalanlar(df_yeni, list(AnomaliBulucu.IQR_ESIKLERI))
+                print(f"🔍 {disarida.sum()}/{len(df_yeni)} yeni baskı kayıtlı kalıp temellerinin dışında")
+        else:
+            # ADIM 1: VERİ YÜKLEME
+            adim_baslik(1, "VERİ YÜKLEME")
+            yukleyici = VeriYukleyici()
+            if args.coklu:
+                df = CokluVeriYukleyici().pres_verilerini_yukle(args.coklu, yenile=args.yenile)
+            else:
+                df = yukleyici.enjeksiyon_presi_yukle(yenile=args.yenile)
+            
+            if df is None:
+                print("❌ HATA: Veri yüklenemedi! İşlem durduruluyor.")
+                sys.exit(1)
+            
+            yukleyici.veri_bilgisi_goster(df, "ENJEKSİYON PRESİ HAM VERİ")
+            
+            # ADIM 2: VERİ TEMİZLEME
+            # Aynı ham veri aynı temizleyiciyle daha önce temizlendiyse sonuç önbellekten gelir
+            adim_baslik(2, "VERİ TEMİZLEME")
+            onbellek = TemizlikOnbellegi()
+            df_temiz, _, anahtar, isabet = onbellekli_temizle(df, onbellek, yenile=args.yenile)
+            
+            # Ham veri sadece satır sayısı için gerekli; analiz adımlarında bellekte tutulmaz
+            ham_satir = len(df)
+            del df
+            
+            depo = PresDeposu()
+            ciktilar = ['data/processed/enjeksiyon_temiz.csv', 'data/processed/enjeksiyon_temiz.parquet',
+                        'data/processed/kantil_ozetleri.json', 'data/processed/kalip_temelleri.json',
+                        depo.db_yolu]
+            ciktilar_guncel = isabet and onbellek.ciktilar_guncel_mi(anahtar, ciktilar)
+            
+            if ciktilar_guncel:
+                print("\n✅ Temizlenmiş çıktılar bu veriden üretilmiş, yeniden yazılmadı")
+            else:
+                # Temizlenmiş veriyi kaydet ve artımlı yükleme için filigranı güncelle
+                # (filigran tek pres dosyası içindir)
+                df_temiz.to_csv('data/processed/enjeksiyon_temiz.csv', index=False)
+                if not args.coklu:
+                    ArtimliYukleyici().filigran_yaz(df_temiz)
+                
+                depo.baskilari_kaydet(df_temiz)
+                print("\n💾 Temizlenmiş veri 'data/processed/enjeksiyon_temiz.csv' olarak kaydedildi!")
+            ozetler = None
+            temeller = None
         
-        yukleyici.veri_bilgisi_goster(df, "ENJEKSİYON PRESİ HAM VERİ")
+        if not ciktilar_guncel:
+            # Makine bazında kantil özetleri; canlı takip ve çoklu pres analizi sınırları
+            # tüm veriyi tekrar sıralamadan bu özetlerden alır
+            if ozetler is None:
+                ozetler = KantilOzetleri.veriden(df_temiz, list(AnomaliBulucu.IQR_ESIKLERI))
+            ozetler.kaydet()
+            
+            # Kalıp bazında kesin çeyrekler (tek groupby geçişi); kalıp bazlı
+            # anomali modu ve canlı takip bu tablodan okur. Kesin çeyrekler
+            # kayıtlı Q1/Q3'ten birleştirilemez; yeni baskılar birikmiş temiz
+            # veriyle birlikte yeniden hesaplanıp sonraki çalıştırma için saklanır,
+            # bu çalıştırmanın kontrolü yukarıda yüklenen eski temellerle yapılır
+            guncel_temeller = KalipTemelleri.veriden(df_temiz, list(AnomaliBulucu.IQR_ESIKLERI))
+            guncel_temeller.kaydet()
+            if temeller is None:
+                temeller = guncel_temeller
+            
+            # Sütunlu kopya canlı takip ve sonraki çalıştırmalar içindir
+            TembelVeriKumesi.kaydet(df_temiz, 'data/processed/enjeksiyon_temiz.parquet')
+            
+            if not args.artimli:
+                onbellek.ciktilari_isaretle(anahtar)
+        else:
+            ozetler = KantilOzetleri.yukle()
+            temeller = KalipTemelleri.yukle()
         
-        # ADIM 2: VERİ TEMİZLEME
-        adim_baslik(2, "VERİ TEMİZLEME")
-        temizleyici = VeriTemizleyici(df)
-        df_temiz = temizleyici.temizle()
+        # Analiz adımları bellekteki tek temiz çerçeveyi kopyalamadan (copy-on-write) paylaşır
+        baglam = IslemBaglami(df_temiz, olcum=args.bellek)
+        kume = baglam.kume()
         
-        # Temizlenmiş veriyi kaydet
-        df_temiz.to_csv('data/processed/enjeksiyon_temiz.csv', index=False)
-        print("\n💾 Temizlenmiş veri 'data/processed/enjeksiyon_temiz.csv' olarak kaydedildi!")
+        # Tek dosyada IQR sınırları tam hesaplanır; çoklu pres verisinde
+        # birleştirilmiş özetler kullanılır
+        ortak_ozetler = ozetler if args.coklu else None
         
         # ADIM 3: ANOMALİ TESPİTİ
         adim_baslik(3, "ANOMALİ TESPİTİ")
-        bulucu = AnomaliBulucu(df_temiz)
-        anomaliler = bulucu.tam_analiz_yap()
+        with baglam.olc("Anomali tespiti"):
+            bulucu = AnomaliBulucu.veri_kumesinden(kume, ortak_ozetler,
+                                                   temeller if args.kalip_bazli else None)
+            anomaliler = bulucu.tam_analiz_yap()
         
         # Anomalileri kaydet
         if anomaliler:
-            for param, anomali_df in anomaliler.items():
+            # Tam satırlar sadece dışa aktarırken, blok blok üretilir
+            for param, anomali_sonucu in anomaliler.items():
                 dosya_adi = param.replace(' ', '_').replace('.', '').lower()
-                anomali_df.to_csv(f'data/processed/anomali_{dosya_adi}.csv', index=False)
+                anomali_sonucu.csv_kaydet(f'data/processed/anomali_{dosya_adi}.csv')
             print(f"\n💾 {len(anomaliler)} adet anomali dosyası 'data/processed/' klasörüne kaydedildi!")
+        depo.anomalileri_kaydet(anomaliler, kapsam=df_temiz)
         
         # ADIM 4: GÖRSELLEŞTİRME
         adim_baslik(4, "GÖRSELLEŞTİRME")
-        gorselestirici = Gorselestirici(df_temiz)
-        gorselestirici.tum_grafikleri_olustur()
+        with baglam.olc("Görselleştirme"):
+            gorselestirici = Gorselestirici.veri_kumesinden(kume)
+            gorselestirici.tum_grafikleri_olustur()
         
         # ADIM 5: PERFORMANS ANALİZİ
         adim_baslik(5, "PERFORMANS ANALİZİ")
-        analizci = PerformansAnalizci(df_temiz)
-        performans_raporu = analizci.tam_performans_analizi()
+        with baglam.olc("Performans analizi"):
+            analizci = PerformansAnalizci.veri_kumesinden(kume, ortak_ozetler)
+            performans_raporu = analizci.tam_performans_analizi()
         
         # Performans raporunu kaydet
         import json
@@ -110,7 +288,10 @@ def main():
         
         # ADIM 6: ÖZET RAPOR
         adim_baslik(6, "ÖZET RAPOR")
-        ozet_rapor_olustur(df, df_temiz, anomaliler, performans_raporu)
+        ozet_rapor_olustur(ham_satir, df_temiz, anomaliler, performans_raporu)
+        
+        if args.bellek:
+            baglam.olcum_raporu()
         
         # BAŞARI MESAJI
         print("\n" + "="*80)
@@ -119,6 +300,10 @@ def main():
         
         print("\n📁 Oluşturulan Dosyalar:")
         print("   📊 data/processed/enjeksiyon_temiz.csv")
+        print("   📊 data/processed/enjeksiyon_temiz.parquet")
+        print("   📊 data/processed/kantil_ozetleri.json")
+        print("   📊 data/processed/kalip_temelleri.json")
+        print("   🗄️  data/processed/enjeksiyon.db")
         print("   📊 data/processed/anomali_*.csv")
         print("   📈 reports/figures/*.png (5 grafik)")
         print("   📋 reports/performans_raporu.json")
@@ -135,7 +320,7 @@ def main():
         traceback.print_exc()
         return False
 
-def ozet_rapor_olustur(df_ham, df_temiz, anomaliler, performans):
+def ozet_rapor_olustur(ham_satir, df_temiz, anomaliler, performans):
     """Özet metin raporu oluşturur"""
     
     rapor = []
@@ -149,9 +334,9 @@ def ozet_rapor_olustur(df_ham, df_temiz, anomaliler, performans):
     # VERİ ÖZETİ
     rapor.append("\n1. VERİ ÖZETİ")
     rapor.append("-"*80)
-    rapor.append(f"   Ham Veri Satırı: {len(df_ham)}")
+    rapor.append(f"   Ham Veri Satırı: {ham_satir}")
     rapor.append(f"   Temizlenmiş Veri Satırı: {len(df_temiz)}")
-    rapor.append(f"   Silinen Satır: {len(df_ham) - len(df_temiz)}")
+    rapor.append(f"   Silinen Satır: {ham_satir - len(df_temiz)}")
     rapor.append(f"   Sütun Sayısı: {len(df_temiz.columns)}")
     rapor.append(f"   Tarih Aralığı: {df_temiz['TARİH'].min().date()} - {df_temiz['TARİH'].max().date()}")
     
@@ -160,12 +345,17 @@ def ozet_rapor_olustur(df_ham, df_temiz, anomaliler, performans):
     rapor.append("-"*80)
     
     if anomaliler:
-        toplam_anomali = sum(len(v) for v in anomaliler.values())
+        # Çok değişkenli (MAHALANOBIS) sonuç tek parametreli toplamdan ayrı tutulur
+        tek_degiskenli = {k: v for k, v in anomaliler.items() if k != 'MAHALANOBIS'}
+        toplam_anomali = sum(len(v) for v in tek_degiskenli.values())
         rapor.append(f"   Toplam Anomali: {toplam_anomali} ({toplam_anomali/len(df_temiz)*100:.1f}%)")
-        rapor.append(f"   Anomali Bulunan Parametre: {len(anomaliler)} adet")
+        rapor.append(f"   Anomali Bulunan Parametre: {len(tek_degiskenli)} adet")
+        if 'MAHALANOBIS' in anomaliler:
+            cok_degiskenli = len(anomaliler['MAHALANOBIS'])
+            rapor.append(f"   Çok Değişkenli Anomali: {cok_degiskenli} ({cok_degiskenli/len(df_temiz)*100:.1f}%)")
         rapor.append("\n   Detay:")
-        for param, anomali_df in anomaliler.items():
-            rapor.append(f"      • {param}: {len(anomali_df)} adet")
+        for param, anomali_sonucu in tek_degiskenli.items():
+            rapor.append(f"      • {param}: {len(anomali_sonucu)} adet")
     else:
         rapor.append("   ✅ Hiçbir anomali tespit edilmedi!")
     
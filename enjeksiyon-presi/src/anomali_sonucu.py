@@ -0,0 +1,166 @@
+"""
+Anomali Sonucu Modülü
+Bu modül bir parametrenin anomali tespit sonucunu satır kopyalamadan tutar.
+Sonuç, kaynak veri çerçevesine bir referans, anomali satırlarının konumları
+ve kullanılan sınırlardan oluşur; tam genişlikli satırlar sadece istendiğinde
+(dışa aktarma, tek bir anomaliyi görüntüleme) üretilir. Büyük veride her
+parametre için verinin anormal kısmının ayrı bir kopyasını tutmanın bellek
+maliyeti böylece ortadan kalkar.
+"""
+
+import numpy as np
+import pandas as pd
+
+# CSV'ye yazarken bir seferde üretilen satır sayısı
+BLOK_SATIR = 65536
+
+class AnomaliSonucu:
+    """
+    Tek bir parametrenin anomali satırları (konum listesi) ve sınırları
+    """
+    
+    def __init__(self, df, parametre, konumlar, alt=None, ust=None, ek=None):
+        """
+        Args:
+            df (pd.DataFrame): Kaynak veri (kopyalanmaz)
+            parametre (str): Anomalinin ait olduğu parametre (veya yöntem adı)
+            konumlar (np.ndarray): Anomali satırlarının df içindeki konumları
+                (raporlanacak sırayla)
+            alt (float | np.ndarray): Alt sınır; kalıp bazlı modda satır başına
+            ust (float | np.ndarray): Üst sınır; kalıp bazlı modda satır başına
+            ek (dict): Sütun adı -> konumlarla hizalı ek değerler
+                (ör. MAHALANOBIS uzaklığı)
+        """
+        self.df = df
+        self.parametre = parametre
+        self.konumlar = np.asarray(konumlar, dtype=np.intp)
+        self.alt = alt
+        self.ust = ust
+        self.ek = ek or {}
+        
+        # Sonradan kaynağa eklenen yardımcı sütunlar (ör. HIZ_ORANI) çıktıya girmez
+        self.sutunlar = list(df.columns)
+    
+    @classmethod
+    def maskeden(cls, df, parametre, maske, alt=None, ust=None):
+        """
+        Bool maskeden sonuç oluşturur
+        
+        Args:
+            df (pd.DataFrame): Kaynak veri
+            parametre (str): Parametre adı
+            maske (np.ndarray | pd.Series): Anomali maskesi (NaN anomali değildir)
+            alt, ust: Kullanılan sınırlar; satır başına dizilerse anomali
+                satırlarına indirgenir
+        
+        Returns:
+            AnomaliSonucu: Sonuç
+        """
+        maske = np.asarray(maske, dtype=bool)
+        konumlar = np.flatnonzero(maske)
+        if isinstance(alt, np.ndarray):
+            alt = alt[konumlar]
+        if isinstance(ust, np.ndarray):
+            ust = ust[konumlar]
+        return cls(df, parametre, konumlar, alt, ust)
+    
+    @classmethod
+    def bos(cls, df, parametre):
+        """Anomalisi olmayan sonuç"""
+        return cls(df, parametre, np.empty(0, dtype=np.intp))
+    
+    def __len__(self):
+        return len(self.konumlar)
+    
+    def __repr__(self):
+        return f"AnomaliSonucu({self.parametre!r}, {len(self)} satır)"
+    
+    def maske(self):
+        """
+        Kaynak veri uzunluğunda anomali maskesi
+        
+        Returns:
+            np.ndarray: bool maske
+        """
+        maske = np.zeros(len(self.df), dtype=bool)
+        maske[self.konumlar] = True
+        return maske
+    
+    def bit_maskesi(self):
+        """
+        Paketlenmiş anomali maskesi (satır başına bir bit)
+        
+        Returns:
+            np.ndarray: uint8 dizisi; np.unpackbits(..., count=len(df)) ile açılır
+        """
+        return np.packbits(self.maske())
+    
+    def sutun(self, col=None):
+        """
+        Anomali satırlarında tek bir sütun
+        
+        Args:
+            col (str): Sütun (None ise parametrenin kendisi)
+        
+        Returns:
+            pd.Series: Kaynak indeksli değerler
+        """
+        col = self.parametre if col is None else col
+        if col in self.ek:
+            return pd.Series(self.ek[col], index=self.df.index[self.konumlar], name=col)
+        return self.df[col].iloc[self.konumlar]
+    
+    def satirlar(self, sutunlar=None, bas=0, bit=None):
+        """
+        Anomali satırlarını veri çerçevesi olarak üretir
+        
+        Args:
+            sutunlar (list): İstenen sütunlar (None ise tümü; olmayanlar atlanır)
+            bas (int): Üretilecek ilk anomali sırası
+            bit (int): Üretilecek son anomali sırası (hariç)
+        
+        Returns:
+            pd.DataFrame: Anomali satırları (ek sütunlar sonda)
+        """
+        secilen = self.sutunlar + list(self.ek) if sutunlar is None else sutunlar
+        kaynak = [col for col in secilen if col in self.sutunlar]
+        konumlar = self.konumlar[bas:bit]
+        
+        satirlar = self.df[kaynak].iloc[konumlar]
+        for col, degerler in self.ek.items():
+            if col in secilen:
+                satirlar[col] = degerler[bas:bit]
+        return satirlar
+    
+    def satir(self, sira):
+        """
+        Tek bir anomaliyi görüntülemek için tam satır
+        
+        Args:
+            sira (int): Anomali sırası
+        
+        Returns:
+            pd.Series: Satır (sınırlar ve ek değerlerle)
+        """
+        satir = self.satirlar(bas=sira, bit=sira + 1).iloc[0].copy()
+        for ad, sinir in (('ALT SINIR', self.alt), ('ÜST SINIR', self.ust)):
+            if sinir is not None:
+                satir[ad] = sinir[sira] if isinstance(sinir, np.ndarray) else sinir
+        return satir
+    
+    def csv_kaydet(self, yol, blok_satir=BLOK_SATIR):
+        """
+        Anomali satırlarını CSV'ye blok blok yazar (tüm sonuç bellekte üretilmez)
+        
+        Args:
+            yol (str): Dosya yolu
+            blok_satir (int): Bir seferde yazılan satır sayısı
+        """
+        if len(self) == 0:
+            self.satirlar().to_csv(yol, index=False)
+            return
+        
+        for bas in range(0, len(self), blok_satir):
+            self.satirlar(bas=bas, bit=bas + blok_satir).to_csv(
+                yol, index=False, mode='w' if bas == 0 else 'a', header=bas == 0
+            )
@@ -11,23 +11,91 @@ from datetime import datetime
 import warnings
 warnings.filterwarnings('ignore')
 
+try:
+    from .veri_kumesi import sutunlari_filtrele
+    from .istatistik_motoru import motor
+    from .islem_baglami import paylasimli_gorunum
+    from .cok_degiskenli_anomali import CokDegiskenliBulucu, PARAMETRELER, ki_kare_kantili
+    from .anomali_sonucu import AnomaliSonucu
+except ImportError:
+    from veri_kumesi import sutunlari_filtrele
+    from istatistik_motoru import motor
+    from islem_baglami import paylasimli_gorunum
+    from cok_degiskenli_anomali import CokDegiskenliBulucu, PARAMETRELER, ki_kare_kantili
+    from anomali_sonucu import AnomaliSonucu
+
 class AnomaliBulucu:
     """
     Anomali tespit işlemlerini gerçekleştiren sınıf
     """
     
-    def __init__(self, df):
+    # Analizde kullanılan sütunlar; kimlik sütunları anomali kayıtlarında kalır
+    GEREKLI_SUTUNLAR = ['TARİH', 'KALIP NO', 'BASKI NO', 'MAKİNE KODU'] + PARAMETRELER
+    
+    # Parametre -> IQR eşik katsayısı (tam_analiz_yap ve canlı takip aynı eşikleri kullanır)
+    IQR_ESIKLERI = {
+        'PİSTON SÜRTÜNME BASINCI': 1.5,
+        'KALIP DOLUM ZAMANI': 1.5,
+        'BİRİNCİ FAZ HIZI': 1.5,
+        'İKİNCİ FAZ HIZI': 1.5,
+        '3. FAZ BASINC YÜKSELME ZAMANI': 2.0
+    }
+    
+    # Parametre -> bu değerin üzeri kritik kabul edilir (ms)
+    KRITIK_ESIKLER = {
+        'KALIP DOLUM ZAMANI': 1200,
+        '3. FAZ BASINC YÜKSELME ZAMANI': 1000
+    }
+    
+    def __init__(self, df, ozetler=None, temeller=None):
         """
         Args:
             df (pd.DataFrame): Temizlenmiş DataFrame
+            ozetler (KantilOzetleri): Verilirse IQR sınırları kesin çeyrekler
+                yerine bu kantil özetlerinden alınır (akış / filo modu)
+            temeller (KalipTemelleri): Verilirse IQR kontrolü her baskıyı kendi
+                kalıbının sınırlarıyla yapar (kalıp bazlı mod)
         """
-        self.df = df.copy()
+        self.df = paylasimli_gorunum(df)
+        self.ozetler = ozetler
+        self.temeller = temeller
         self.anomaliler = {}
         
         # Grafik stilini ayarla
         plt.style.use('seaborn-v0_8-darkgrid')
         sns.set_palette("husl")
     
+    @classmethod
+    def gerekli_sutunlar(cls, mevcut):
+        """
+        Analizin kullandığı sütunları döndürür
+        
+        Args:
+            mevcut (list): Veri kümesindeki sütunlar
+        
+        Returns:
+            list: Yüklenecek sütunlar
+        """
+        return sutunlari_filtrele(mevcut, cls.GEREKLI_SUTUNLAR)
+    
+    @classmethod
+    def veri_kumesinden(cls, kume, ozetler=None, temeller=None):
+        """
+        Veri kümesinden sadece gerekli sütunları yükleyerek nesne oluşturur
+        
+        Args:
+            kume (TembelVeriKumesi): Temizlenmiş veri kümesi
+            ozetler (KantilOzetleri): IQR sınırları için kantil özetleri
+            temeller (KalipTemelleri): Kalıp bazlı IQR sınırları
+        """
+        return cls(kume.sec(cls.gerekli_sutunlar(kume.sutunlar)), ozetler, temeller)
+    
+    def _iqr_sinirlari(self, col, katsayi):
+        """IQR sınırları: özet varsa kantil özetinden, yoksa kesin çeyreklerden"""
+        if self.ozetler is not None and self.ozetler.ozet(col) is not None:
+            return self.ozetler.iqr_sinirlari(col, katsayi)
+        return motor.iqr_sinirlari(self.df, col, katsayi)
+    
     def istatistiksel_anomali_bul(self, col_name, method='iqr', threshold=1.5):
         """
         İstatistiksel yöntemlerle anomali bulur
@@ -38,19 +106,22 @@ class AnomaliBulucu:
             threshold (float): Eşik değeri
             
         Returns:
-            pd.DataFrame: Anomali içeren satırlar
+            AnomaliSonucu: Anomali satırlarının konumları ve kullanılan sınırlar
         """
         if col_name not in self.df.columns:
-            return pd.DataFrame()
+            return AnomaliSonucu.bos(self.df, col_name)
         
-        if method == 'iqr':
-            # IQR (Interquartile Range) Metodu
-            Q1 = self.df[col_name].quantile(0.25)
-            Q3 = self.df[col_name].quantile(0.75)
-            IQR = Q3 - Q1
+        if method == 'iqr' and self.temeller is not None and col_name in self.temeller.q1.columns:
+            # Kalıp bazlı IQR: her baskı kendi kalıbının sınırlarıyla karşılaştırılır
+            lower_bound, upper_bound = self.temeller.sinir_dizileri(self.df, col_name, threshold)
+            anomali_mask = self.temeller.maske(self.df, col_name, threshold)
+            
+            print(f"\n📊 {col_name} - Kalıp Bazlı IQR Analizi:")
+            print(self.temeller.sinir_tablosu(col_name, threshold).round(2).to_string())
             
-            lower_bound = Q1 - threshold * IQR
-            upper_bound = Q3 + threshold * IQR
+        elif method == 'iqr':
+            # IQR (Interquartile Range) Metodu
+            Q1, Q3, lower_bound, upper_bound = self._iqr_sinirlari(col_name, threshold)
             
             anomali_mask = (self.df[col_name] < lower_bound) | (self.df[col_name] > upper_bound)
             
@@ -61,18 +132,20 @@ class AnomaliBulucu:
             
         elif method == 'zscore':
             # Z-Score Metodu
-            mean = self.df[col_name].mean()
-            std = self.df[col_name].std()
+            ist = motor.sutun(self.df, col_name)
+            mean, std = ist['ortalama'], ist['std']
             
             z_scores = np.abs((self.df[col_name] - mean) / std)
             anomali_mask = z_scores > threshold
+            lower_bound, upper_bound = mean - threshold * std, mean + threshold * std
             
             print(f"\n📊 {col_name} - Z-Score Analizi:")
             print(f"   Ortalama: {mean:.2f}")
             print(f"   Std. Sapma: {std:.2f}")
             print(f"   Eşik: ±{threshold} std")
         
-        anomaliler = self.df[anomali_mask].copy()
+        # Satırlar kopyalanmaz; sadece konumlar ve sınırlar tutulur
+        anomaliler = AnomaliSonucu.maskeden(self.df, col_name, anomali_mask, lower_bound, upper_bound)
         
         if len(anomaliler) > 0:
             print(f"   ⚠️  {len(anomaliler)} anomali tespit edildi ({len(anomaliler)/len(self.df)*100:.2f}%)")
@@ -82,6 +155,24 @@ class AnomaliBulucu:
         
         return anomaliler
     
+    def sinirlari_hesapla(self):
+        """
+        IQR_ESIKLERI'ndeki her parametre için alt/üst anomali sınırlarını hesaplar
+        
+        Returns:
+            dict: Parametre -> (alt sınır, üst sınır)
+        """
+        sinirlar = {}
+        
+        for col, threshold in self.IQR_ESIKLERI.items():
+            if col not in self.df.columns:
+                continue
+            
+            _, _, alt, ust = self._iqr_sinirlari(col, threshold)
+            sinirlar[col] = (float(alt), float(ust))
+        
+        return sinirlar
+    
     def surtuname_basinci_analizi(self):
         """
         Piston sürtünme basıncı anomalilerini analiz eder
@@ -93,23 +184,27 @@ class AnomaliBulucu:
         col = 'PİSTON SÜRTÜNME BASINCI'
         
         # İstatistikler
+        ist = motor.sutun(self.df, col)
         print(f"\n📊 Temel İstatistikler:")
-        print(f"   Ortalama: {self.df[col].mean():.2f} bar")
-        print(f"   Medyan: {self.df[col].median():.2f} bar")
-        print(f"   Min: {self.df[col].min():.2f} bar")
-        print(f"   Max: {self.df[col].max():.2f} bar")
-        print(f"   Std Sapma: {self.df[col].std():.2f} bar")
+        print(f"   Ortalama: {ist['ortalama']:.2f} bar")
+        print(f"   Medyan: {ist['medyan']:.2f} bar")
+        print(f"   Min: {ist['min']:.2f} bar")
+        print(f"   Max: {ist['max']:.2f} bar")
+        print(f"   Std Sapma: {ist['std']:.2f} bar")
         
         # Anomali tespiti
-        anomaliler = self.istatistiksel_anomali_bul(col, method='iqr', threshold=1.5)
+        anomaliler = self.istatistiksel_anomali_bul(col, method='iqr', threshold=self.IQR_ESIKLERI[col])
         
         if len(anomaliler) > 0:
             print(f"\n⚠️  Anormal Basınç Değerleri:")
-            print(f"   En Düşük Anormal: {anomaliler[col].min():.2f} bar")
-            print(f"   En Yüksek Anormal: {anomaliler[col].max():.2f} bar")
+            degerler = anomaliler.sutun()
+            print(f"   En Düşük Anormal: {degerler.min():.2f} bar")
+            print(f"   En Yüksek Anormal: {degerler.max():.2f} bar")
             
             # Tarih bazlı analiz
-            anomaliler_gunluk = anomaliler.groupby(anomaliler['TARİH'].dt.date).size()
+            gunler = anomaliler.sutun('TARİH').dt.date
+            anomaliler_gunluk = gunler.groupby(gunler).size()
+            anomaliler_gunluk.name = None
             print(f"\n📅 En Çok Anomali Olan Günler:")
             print(anomaliler_gunluk.sort_values(ascending=False).head())
         
@@ -126,25 +221,27 @@ class AnomaliBulucu:
         col = 'KALIP DOLUM ZAMANI'
         
         # İstatistikler
+        ist = motor.sutun(self.df, col)
         print(f"\n📊 Temel İstatistikler:")
-        print(f"   Ortalama: {self.df[col].mean():.0f} ms")
-        print(f"   Medyan: {self.df[col].median():.0f} ms")
-        print(f"   Min: {self.df[col].min():.0f} ms")
-        print(f"   Max: {self.df[col].max():.0f} ms")
-        print(f"   Std Sapma: {self.df[col].std():.0f} ms")
+        print(f"   Ortalama: {ist['ortalama']:.0f} ms")
+        print(f"   Medyan: {ist['medyan']:.0f} ms")
+        print(f"   Min: {ist['min']:.0f} ms")
+        print(f"   Max: {ist['max']:.0f} ms")
+        print(f"   Std Sapma: {ist['std']:.0f} ms")
         
         # Anomali tespiti
-        anomaliler = self.istatistiksel_anomali_bul(col, method='iqr', threshold=1.5)
+        anomaliler = self.istatistiksel_anomali_bul(col, method='iqr', threshold=self.IQR_ESIKLERI[col])
         
         if len(anomaliler) > 0:
             print(f"\n⚠️  Anormal Dolum Süreleri:")
-            print(f"   En Kısa Anormal: {anomaliler[col].min():.0f} ms")
-            print(f"   En Uzun Anormal: {anomaliler[col].max():.0f} ms")
+            degerler = anomaliler.sutun()
+            print(f"   En Kısa Anormal: {degerler.min():.0f} ms")
+            print(f"   En Uzun Anormal: {degerler.max():.0f} ms")
             
             # Çok uzun sürenler (performans problemi)
-            cok_uzun = anomaliler[anomaliler[col] > 1200]
-            if len(cok_uzun) > 0:
-                print(f"\n🔴 KRİTİK: {len(cok_uzun)} adet 1200ms'den uzun dolum süresi!")
+            cok_uzun = int((degerler > self.KRITIK_ESIKLER[col]).sum())
+            if cok_uzun > 0:
+                print(f"\n🔴 KRİTİK: {cok_uzun} adet 1200ms'den uzun dolum süresi!")
                 print(f"   Bu ürünler kalite kontrolünden geçmeli!")
         
         return anomaliler
@@ -169,10 +266,11 @@ class AnomaliBulucu:
         if 'BİRİNCİ FAZ HIZI' in self.df.columns and 'İKİNCİ FAZ HIZI' in self.df.columns:
             self.df['HIZ_ORANI'] = self.df['İKİNCİ FAZ HIZI'] / self.df['BİRİNCİ FAZ HIZI']
             
+            ist = motor.sutun(self.df, 'HIZ_ORANI')
             print(f"\n📊 Hız Oranı Analizi (Faz2/Faz1):")
-            print(f"   Ortalama Oran: {self.df['HIZ_ORANI'].mean():.2f}x")
-            print(f"   Min Oran: {self.df['HIZ_ORANI'].min():.2f}x")
-            print(f"   Max Oran: {self.df['HIZ_ORANI'].max():.2f}x")
+            print(f"   Ortalama Oran: {ist['ortalama']:.2f}x")
+            print(f"   Min Oran: {ist['min']:.2f}x")
+            print(f"   Max Oran: {ist['max']:.2f}x")
         
         return anomaliler_faz1, anomaliler_faz2
     
@@ -187,17 +285,18 @@ class AnomaliBulucu:
         col = '3. FAZ BASINC YÜKSELME ZAMANI'
         
         # İstatistikler
+        ist = motor.sutun(self.df, col)
         print(f"\n📊 Temel İstatistikler:")
-        print(f"   Ortalama: {self.df[col].mean():.0f} ms")
-        print(f"   Medyan: {self.df[col].median():.0f} ms")
-        print(f"   Min: {self.df[col].min():.0f} ms")
-        print(f"   Max: {self.df[col].max():.0f} ms")
+        print(f"   Ortalama: {ist['ortalama']:.0f} ms")
+        print(f"   Medyan: {ist['medyan']:.0f} ms")
+        print(f"   Min: {ist['min']:.0f} ms")
+        print(f"   Max: {ist['max']:.0f} ms")
         
         # Anomali tespiti
-        anomaliler = self.istatistiksel_anomali_bul(col, method='iqr', threshold=2.0)
+        anomaliler = self.istatistiksel_anomali_bul(col, method='iqr', threshold=self.IQR_ESIKLERI[col])
         
         # Çok yüksek değerler (potansiyel arıza)
-        cok_yuksek = self.df[self.df[col] > 1000]
+        cok_yuksek = self.df[self.df[col] > self.KRITIK_ESIKLER[col]]
         if len(cok_yuksek) > 0:
             print(f"\n🔴 UYARI: {len(cok_yuksek)} adet 1000ms'den uzun basınç yükselme zamanı!")
             print(f"   Bu MAKİNE ARIZASI göstergesi olabilir!")
@@ -206,6 +305,44 @@ class AnomaliBulucu:
         
         return anomaliler
     
+    def cok_degiskenli_analiz(self, esik_olasiligi=0.999):
+        """
+        Dokuz proses parametresini birlikte, kalıp bazında robust Mahalanobis
+        uzaklığıyla kontrol eder
+        
+        Args:
+            esik_olasiligi (float): Ki-kare eşiğinin olasılığı
+        
+        Returns:
+            AnomaliSonucu: Anomali satırları (MAHALANOBIS ve EN ETKİLİ PARAMETRE ile)
+        """
+        print("\n" + "="*70)
+        print("ÇOK DEĞİŞKENLİ ANOMALİ ANALİZİ (MAHALANOBIS)")
+        print("="*70)
+        
+        bulucu = CokDegiskenliBulucu(esik_olasiligi=esik_olasiligi).uydur(self.df)
+        anomaliler = bulucu.anomali_bul(self.df)
+        
+        ki_kare = ki_kare_kantili(esik_olasiligi, len(bulucu.sutunlar))
+        print(f"\n📊 {len(bulucu.sutunlar)} parametre, {len(bulucu.modeller) - 1} kalıp modeli")
+        print(f"   Eşik (%{esik_olasiligi*100:g}): {bulucu.esik:.2f} (ki-kare {ki_kare:.2f}; "
+              f"büyükse verinin kendi uzaklık kantili)")
+        
+        if len(anomaliler) > 0:
+            print(f"   ⚠️  {len(anomaliler)} anomali tespit edildi ({len(anomaliler)/len(self.df)*100:.2f}%)")
+            self.anomaliler['MAHALANOBIS'] = anomaliler
+            
+            if 'KALIP NO' in anomaliler.sutunlar:
+                print(f"\n📊 Kalıp Bazında:")
+                print(anomaliler.sutun('KALIP NO').value_counts().to_string())
+            
+            print(f"\n🔍 En Çok Katkı Yapan Parametreler:")
+            print(anomaliler.sutun('EN ETKİLİ PARAMETRE').value_counts().to_string())
+        else:
+            print(f"   ✅ Anomali bulunamadı")
+        
+        return anomaliler
+    
     def kalip_bazli_analiz(self):
         """
         Kalıp numarasına göre performans analizi yapar
@@ -276,18 +413,23 @@ class AnomaliBulucu:
         print("GENEL ANOMALİ RAPORU")
         print("🔴"*35)
         
-        # Toplam anomali sayısı
-        toplam_anomali = sum(len(v) for v in self.anomaliler.values())
+        # Toplam anomali sayısı (tek parametreli kontroller; çok değişkenli
+        # sonuç aynı baskıları da işaretleyebildiği için ayrı raporlanır)
+        tek_degiskenli = {k: v for k, v in self.anomaliler.items() if k != 'MAHALANOBIS'}
+        toplam_anomali = sum(len(v) for v in tek_degiskenli.values())
         
         print(f"\n📊 ÖZET:")
         print(f"   Toplam Kayıt: {len(self.df)}")
         print(f"   Toplam Anomali: {toplam_anomali} ({toplam_anomali/len(self.df)*100:.2f}%)")
-        print(f"   Anomali Bulunan Parametre Sayısı: {len(self.anomaliler)}")
+        print(f"   Anomali Bulunan Parametre Sayısı: {len(tek_degiskenli)}")
+        if 'MAHALANOBIS' in self.anomaliler:
+            cok_degiskenli = len(self.anomaliler['MAHALANOBIS'])
+            print(f"   Çok Değişkenli Anomali: {cok_degiskenli} ({cok_degiskenli/len(self.df)*100:.2f}%)")
         
-        if self.anomaliler:
+        if tek_degiskenli:
             print(f"\n⚠️  ANOMALİ DAĞILIMI:")
-            for param, anomali_df in self.anomaliler.items():
-                print(f"   • {param}: {len(anomali_df)} adet")
+            for param, anomali_sonucu in tek_degiskenli.items():
+                print(f"   • {param}: {len(anomali_sonucu)} adet")
         
         # Kritik öneriler
         print(f"\n💡 ÖNERİLER:")
@@ -312,6 +454,11 @@ class AnomaliBulucu:
             print(f"      → Acil makine bakımı gerekli!")
             print(f"      → Valf sistemi kontrol edilmeli")
         
+        # Parametrelerin birlikte anormal olduğu baskılar
+        if 'MAHALANOBIS' in self.anomaliler:
+            print(f"   🔴 {len(self.anomaliler['MAHALANOBIS'])} baskıda parametreler birlikte anormal!")
+            print(f"      → Tek tek sınırlar içinde olsa da bu baskıları kalite kontrolüne alın")
+        
         print(f"\n✅ Analiz tamamlandı!")
     
     def tam_analiz_yap(self):
@@ -334,13 +481,16 @@ class AnomaliBulucu:
         # 4. Basınç Yükselme
         self.basinc_yükselme_analizi()
         
-        # 5. Kalıp Bazlı Analiz
+        # 5. Çok Değişkenli (Mahalanobis)
+        self.cok_degiskenli_analiz()
+        
+        # 6. Kalıp Bazlı Analiz
         self.kalip_bazli_analiz()
         
-        # 6. Zaman Serisi
+        # 7. Zaman Serisi
         self.zaman_serisi_analizi()
         
-        # 7. Genel Rapor
+        # 8. Genel Rapor
         self.anomali_raporu_olustur()
         
         return self.anomaliler
@@ -348,9 +498,15 @@ class AnomaliBulucu:
 
 # Test için
 if __name__ == "__main__":
-    # Temizlenmiş veriyi yükle
-    df = pd.read_csv('data/processed/enjeksiyon_temiz.csv')
-    df['TARİH'] = pd.to_datetime(df['TARİH'])
+    from depo import PresDeposu
+    
+    # Temizlenmiş veriyi yükle (veritabanı varsa sadece gerekli sütunlar)
+    depo = PresDeposu()
+    if depo.mevcut_mu():
+        df = depo.baskilari_getir(sutunlar=AnomaliBulucu.GEREKLI_SUTUNLAR)
+    else:
+        df = pd.read_csv('data/processed/enjeksiyon_temiz.csv')
+        df['TARİH'] = pd.to_datetime(df['TARİH'])
     
     print(f"✅ Temizlenmiş veri yüklendi: {len(df)} satır")
     
@@ -361,10 +517,12 @@ if __name__ == "__main__":
     # Anomalileri kaydet
     if anomaliler:
         # Her parametre için ayrı dosya
-        for param, anomali_df in anomaliler.items():
+        for param, anomali_sonucu in anomaliler.items():
             dosya_adi = param.replace(' ', '_').replace('.', '').lower()
-            anomali_df.to_csv(f'data/processed/anomali_{dosya_adi}.csv', index=False)
+            anomali_sonucu.csv_kaydet(f'data/processed/anomali_{dosya_adi}.csv')
             print(f"💾 {param} anomalileri kaydedildi!")
+        
+        depo.anomalileri_kaydet(anomaliler, kapsam=df)
     
     print(f"\n✅ Anomali tespiti tamamlandı!")
     
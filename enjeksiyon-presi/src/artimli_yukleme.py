@@ -0,0 +1,293 @@
+"""
+Artımlı Veri Yükleme Modülü
+Bu modül pres verilerini filigran (watermark) kullanarak artımlı yükler.
+Sadece son çalıştırmadan sonra eklenen baskılar okunur, temizlenir ve
+data/processed altındaki temiz veriye eklenir.
+"""
+
+import pandas as pd
+import os
+import json
+from datetime import datetime
+
+try:
+    from .veri_yukleme import VeriYukleyici
+    from .veri_temizleme import VeriTemizleyici
+    from .veri_semasi import semayi_uygula
+except ImportError:
+    from veri_yukleme import VeriYukleyici
+    from veri_temizleme import VeriTemizleyici
+    from veri_semasi import semayi_uygula
+
+class ArtimliYukleyici:
+    """
+    Enjeksiyon presi verilerini son işlenen baskıdan itibaren yükleyen sınıf
+    """
+    
+    def __init__(self, data_path='data/raw/', processed_path='data/processed/',
+                 dosya_adi='520TonEnjPres.xlsx'):
+        """
+        Args:
+            data_path (str): Ham Excel dosyalarının bulunduğu klasör
+            processed_path (str): Temiz verinin ve filigranın tutulduğu klasör
+            dosya_adi (str): Pres Excel dosyasının adı
+        """
+        self.data_path = data_path
+        self.processed_path = processed_path
+        self.dosya_adi = dosya_adi
+        self.hedef_csv = os.path.join(processed_path, 'enjeksiyon_temiz.csv')
+        self.filigran_yolu = os.path.join(processed_path, 'enjeksiyon_filigran.json')
+        
+        # Son okumada eski baskı üstteki dosyanın nerede bırakıldığı
+        self.ham_konum = None
+    
+    def filigran_oku(self):
+        """
+        Kayıtlı filigranı okur
+        
+        Returns:
+            dict: Son BASKI NO, son TARİH, işlenen satır sayısı ve (eski baskı
+                üstteki dosyalarda) okunan son ham satırın konumu (yoksa None)
+        """
+        if not os.path.exists(self.filigran_yolu) or not os.path.exists(self.hedef_csv):
+            return None
+        
+        with open(self.filigran_yolu, 'r', encoding='utf-8') as f:
+            filigran = json.load(f)
+        
+        filigran['son_tarih'] = pd.Timestamp(filigran['son_tarih'])
+        return filigran
+    
+    def filigran_yaz(self, df, onceki=None, ham_konum=None):
+        """
+        Yeni filigranı temiz verinin yanına kaydeder
+        
+        Args:
+            df (pd.DataFrame): Bu çalıştırmada işlenen temiz satırlar
+            onceki (dict): Önceki filigran
+            ham_konum (dict): Okunan son ham satırın konumu (baslik_satiri,
+                sira, baski_no); sonraki okuma bu satırdan başlar
+        """
+        son_baski_no = int(df['BASKI NO'].max())
+        son_tarih = df['TARİH'].max()
+        islenen_satir = len(df)
+        
+        if onceki is not None:
+            son_baski_no = max(son_baski_no, onceki['son_baski_no'])
+            son_tarih = max(son_tarih, onceki['son_tarih'])
+            islenen_satir += onceki['islenen_satir']
+        
+        filigran = {
+            'son_baski_no': son_baski_no,
+            'son_tarih': pd.Timestamp(son_tarih).isoformat(),
+            'islenen_satir': islenen_satir,
+            'ham_konum': ham_konum,
+            'guncelleme_zamani': datetime.now().isoformat(timespec='seconds')
+        }
+        
+        os.makedirs(self.processed_path, exist_ok=True)
+        gecici_yol = self.filigran_yolu + '.tmp'
+        with open(gecici_yol, 'w', encoding='utf-8') as f:
+            json.dump(filigran, f, indent=2, ensure_ascii=False)
+        os.replace(gecici_yol, self.filigran_yolu)
+    
+    @staticmethod
+    def _baski_no(deger):
+        """Hücre değerini BASKI NO tamsayısına çevirir (geçersizse None)"""
+        baski_no = pd.to_numeric(deger, errors='coerce')
+        return None if pd.isna(baski_no) else int(baski_no)
+    
+    @staticmethod
+    def _yeni_mi(baski_no, tarih, filigran):
+        """Satırın filigrandan sonra eklenip eklenmediğini kontrol eder"""
+        if baski_no is not None and baski_no > filigran['son_baski_no']:
+            return True
+        # Sayaç sıfırlanmış olabilir; daha yeni tarih de yeni satırdır
+        return tarih is not None and pd.Timestamp(tarih) > filigran['son_tarih']
+    
+    def yeni_satirlari_oku(self, filigran):
+        """
+        Excel dosyasından sadece filigrandan sonraki satırları okur
+        
+        Dosya openpyxl salt-okunur modunda açılır. Dışa aktarım en yeni baskı
+        üstte olacak şekilde sıralıysa ilk eski satırda okuma durdurulur.
+        Eski baskı üstte ise okuma filigrandaki ham satır konumundan başlar;
+        o satırın BASKI NO'su filigrandakiyle uyuşmazsa (dosya değişmiş)
+        dosya baştan taranır. Okunan son satırın konumu ham_konum'a yazılır.
+        
+        Args:
+            filigran (dict): Son işlenen baskı bilgisi
+        
+        Returns:
+            pd.DataFrame: Yeni ham satırlar (başlıkları düzeltilmiş)
+        """
+        from openpyxl import load_workbook
+        
+        dosya_yolu = os.path.join(self.data_path, self.dosya_adi)
+        print(f"📂 Yeni satırlar okunuyor: {dosya_yolu}")
+        
+        self.ham_konum = None
+        kitap = load_workbook(dosya_yolu, read_only=True, data_only=True)
+        try:
+            sayfa = kitap.active
+            satirlar = sayfa.iter_rows(values_only=True)
+            
+            # Teknik başlık satırını bul (TARİH sütununu içeren satır)
+            basliklar = None
+            for baslik_satiri, satir in enumerate(satirlar, start=1):
+                temiz = [str(h).strip() if h is not None else '' for h in satir]
+                if 'TARİH' in temiz:
+                    basliklar = temiz
+                    break
+            
+            if basliklar is None:
+                print("❌ HATA: Başlık satırı bulunamadı!")
+                return None
+            
+            i_tarih = basliklar.index('TARİH')
+            i_baski = basliklar.index('BASKI NO')
+            
+            yeni = []
+            atlanan = 0
+            azalan = None
+            onceki_baski = None
+            sira = 0
+            son_konum = None
+            
+            # Eski baskı üstte: önceki çalıştırmalarda okunan kısım atlanır
+            konum = filigran.get('ham_konum')
+            if konum is not None and konum['baslik_satiri'] == baslik_satiri:
+                devam = sayfa.iter_rows(min_row=baslik_satiri + konum['sira'], values_only=True)
+                ilk = next(devam, None)
+                if ilk is not None and self._baski_no(ilk[i_baski]) == konum['baski_no']:
+                    satirlar = devam
+                    sira = atlanan = konum['sira']
+                    azalan = False
+                    onceki_baski = konum['baski_no']
+                    son_konum = konum
+                else:
+                    print("⚠️  Filigrandaki satır konumu dosyayla uyuşmuyor, dosya baştan taranacak")
+            
+            for satir in satirlar:
+                sira += 1
+                tarih = satir[i_tarih]
+                if tarih is None or tarih == 'tarih':
+                    continue
+                
+                baski_no = self._baski_no(satir[i_baski])
+                if baski_no is not None:
+                    son_konum = {'baslik_satiri': baslik_satiri, 'sira': sira, 'baski_no': baski_no}
+                
+                # Sıralama yönünü ilk iki geçerli satırdan belirle
+                if azalan is None and onceki_baski is not None and baski_no is not None:
+                    azalan = baski_no < onceki_baski
+                if baski_no is not None:
+                    onceki_baski = baski_no
+                
+                if self._yeni_mi(baski_no, tarih, filigran):
+                    yeni.append(satir)
+                else:
+                    atlanan += 1
+                    # En yeni üstte: ilk eski satırdan sonrası hep eskidir
+                    if azalan is not False and yeni:
+                        break
+                    if azalan and not yeni:
+                        break
+        finally:
+            kitap.close()
+        
+        # Konum sadece sona eklenen (eski baskı üstte) dosyalarda anlamlıdır
+        if azalan is False:
+            self.ham_konum = son_konum
+        
+        print(f"✅ {len(yeni)} yeni satır bulundu ({atlanan} eski satır atlandı)")
+        
+        df = pd.DataFrame(yeni, columns=basliklar)
+        df = df.loc[:, [b for b in basliklar if b]]
+        
+        # enjeksiyon_presi_yukle ile aynı dönüşüm: ilk 3 sütun kategorik
+        for col in df.columns[3:]:
+            df[col] = pd.to_numeric(df[col], errors='coerce')
+        
+        return df
+    
+    def tam_yukle(self, yenile=False):
+        """
+        Filigran yokken tüm geçmişi yükler, temizler ve kaydeder
+        
+        Returns:
+            pd.DataFrame: Temizlenmiş tüm veri
+        """
+        yukleyici = VeriYukleyici(data_path=self.data_path)
+        df = yukleyici.enjeksiyon_presi_yukle(yenile=yenile)
+        
+        if df is None:
+            return None
+        
+        df_temiz = VeriTemizleyici(df).temizle()
+        
+        os.makedirs(self.processed_path, exist_ok=True)
+        df_temiz.to_csv(self.hedef_csv, index=False)
+        self.filigran_yaz(df_temiz)
+        
+        print(f"\n💾 Tüm geçmiş '{self.hedef_csv}' olarak kaydedildi ({len(df_temiz)} satır)")
+        
+        return df_temiz
+    
+    def artimli_yukle(self):
+        """
+        Sadece yeni baskıları okur, temizler ve temiz veriye ekler
+        
+        Returns:
+            pd.DataFrame: Bu çalıştırmada eklenen temiz satırlar
+        """
+        print("\n" + "="*50)
+        print("ARTIMLI VERİ YÜKLEME")
+        print("="*50 + "\n")
+        
+        filigran = self.filigran_oku()
+        
+        if filigran is None:
+            print("ℹ️  Filigran bulunamadı, tüm geçmiş yüklenecek")
+            return self.tam_yukle()
+        
+        print(f"🔖 Filigran: BASKI NO {filigran['son_baski_no']}, TARİH {filigran['son_tarih']}")
+        
+        df_yeni = self.yeni_satirlari_oku(filigran)
+        
+        if df_yeni is None or len(df_yeni) == 0:
+            print("\n✅ Yeni baskı yok, temiz veri güncel!")
+            return df_yeni
+        
+        df_temiz = VeriTemizleyici(df_yeni).temizle()
+        
+        # Mevcut dosyanın sütun sırasına göre sona ekle
+        mevcut_sutunlar = pd.read_csv(self.hedef_csv, nrows=0).columns.tolist()
+        df_temiz.reindex(columns=mevcut_sutunlar).to_csv(
+            self.hedef_csv, mode='a', header=False, index=False
+        )
+        self.filigran_yaz(df_temiz, onceki=filigran, ham_konum=self.ham_konum)
+        
+        print(f"\n💾 {len(df_temiz)} yeni satır '{self.hedef_csv}' dosyasına eklendi")
+        
+        return df_temiz
+    
+    def temiz_veriyi_oku(self):
+        """
+        Birikmiş temiz veriyi okur
+        
+        Returns:
+            pd.DataFrame: Tüm temiz veri
+        """
+        df = pd.read_csv(self.hedef_csv)
+        df['TARİH'] = pd.to_datetime(df['TARİH'])
+        return semayi_uygula(df)
+
+
+# Test için
+if __name__ == "__main__":
+    yukleyici = ArtimliYukleyici()
+    df_yeni = yukleyici.artimli_yukle()
+    
+    if df_yeni is not None:
+        print(f"\n✅ Artımlı yükleme tamamlandı: {len(df_yeni)} satır işlendi")
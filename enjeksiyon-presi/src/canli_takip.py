@@ -0,0 +1,365 @@
+"""
+Canlı Takip Modülü
+Bu modül PLC'nin sürekli büyüttüğü CSV dışa aktarımını `tail -f` gibi izler.
+Dosyaya eklenen satırlar bayt konumu takip edilerek artımlı okunur, dosya
+döndürülür (rotation) veya kesilirse (truncation) baştan okunur. Yeni baskılar
+veri_tiplerini_duzelt ile aynı kurallarla tiplendirilir ve geçmiş veriden
+hesaplanan anomali sınırlarıyla saniyeler içinde kontrol edilir. Sınırlar
+kantil özetlerinden alınırsa her yeni parti özetlere eklenir ve sınırlar
+tüm geçmişi tutmadan güncel kalır. Çevrimiçi bulucu verilirse her baskı
+parti sınırları yerine kendinden önceki baskılarla güncellenen EWMA
+temellerine göre puanlanır.
+"""
+
+import pandas as pd
+import numpy as np
+import os
+import io
+import time
+from contextlib import redirect_stdout
+from datetime import datetime
+
+try:
+    from .veri_temizleme import VeriTemizleyici
+    from .anomali_tespiti import AnomaliBulucu
+    from .kantil_ozeti import KantilOzetleri, OZET_DOSYASI
+except ImportError:
+    from veri_temizleme import VeriTemizleyici
+    from anomali_tespiti import AnomaliBulucu
+    from kantil_ozeti import KantilOzetleri, OZET_DOSYASI
+
+class DosyaTakipci:
+    """
+    Büyüyen bir CSV dosyasının yeni eklenen satırlarını okuyan sınıf
+    """
+    
+    def __init__(self, dosya_yolu, bastan=False, kodlama='utf-8'):
+        """
+        Args:
+            dosya_yolu (str): İzlenecek CSV dosyası (ilk satır başlık)
+            bastan (bool): True ise mevcut satırlar da okunur, False ise
+                sadece takip başladıktan sonra eklenenler okunur
+            kodlama (str): Dosya kodlaması
+        """
+        self.dosya_yolu = dosya_yolu
+        self.bastan = bastan
+        self.kodlama = kodlama
+        
+        self.konum = 0
+        self.inode = None
+        self.basliklar = None
+        self._yarim_satir = b''
+    
+    def _sifirla(self):
+        """Dosya değiştiğinde okuma durumunu başa alır"""
+        self.konum = 0
+        self.basliklar = None
+        self._yarim_satir = b''
+    
+    def _baslik_oku(self, f):
+        """
+        Başlık satırını okur ve konumu veri satırlarının başına taşır
+        
+        Returns:
+            bool: Başlık tam olarak okunduysa True
+        """
+        satir = f.readline()
+        if not satir.endswith(b'\n'):
+            # Başlık henüz yazılmamış
+            return False
+        
+        self.basliklar = [s.strip() for s in satir.decode(self.kodlama).lstrip('\ufeff').split(',')]
+        self.konum = f.tell()
+        return True
+    
+    def yeni_satirlari_oku(self):
+        """
+        Son okumadan bu yana eklenen tam satırları okur
+        
+        Returns:
+            pd.DataFrame: Yeni satırlar (ham metin, yeni satır yoksa None)
+        """
+        try:
+            durum = os.stat(self.dosya_yolu)
+        except FileNotFoundError:
+            return None
+        
+        # Döndürme: aynı ada yeni bir dosya geldi; kesme: dosya küçüldü
+        if self.inode is not None and (durum.st_ino != self.inode or durum.st_size < self.konum):
+            print(f"🔄 {self.dosya_yolu} döndürüldü/kesildi, baştan okunuyor...")
+            self._sifirla()
+        
+        ilk_acilis = self.inode is None
+        self.inode = durum.st_ino
+        
+        with open(self.dosya_yolu, 'rb') as f:
+            if self.basliklar is None:
+                if not self._baslik_oku(f):
+                    return None
+                
+                # İlk açılışta mevcut satırlar atlanır: son tam satırın sonuna gidilir
+                if ilk_acilis and not self.bastan:
+                    son = f.seek(0, os.SEEK_END)
+                    f.seek(max(self.konum, son - 65536))
+                    kuyruk = f.read()
+                    if b'\n' in kuyruk:
+                        self.konum = son - len(kuyruk) + kuyruk.rfind(b'\n') + 1
+                    return None
+            
+            f.seek(self.konum)
+            veri = f.read()
+            self.konum = f.tell()
+        
+        if not veri:
+            return None
+        
+        # Yarım kalan son satır bir sonraki okumaya bırakılır
+        veri = self._yarim_satir + veri
+        son_satir_sonu = veri.rfind(b'\n')
+        if son_satir_sonu < 0:
+            self._yarim_satir = veri
+            return None
+        
+        self._yarim_satir = veri[son_satir_sonu + 1:]
+        tam_satirlar = veri[:son_satir_sonu + 1]
+        
+        df = pd.read_csv(
+            io.BytesIO(tam_satirlar), header=None, names=self.basliklar,
+            dtype=str, encoding=self.kodlama, skip_blank_lines=True
+        )
+        
+        return df if len(df) > 0 else None
+
+def baskilari_tiplendir(df):
+    """
+    Ham metin satırlarını veri_tiplerini_duzelt ile aynı kurallarla tiplendirir
+    
+    Args:
+        df (pd.DataFrame): Ham metin satırları
+    
+    Returns:
+        pd.DataFrame: Tiplendirilmiş baskılar
+    """
+    # Canlı akışta her partinin temizlik çıktısı ekranı doldurmasın
+    with redirect_stdout(io.StringIO()):
+        temizleyici = VeriTemizleyici(df)
+        temizleyici.veri_tiplerini_duzelt()
+    
+    return temizleyici.df
+
+class CanliTakip:
+    """
+    Yeni baskıları geçmiş veriden hesaplanan sınırlarla anlık kontrol eden sınıf
+    """
+    
+    def __init__(self, takipci, sinirlar, depo=None, aralik=1.0, ozetler=None, bulucu=None,
+                 temeller=None):
+        """
+        Args:
+            takipci (DosyaTakipci): İzlenen CSV dosyası (partiler dışarıdan
+                veriliyorsa None, ör. veri sunucusu)
+            sinirlar (dict): Parametre -> (alt sınır, üst sınır)
+            depo (PresDeposu): Verilirse yeni baskılar veritabanına eklenir
+            aralik (float): Dosyanın kontrol edilme sıklığı (sn)
+            ozetler (KantilOzetleri): Verilirse her parti özetlere eklenir ve
+                sınırlar özetlerden yeniden hesaplanır
+            bulucu (CevrimiciAnomaliBulucu): Verilirse baskılar tek tek bu
+                bulucunun kayan temellerine göre puanlanır
+            temeller (KalipTemelleri): Verilirse her baskı kendi kalıbının
+                kayıtlı sınırlarıyla kontrol edilir
+        """
+        self.takipci = takipci
+        self.sinirlar = sinirlar
+        self.depo = depo
+        self.aralik = aralik
+        self.ozetler = ozetler
+        self.bulucu = bulucu
+        self.temeller = temeller
+        
+        self.toplam_baski = 0
+        self.toplam_alarm = 0
+    
+    @staticmethod
+    def referans_sinirlari(kume):
+        """
+        Geçmiş temiz veriden anomali sınırlarını hesaplar
+        
+        Args:
+            kume (TembelVeriKumesi): Temizlenmiş geçmiş veri
+        
+        Returns:
+            dict: Parametre -> (alt sınır, üst sınır)
+        """
+        sutunlar = [c for c in AnomaliBulucu.IQR_ESIKLERI if c in kume.sutunlar]
+        return AnomaliBulucu(kume.sec(sutunlar)).sinirlari_hesapla()
+    
+    @staticmethod
+    def referans_ozetleri(kume, yol=OZET_DOSYASI):
+        """
+        Kayıtlı kantil özetlerini okur; yoksa geçmiş temiz veriden oluşturur
+        
+        Args:
+            kume (TembelVeriKumesi): Temizlenmiş geçmiş veri
+            yol (str): Özet dosyası
+        
+        Returns:
+            KantilOzetleri: Makine ve parametre bazında özetler
+        """
+        ozetler = KantilOzetleri.yukle(yol)
+        if ozetler is not None:
+            return ozetler
+        
+        sutunlar = [c for c in AnomaliBulucu.IQR_ESIKLERI if c in kume.sutunlar]
+        if 'MAKİNE KODU' in kume.sutunlar:
+            sutunlar.append('MAKİNE KODU')
+        return KantilOzetleri.veriden(kume.sec(sutunlar), list(AnomaliBulucu.IQR_ESIKLERI))
+    
+    def baskilari_kontrol_et(self, df):
+        """
+        Baskıları sınırlarla ve kritik eşiklerle karşılaştırır
+        
+        Args:
+            df (pd.DataFrame): Tiplendirilmiş yeni baskılar
+        
+        Returns:
+            pd.DataFrame: Alarm kayıtları (TARİH, KALIP NO, BASKI NO, parametre, DEGER, seviye)
+        """
+        alarmlar = []
+        kimlik = [c for c in ('TARİH', 'KALIP NO', 'BASKI NO') if c in df.columns]
+        
+        for col, (alt, ust) in self.sinirlar.items():
+            if col not in df.columns:
+                continue
+            
+            # Kalıp bazlı modda sınırlar satır başına kalıp temelinden gelir
+            if self.temeller is not None and col in self.temeller.q1.columns:
+                alt, ust = self.temeller.sinir_dizileri(df, col, AnomaliBulucu.IQR_ESIKLERI[col])
+            
+            kritik = AnomaliBulucu.KRITIK_ESIKLER.get(col)
+            maske = (df[col] < alt) | (df[col] > ust)
+            if kritik is not None:
+                maske |= df[col] > kritik
+            maske = np.asarray(maske, dtype=bool)
+            
+            if not maske.any():
+                continue
+            
+            alarm = df.loc[maske, kimlik].copy()
+            alarm['parametre'] = col
+            alarm['DEGER'] = df.loc[maske, col].astype('float64')
+            if self.temeller is not None and col in self.temeller.q1.columns:
+                alarm['alt'] = alt[maske]
+                alarm['ust'] = ust[maske]
+            alarm['seviye'] = 'UYARI'
+            if kritik is not None:
+                alarm.loc[alarm['DEGER'] > kritik, 'seviye'] = 'KRİTİK'
+            alarmlar.append(alarm)
+        
+        if not alarmlar:
+            return pd.DataFrame()
+        
+        return pd.concat(alarmlar, ignore_index=True)
+    
+    def alarmlari_yazdir(self, alarmlar):
+        """Alarm kayıtlarını ekrana yazdırır"""
+        for _, alarm in alarmlar.iterrows():
+            simge = '🔴' if alarm['seviye'] == 'KRİTİK' else '⚠️ '
+            # Çevrimiçi alarmlar baskı anındaki sınırları taşır
+            alt, ust = (alarm['alt'], alarm['ust']) if 'alt' in alarm else self.sinirlar[alarm['parametre']]
+            print(f"{simge} {alarm.get('TARİH')} | KALIP {alarm.get('KALIP NO')} | "
+                  f"BASKI {alarm.get('BASKI NO')} | {alarm['parametre']} = {alarm['DEGER']:.1f} "
+                  f"(sınır: {alt:.1f} - {ust:.1f})")
+    
+    def partiyi_isle(self, ham):
+        """
+        Ham baskı partisini tiplendirir, kontrol eder ve (varsa) veritabanına ekler
+        
+        Args:
+            ham (pd.DataFrame): Ham baskı satırları (metin veya sayı)
+        
+        Returns:
+            pd.DataFrame: Bu partide üretilen alarmlar
+        """
+        df = baskilari_tiplendir(ham)
+        self.toplam_baski += len(df)
+        
+        if self.bulucu is not None:
+            alarmlar = self.bulucu.partiyi_puanla(df)
+            self.sinirlar.update(self.bulucu.sinirlar())
+        else:
+            alarmlar = self.baskilari_kontrol_et(df)
+        self.toplam_alarm += len(alarmlar)
+        
+        # Yeni baskılar özetlere eklenir; sonraki partiler güncel sınırlarla kontrol edilir
+        if self.ozetler is not None:
+            self.ozetler.guncelle(df, list(AnomaliBulucu.IQR_ESIKLERI))
+            self.sinirlar.update(self.ozetler.sinirlar(AnomaliBulucu.IQR_ESIKLERI))
+        
+        print(f"📥 {datetime.now().strftime('%H:%M:%S')} - {len(df)} yeni baskı, "
+              f"{len(alarmlar)} alarm")
+        if len(alarmlar) > 0:
+            self.alarmlari_yazdir(alarmlar)
+        
+        if self.depo is not None:
+            with redirect_stdout(io.StringIO()):
+                self.depo.baskilari_kaydet(df, ekle=True)
+        
+        return alarmlar
+    
+    def bir_kez_kontrol_et(self):
+        """
+        Dosyadaki yeni satırları bir kez okur ve partiyi_isle'ye verir
+        
+        Returns:
+            pd.DataFrame: Bu turda üretilen alarmlar (yeni satır yoksa None)
+        """
+        ham = self.takipci.yeni_satirlari_oku()
+        if ham is None:
+            return None
+        
+        return self.partiyi_isle(ham)
+    
+    def calistir(self, sure=None):
+        """
+        Dosyayı durdurulana kadar (Ctrl+C) veya verilen süre boyunca izler
+        
+        Args:
+            sure (float): Takip süresi (sn, None ise süresiz)
+        """
+        print("\n" + "="*60)
+        print("CANLI TAKİP BAŞLADI")
+        print("="*60)
+        print(f"\n👀 İzlenen dosya: {self.takipci.dosya_yolu} (her {self.aralik:g} sn)")
+        print("   Durdurmak için Ctrl+C\n")
+        
+        baslangic = time.monotonic()
+        
+        try:
+            while sure is None or time.monotonic() - baslangic < sure:
+                self.bir_kez_kontrol_et()
+                time.sleep(self.aralik)
+        except KeyboardInterrupt:
+            print("\n⏹️  Takip durduruldu")
+        
+        print(f"\n📊 Toplam: {self.toplam_baski} baskı, {self.toplam_alarm} alarm")
+
+
+# Test için
+if __name__ == "__main__":
+    import sys
+    from veri_kumesi import TembelVeriKumesi
+    
+    if len(sys.argv) < 2:
+        print("Kullanım: python canli_takip.py <plc_export.csv>")
+        sys.exit(1)
+    
+    referans = 'data/processed/enjeksiyon_temiz.parquet'
+    if not os.path.exists(referans):
+        print(f"❌ HATA: {referans} bulunamadı! Önce main.py çalıştırılmalı.")
+        sys.exit(1)
+    
+    ozetler = CanliTakip.referans_ozetleri(TembelVeriKumesi(referans))
+    takip = CanliTakip(DosyaTakipci(sys.argv[1]), ozetler.sinirlar(AnomaliBulucu.IQR_ESIKLERI),
+                       ozetler=ozetler)
+    takip.calistir()
+    ozetler.kaydet()
@@ -0,0 +1,345 @@
+"""
+Çevrimiçi Anomali Tespiti Modülü
+Bu modül her yeni baskıyı geldiği anda, tüm geçmişi yeniden işlemeden
+puanlar. Her pres parametresi için sabit boyutlu bir temel (baseline) tutulur:
+üstel ağırlıklı (EWMA) ortalama ve varyans ile üstel ağırlıklı çeyrek
+tahminleri (Q1, Q3). Baskı başına güncelleme ve puanlama O(1) zaman ve
+bellekle yapılır; temel yavaş kaymalara kendiliğinden uyum sağlar.
+
+Kararlar AnomaliBulucu.istatistiksel_anomali_bul ile aynı kurallara
+dayanır: 'iqr' yönteminde Q1 - k*IQR / Q3 + k*IQR dışı, 'zscore' yönteminde
+|z| > eşik UYARI'dır; KRITIK_ESIKLER'in üzerindeki değerler canlı takipte
+olduğu gibi KRİTİK'tir.
+"""
+
+import math
+import numpy as np
+import pandas as pd
+
+try:
+    from .anomali_tespiti import AnomaliBulucu
+    from .istatistik_motoru import motor
+except ImportError:
+    from anomali_tespiti import AnomaliBulucu
+    from istatistik_motoru import motor
+
+# Karar seviyeleri (canlı takip alarmlarıyla aynı)
+NORMAL = 'NORMAL'
+UYARI = 'UYARI'
+KRITIK = 'KRİTİK'
+
+# Normal dağılımda IQR / standart sapma oranı
+IQR_STD_ORANI = 1.349
+
+class ParametreTemeli:
+    """
+    Tek bir parametrenin üstel ağırlıklı temeli
+    
+    Çeyrekler stokastik yaklaşımla izlenir: her gözlemde Q, gözlem Q'nun
+    altındaysa (1 - p), üstündeyse p oranında ve IQR ile ölçeklenmiş bir
+    adımla kaydırılır; beklenen kayma yalnızca gerçek çeyrekte sıfırdır.
+    Temel oluşmadan önceki ilk gözlemler küçük bir tamponda tutulur ve
+    çeyrekler onlardan kesin olarak başlatılır.
+    
+    Kayan çeyrekler son ~1/alfa baskının yerel yayılımını izler. Pres verisi
+    rejimler arasında geçiş yaptığında (ör. 3. FAZ BASINC YÜKSELME ZAMANI
+    ~164 ve ~948 ms tepeleri) yerel IQR toplu IQR'ın çok altına iner ve her
+    rejim değişimi alarm olur. Bu yüzden karar sınırlarındaki IQR ve
+    standart sapma, başlatmadaki değerlerin (taban) altına inmez.
+    """
+    
+    __slots__ = ('alfa', 'isinma', 'n', 'ortalama', 'varyans', 'q1', 'q3',
+                 'taban_iqr', 'taban_std', '_tampon')
+    
+    # Çeyrek adımının IQR katsayısı (zaman sabiti yaklaşık 1/alfa baskı olur)
+    ADIM_KATSAYISI = 2.5
+    
+    def __init__(self, alfa=0.01, isinma=50):
+        """
+        Args:
+            alfa (float): Üstel ağırlık (0-1); büyüdükçe temel daha hızlı uyum sağlar
+            isinma (int): Temel başlatılmadan önce toplanacak gözlem sayısı
+        """
+        self.alfa = alfa
+        self.isinma = isinma
+        self.n = 0
+        self.ortalama = self.varyans = self.q1 = self.q3 = math.nan
+        self.taban_iqr = self.taban_std = 0.0
+        self._tampon = []
+    
+    @property
+    def hazir(self):
+        """Temel karar vermeye hazır mı"""
+        return self._tampon is None
+    
+    def baslat(self, q1, q3, ortalama, std):
+        """
+        Temeli referans istatistiklerle başlatır (ısınma atlanır)
+        
+        Referansın IQR'ı ve standart sapması karar sınırlarının tabanı olur.
+        
+        Args:
+            q1 (float): Birinci çeyrek
+            q3 (float): Üçüncü çeyrek
+            ortalama (float): Ortalama
+            std (float): Standart sapma
+        """
+        self.q1, self.q3 = float(q1), float(q3)
+        self.ortalama, self.varyans = float(ortalama), float(std) ** 2
+        self.taban_iqr, self.taban_std = self.q3 - self.q1, float(std)
+        self._tampon = None
+        return self
+    
+    @property
+    def std(self):
+        """Karar için standart sapma (taban altına inmez)"""
+        return max(math.sqrt(self.varyans), self.taban_std)
+    
+    def sinirlar(self, yontem, esik):
+        """
+        Güncel alt/üst karar sınırları
+        
+        Returns:
+            tuple: (alt sınır, üst sınır)
+        """
+        if yontem == 'iqr':
+            iqr = max(self.q3 - self.q1, self.taban_iqr)
+            return self.q1 - esik * iqr, self.q3 + esik * iqr
+        
+        return self.ortalama - esik * self.std, self.ortalama + esik * self.std
+    
+    def guncelle(self, x, alt, ust):
+        """
+        Gözlemi temele ekler
+        
+        Ortalama/varyans güncellemesinde gözlem karar sınırlarına kırpılır;
+        tek bir aşırı değer temeli sürüklemez.
+        """
+        self.n += 1
+        
+        if self._tampon is not None:
+            self._tampon.append(x)
+            if len(self._tampon) >= self.isinma:
+                tampon = np.asarray(self._tampon, dtype='float64')
+                q1, q3 = np.quantile(tampon, [0.25, 0.75])
+                self.baslat(q1, q3, tampon.mean(), tampon.std())
+            return
+        
+        kirpik = ust if x > ust else alt if x < alt else x
+        fark = kirpik - self.ortalama
+        self.ortalama += self.alfa * fark
+        self.varyans = (1 - self.alfa) * (self.varyans + self.alfa * fark * fark)
+        
+        iqr = self.q3 - self.q1
+        olcek = iqr if iqr > 0 else math.sqrt(self.varyans) * IQR_STD_ORANI or 1.0
+        adim = self.ADIM_KATSAYISI * self.alfa * olcek
+        self.q1 += adim * (0.25 - (x < self.q1))
+        self.q3 += adim * (0.75 - (x < self.q3))
+        if self.q3 < self.q1:
+            self.q1 = self.q3 = (self.q1 + self.q3) / 2
+
+class CevrimiciAnomaliBulucu:
+    """
+    Baskıları tek tek, kayan temellere göre puanlayan çevrimiçi anomali bulucu
+    
+    Her baskı önce güncel temele göre puanlanır, sonra temele eklenir.
+    Puan, parametrenin EWMA z-skorudur; karar yönteme göre IQR veya z-skor
+    sınırlarından ve kritik eşiklerden verilir.
+    """
+    
+    def __init__(self, esikler=None, kritik_esikler=None, yontem='iqr', alfa=0.01, isinma=50):
+        """
+        Args:
+            esikler (dict): Parametre -> eşik (iqr için IQR katsayısı, zscore
+                için z sınırı; None ise AnomaliBulucu.IQR_ESIKLERI)
+            kritik_esikler (dict): Parametre -> kritik üst değer (None ise
+                AnomaliBulucu.KRITIK_ESIKLER)
+            yontem (str): 'iqr' veya 'zscore'
+            alfa (float): Temellerin üstel ağırlığı
+            isinma (int): Referanssız başlatmada karar öncesi gözlem sayısı
+        """
+        if yontem not in ('iqr', 'zscore'):
+            raise ValueError(f"Bilinmeyen yöntem: {yontem}")
+        
+        self.esikler = dict(AnomaliBulucu.IQR_ESIKLERI if esikler is None else esikler)
+        self.kritik_esikler = dict(AnomaliBulucu.KRITIK_ESIKLER if kritik_esikler is None else kritik_esikler)
+        self.yontem = yontem
+        self.temeller = {col: ParametreTemeli(alfa, isinma) for col in self.esikler}
+        
+        self.baski_sayisi = 0
+        self.alarm_sayisi = 0
+    
+    @classmethod
+    def veriden(cls, df, **kwargs):
+        """
+        Temelleri geçmiş temiz verinin kesin istatistikleriyle başlatır
+        
+        Args:
+            df (pd.DataFrame): Referans (temizlenmiş) baskılar
+            **kwargs: CevrimiciAnomaliBulucu parametreleri
+        
+        Returns:
+            CevrimiciAnomaliBulucu: Isınması tamamlanmış bulucu
+        """
+        bulucu = cls(**kwargs)
+        for col, temel in bulucu.temeller.items():
+            if col in df.columns:
+                ist = motor.sutun(df, col)
+                temel.baslat(ist['q1'], ist['q3'], ist['ortalama'], ist['std'])
+        return bulucu
+    
+    @classmethod
+    def ozetlerden(cls, ozetler, grup=None, **kwargs):
+        """
+        Temelleri kantil özetlerinden başlatır (ortalama yerine medyan,
+        standart sapma yerine IQR / 1.349 kullanılır)
+        
+        Args:
+            ozetler (KantilOzetleri): Makine ve parametre bazında özetler
+            grup (str): Makine kodu (None ise tüm makineler)
+            **kwargs: CevrimiciAnomaliBulucu parametreleri
+        
+        Returns:
+            CevrimiciAnomaliBulucu: Isınması tamamlanmış bulucu
+        """
+        bulucu = cls(**kwargs)
+        for col, temel in bulucu.temeller.items():
+            ozet = ozetler.ozet(col, grup)
+            if ozet is not None and ozet.n > 0:
+                q1, medyan, q3 = ozet.kantiller([0.25, 0.5, 0.75])
+                temel.baslat(q1, q3, medyan, (q3 - q1) / IQR_STD_ORANI)
+        return bulucu
+    
+    def sinirlar(self):
+        """
+        Hazır temellerin güncel karar sınırları
+        
+        Returns:
+            dict: Parametre -> (alt sınır, üst sınır)
+        """
+        return {col: tuple(float(s) for s in temel.sinirlar(self.yontem, self.esikler[col]))
+                for col, temel in self.temeller.items() if temel.hazir}
+    
+    def puanla(self, col, deger):
+        """
+        Tek bir parametre değerini puanlar ve temele ekler
+        
+        Args:
+            col (str): Parametre adı
+            deger (float): Ölçülen değer
+        
+        Returns:
+            tuple: (seviye, z-skoru, alt sınır, üst sınır); eksik değerler ve
+                ısınma sırasında kritik olmayan değerler NORMAL'dir
+        """
+        temel = self.temeller[col]
+        if deger is None or deger != deger:
+            return NORMAL, 0.0, math.nan, math.nan
+        
+        kritik = self.kritik_esikler.get(col)
+        
+        if temel.hazir:
+            alt, ust = temel.sinirlar(self.yontem, self.esikler[col])
+            std = temel.std
+            skor = (deger - temel.ortalama) / std if std > 0 else 0.0
+            seviye = UYARI if deger < alt or deger > ust else NORMAL
+        else:
+            alt = ust = math.nan
+            skor = 0.0
+            seviye = NORMAL
+        
+        if kritik is not None and deger > kritik:
+            seviye = KRITIK
+        
+        temel.guncelle(deger, alt, ust)
+        return seviye, skor, alt, ust
+    
+    def baskiyi_puanla(self, baski):
+        """
+        Bir baskının tüm parametrelerini puanlar
+        
+        Args:
+            baski (dict): Parametre -> değer (eksik parametreler atlanır)
+        
+        Returns:
+            dict: Parametre -> (seviye, z-skoru, alt, üst); sadece NORMAL olmayanlar
+        """
+        self.baski_sayisi += 1
+        kararlar = {}
+        
+        for col in self.temeller:
+            if col in baski:
+                karar = self.puanla(col, baski[col])
+                if karar[0] != NORMAL:
+                    kararlar[col] = karar
+        
+        self.alarm_sayisi += len(kararlar)
+        return kararlar
+    
+    def partiyi_puanla(self, df):
+        """
+        Partideki baskıları sırayla (her biri kendinden önceki temele göre) puanlar
+        
+        Args:
+            df (pd.DataFrame): Tiplendirilmiş baskılar
+        
+        Returns:
+            pd.DataFrame: Alarm kayıtları (TARİH, KALIP NO, BASKI NO, parametre,
+                DEGER, seviye, skor, alt, ust); CanliTakip alarmlarıyla aynı biçim
+        """
+        kimlik = [c for c in ('TARİH', 'KALIP NO', 'BASKI NO') if c in df.columns]
+        sutunlar = [col for col in self.temeller if col in df.columns]
+        
+        # Satır başına pandas erişimi yerine düz Python listeleri
+        degerler = [df[col].to_numpy(dtype='float64', na_value=np.nan).tolist() for col in sutunlar]
+        
+        satirlar, kayitlar = [], []
+        for i, baski in enumerate(zip(*degerler)):
+            for col, deger in zip(sutunlar, baski):
+                if deger != deger:
+                    continue
+                seviye, skor, alt, ust = self.puanla(col, deger)
+                if seviye != NORMAL:
+                    satirlar.append(i)
+                    kayitlar.append((col, deger, seviye, skor, alt, ust))
+        
+        self.baski_sayisi += len(df)
+        self.alarm_sayisi += len(kayitlar)
+        
+        if not kayitlar:
+            return pd.DataFrame()
+        
+        alarmlar = df.iloc[satirlar][kimlik].reset_index(drop=True)
+        ek = pd.DataFrame(kayitlar, columns=['parametre', 'DEGER', 'seviye', 'skor', 'alt', 'ust'])
+        return pd.concat([alarmlar, ek], axis=1)
+    
+    def ozet_yazdir(self):
+        """Güncel temelleri ve toplam alarm sayısını yazdırır"""
+        print(f"\n📡 Çevrimiçi temeller ({self.yontem}, {self.baski_sayisi} baskı, {self.alarm_sayisi} alarm):")
+        for col, (alt, ust) in self.sinirlar().items():
+            temel = self.temeller[col]
+            print(f"   • {col}: ortalama {temel.ortalama:.2f}, Q1 {temel.q1:.2f}, Q3 {temel.q3:.2f} "
+                  f"(sınır: {alt:.2f} - {ust:.2f})")
+
+
+# Test için
+if __name__ == "__main__":
+    import time
+    from veri_kumesi import TembelVeriKumesi
+    
+    kume = TembelVeriKumesi('data/processed/enjeksiyon_temiz.parquet')
+    df = kume.sec(AnomaliBulucu.gerekli_sutunlar(kume.sutunlar))
+    
+    # İlk yarı referans, ikinci yarı canlı akış gibi tek tek puanlanır
+    yari = len(df) // 2
+    bulucu = CevrimiciAnomaliBulucu.veriden(df.iloc[:yari])
+    
+    baslangic = time.perf_counter()
+    alarmlar = bulucu.partiyi_puanla(df.iloc[yari:])
+    sure = time.perf_counter() - baslangic
+    
+    print(f"✅ {len(df) - yari} baskı {sure:.3f} sn'de puanlandı "
+          f"({(len(df) - yari) / sure:,.0f} baskı/sn)")
+    if len(alarmlar) > 0:
+        print(alarmlar.groupby(['parametre', 'seviye']).size().to_string())
+    bulucu.ozet_yazdir()
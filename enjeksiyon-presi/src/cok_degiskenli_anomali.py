@@ -0,0 +1,299 @@
+"""
+Çok Değişkenli Anomali Tespiti Modülü
+Bu modül baskıları dokuz proses parametresinin birlikte oluşturduğu dağılıma
+göre puanlar. Tek sütunlu IQR kontrolü, birbiriyle ilişkili parametrelerin
+(hız, basınç, dolum zamanı) her birinde küçük ama birlikte anlamsız
+sapmaları göremez; Mahalanobis uzaklığı bu ilişkileri kovaryans üzerinden
+hesaba katar.
+
+Her kalıp için ayrı bir model uydurulur: sütunlar medyan/MAD ile
+ölçeklenir (neredeyse kesikli parametrelerde MAD sıfır olduğundan ölçek
+çeyrekler arası açıklıkla tabanlanır), kovaryans Ledoit-Wolf büzülmesiyle
+(tekil olmayan, küçük örneklerde kararlı) tahmin edilir ve en merkezi
+baskılarla yeniden uydurularak (MCD benzeri C adımları) aykırı baskıların
+modeli bozması önlenir. MCD tutarlılık düzeltmesi ve yeniden ağırlıklandırma
+adımından sonra eşik, ki-kare kantili ile modelin kendi baskılarındaki
+uzaklık kantilinin büyüğüdür; ağır kuyruklu proseslerde ki-kare eşiği tek
+başına nominal orandan çok fazla baskı işaretler. Puanlama blok blok matris işlemleriyle yapılır; uzaklığın her
+parametreye düşen katkısı aynı çarpımdan elde edilir.
+"""
+
+from statistics import NormalDist
+import numpy as np
+import pandas as pd
+
+try:
+    from .anomali_sonucu import AnomaliSonucu
+except ImportError:
+    from anomali_sonucu import AnomaliSonucu
+
+# Modelde kullanılan proses parametreleri
+PARAMETRELER = [
+    'BİRİNCİ FAZ HIZI', 'PİSTON SÜRTÜNME BASINCI', 'İKİNCİ FAZ HIZI',
+    'İKİNCİ FAZ MESAFE', '3. FAZ BASINC YÜKSELME ZAMANI', '3. FAZ BASINCI',
+    'TOPUK BOYU', 'KALIP DOLUM ZAMANI', 'SPESİFİK BASINÇ BAR'
+]
+
+# Kalıbı bilinmeyen veya az baskılı kalıplar için tüm veriden uydurulan model
+GENEL_MODEL = 'TUMU'
+
+# Bir blokta puanlanan satır sayısı
+BLOK_SATIR = 65536
+
+def ki_kare_kantili(olasilik, serbestlik):
+    """
+    Ki-kare dağılımının kantili (Wilson-Hilferty yaklaşımı)
+    
+    Args:
+        olasilik (float): 0-1 arası olasılık
+        serbestlik (int): Serbestlik derecesi
+    
+    Returns:
+        float: Kantil değeri
+    """
+    z = NormalDist().inv_cdf(olasilik)
+    h = 2 / (9 * serbestlik)
+    return serbestlik * (1 - h + z * np.sqrt(h)) ** 3
+
+def ledoit_wolf(X):
+    """
+    Ortalaması çıkarılmış veriden Ledoit-Wolf büzülmeli kovaryans
+    
+    Örnek kovaryans, köşegeni ortalama varyans olan birim matrise doğru
+    veriden hesaplanan optimum oranda büzülür.
+    
+    Args:
+        X (np.ndarray): (n, p) merkezlenmiş veri
+    
+    Returns:
+        tuple: (kovaryans, büzülme oranı)
+    """
+    n, p = X.shape
+    X2 = X ** 2
+    S = X.T @ X / n
+    izler = X2.sum(axis=0) / n
+    mu = izler.sum() / p
+    
+    delta_ = np.sum(S ** 2)
+    beta = (np.sum(X2.T @ X2) / n - delta_) / (p * n)
+    delta = (delta_ - 2 * mu * izler.sum() + p * mu ** 2) / p
+    beta = min(beta, delta)
+    buzulme = 0.0 if beta <= 0 else beta / delta
+    
+    kovaryans = (1 - buzulme) * S
+    kovaryans.flat[::p + 1] += buzulme * mu
+    return kovaryans, buzulme
+
+def robust_olcek(X):
+    """
+    Sütunların robust ölçeği (normal dağılımda standart sapmaya eşit)
+    
+    MAD ölçeği çeyrekler arası açıklıkla tabanlanır: değerlerin yarıdan
+    fazlası aynı olan kesikli sütunlarda (ör. PİSTON SÜRTÜNME BASINCI) MAD
+    sıfırdır. IQR de sıfırsa %10-%90 açıklığı kullanılır.
+    
+    Args:
+        X (np.ndarray): (n, p) veri; eksikler NaN
+    
+    Returns:
+        np.ndarray: (p,) ölçekler (sabit sütunlarda 0)
+    """
+    medyan = np.nanmedian(X, axis=0)
+    mad = 1.4826 * np.nanmedian(np.abs(X - medyan), axis=0)
+    q10, q25, q75, q90 = np.nanpercentile(X, [10, 25, 75, 90], axis=0)
+    olcek = np.maximum(mad, (q75 - q25) / 1.349)
+    return np.where(olcek > 0, olcek, (q90 - q10) / 2.5631)
+
+def _uzaklik(Xc, hassasiyet):
+    """Merkezlenmiş satırların kare Mahalanobis uzaklıkları ve parametre katkıları"""
+    katki = Xc * (Xc @ hassasiyet)
+    return katki.sum(axis=1), katki
+
+class CokDegiskenliBulucu:
+    """
+    Kalıp bazında robust Mahalanobis uzaklığıyla baskı anomalisi bulan sınıf
+    """
+    
+    def __init__(self, parametreler=None, grup_sutunu='KALIP NO', esik_olasiligi=0.999,
+                 destek_orani=0.75, c_adimi=2, blok_satir=BLOK_SATIR):
+        """
+        Args:
+            parametreler (list): Kullanılacak sütunlar (None ise PARAMETRELER)
+            grup_sutunu (str): Ayrı model uydurulacak grup sütunu (kalıp)
+            esik_olasiligi (float): Ki-kare eşiğinin olasılığı; uzaklığı bu
+                kantilin üzerindeki baskılar anomalidir
+            destek_orani (float): C adımlarında modelin uydurulduğu en merkezi
+                baskıların oranı
+            c_adimi (int): Yeniden uydurma sayısı
+            blok_satir (int): Puanlamada bir blokta işlenen satır sayısı
+        """
+        self.parametreler = list(PARAMETRELER if parametreler is None else parametreler)
+        self.grup_sutunu = grup_sutunu
+        self.esik_olasiligi = esik_olasiligi
+        self.destek_orani = destek_orani
+        self.c_adimi = c_adimi
+        self.blok_satir = blok_satir
+        
+        self.sutunlar = None
+        self.taban_olcek = None
+        self.modeller = {}
+        self.esik = None
+    
+    def _matris(self, df):
+        """Parametre sütunlarının (n, p) float64 matrisi; eksikler NaN"""
+        return np.column_stack([df[col].to_numpy(dtype='float64', na_value=np.nan)
+                                for col in self.sutunlar])
+    
+    def _model(self, X):
+        """
+        Tek bir grubun modeli
+        
+        Returns:
+            tuple: (merkez, hassasiyet matrisi, eşik) özgün birimlerde
+        """
+        X = X[~np.isnan(X).any(axis=1)]
+        p = X.shape[1]
+        
+        # Robust ölçekleme; grupta sütun sabitse tüm verinin ölçeği kullanılır
+        medyan = np.median(X, axis=0)
+        olcek = robust_olcek(X)
+        olcek = np.where(olcek > 0, olcek, self.taban_olcek)
+        Z = (X - medyan) / olcek
+        
+        konum = np.zeros(p)
+        kovaryans, _ = ledoit_wolf(Z)
+        h = max(int(len(Z) * self.destek_orani), p + 1)
+        
+        # C adımları: en merkezi h baskıyla yeniden uydur
+        for _ in range(self.c_adimi):
+            uzaklik, _ = _uzaklik(Z - konum, np.linalg.inv(kovaryans))
+            destek = np.argpartition(uzaklik, h - 1)[:h]
+            konum = Z[destek].mean(axis=0)
+            kovaryans, _ = ledoit_wolf(Z[destek] - konum)
+        
+        # Tutarlılık düzeltmesi: medyan uzaklık ki-kare medyanına eşitlenir
+        hassasiyet = self._duzelt(Z - konum, np.linalg.inv(kovaryans))
+        
+        # Yeniden ağırlıklandırma: uzaklığı ki-kare %97.5 kantilinin altındaki
+        # tüm baskılarla yeniden uydurulur (h baskılık destek kovaryansı dar kalır)
+        uzaklik, _ = _uzaklik(Z - konum, hassasiyet)
+        secilen = uzaklik <= ki_kare_kantili(0.975, p)
+        if secilen.sum() > p:
+            konum = Z[secilen].mean(axis=0)
+            kovaryans, _ = ledoit_wolf(Z[secilen] - konum)
+            hassasiyet = self._duzelt(Z - konum, np.linalg.inv(kovaryans))
+        
+        # Eşik: ki-kare kantili, grubun kendi uzaklıklarının aynı olasılıktaki
+        # kantilinden küçükse ona yükseltilir (ağır kuyruk kalibrasyonu)
+        uzaklik, _ = _uzaklik(Z - konum, hassasiyet)
+        esik = max(ki_kare_kantili(self.esik_olasiligi, p),
+                   float(np.quantile(uzaklik, self.esik_olasiligi)))
+        
+        # Ölçekleme modele katılır: uzaklık özgün birimlerden hesaplanır
+        merkez = medyan + konum * olcek
+        hassasiyet = hassasiyet / np.outer(olcek, olcek)
+        return merkez, hassasiyet, esik
+    
+    @staticmethod
+    def _duzelt(Zc, hassasiyet):
+        """Hassasiyeti medyan uzaklık ki-kare medyanına eşit olacak şekilde ölçekler"""
+        uzaklik, _ = _uzaklik(Zc, hassasiyet)
+        duzeltme = np.median(uzaklik) / ki_kare_kantili(0.5, Zc.shape[1])
+        return hassasiyet / duzeltme if duzeltme > 0 else hassasiyet
+    
+    def uydur(self, df):
+        """
+        Her kalıp için (ve genel) modeli uydurur
+        
+        Baskı sayısı parametre sayısının beş katından az olan kalıplar genel
+        modelle puanlanır. esik genel modelin eşiğidir; her modelin eşiği
+        kendi içinde tutulur.
+        
+        Args:
+            df (pd.DataFrame): Temizlenmiş baskılar
+        
+        Returns:
+            CokDegiskenliBulucu: Kendisi
+        """
+        self.sutunlar = [col for col in self.parametreler if col in df.columns]
+        if not self.sutunlar:
+            raise ValueError("Veride çok değişkenli model için parametre sütunu yok")
+        
+        X = self._matris(df)
+        olcek = robust_olcek(X)
+        self.taban_olcek = np.where(olcek > 0, olcek, 1.0)
+        en_az = 5 * len(self.sutunlar)
+        self.modeller = {GENEL_MODEL: self._model(X)}
+        
+        if self.grup_sutunu in df.columns:
+            kodlar, gruplar = pd.factorize(df[self.grup_sutunu])
+            for i, grup in enumerate(gruplar):
+                maske = kodlar == i
+                if maske.sum() >= en_az:
+                    self.modeller[grup] = self._model(X[maske])
+        
+        self.esik = self.modeller[GENEL_MODEL][2]
+        return self
+    
+    def puanla(self, df):
+        """
+        Baskıların kare Mahalanobis uzaklıklarını hesaplar
+        
+        Eksik parametreler merkezde kabul edilir (uzaklığa katkısı sıfır).
+        
+        Args:
+            df (pd.DataFrame): Puanlanacak baskılar
+        
+        Returns:
+            tuple: (uzaklıklar, en çok katkı yapan parametrenin sütun indeksi,
+                satırın puanlandığı modelin eşiği)
+        """
+        if not self.modeller:
+            raise ValueError("Önce uydur() çağrılmalı")
+        
+        X = self._matris(df)
+        uzaklik = np.empty(len(X))
+        en_etkili = np.empty(len(X), dtype=np.int8)
+        esikler = np.empty(len(X))
+        
+        if self.grup_sutunu in df.columns:
+            kodlar, gruplar = pd.factorize(df[self.grup_sutunu])
+            atamalar = [(kodlar == i, self.modeller.get(grup, self.modeller[GENEL_MODEL]))
+                        for i, grup in enumerate(gruplar)]
+            if (kodlar < 0).any():
+                atamalar.append((kodlar < 0, self.modeller[GENEL_MODEL]))
+        else:
+            atamalar = [(slice(None), self.modeller[GENEL_MODEL])]
+        
+        for secim, (merkez, hassasiyet, esik) in atamalar:
+            satirlar = np.arange(len(X))[secim]
+            esikler[satirlar] = esik
+            for bas in range(0, len(satirlar), self.blok_satir):
+                blok = satirlar[bas:bas + self.blok_satir]
+                Xc = np.nan_to_num(X[blok] - merkez, nan=0.0)
+                d2, katki = _uzaklik(Xc, hassasiyet)
+                uzaklik[blok] = d2
+                en_etkili[blok] = katki.argmax(axis=1)
+        
+        return uzaklik, en_etkili, esikler
+    
+    def anomali_bul(self, df):
+        """
+        Uzaklığı modelinin eşiğini aşan baskıları döndürür
+        
+        Args:
+            df (pd.DataFrame): Puanlanacak baskılar
+        
+        Returns:
+            AnomaliSonucu: Uzaklığa göre azalan sırada anomali konumları;
+                MAHALANOBIS (kare uzaklık) ve EN ETKİLİ PARAMETRE ek sütunlarıyla
+        """
+        uzaklik, en_etkili, esikler = self.puanla(df)
+        konumlar = np.flatnonzero(uzaklik > esikler)
+        konumlar = konumlar[np.argsort(-uzaklik[konumlar], kind='stable')]
+        
+        ek = {
+            'MAHALANOBIS': uzaklik[konumlar],
+            'EN ETKİLİ PARAMETRE': np.asarray(self.sutunlar, dtype=object)[en_etkili[konumlar]]
+        }
+        return AnomaliSonucu(df, 'MAHALANOBIS', konumlar, ust=esikler[konumlar], ek=ek)
@@ -0,0 +1,142 @@
+"""
+Çoklu Dosya Yükleme Modülü
+Bu modül birden fazla presin Excel dışa aktarımlarını süreç havuzunda paralel
+olarak okur, her birini makine koduyla etiketler ve tek bir DataFrame'de birleştirir.
+"""
+
+import pandas as pd
+import os
+import io
+import glob
+import time
+from contextlib import redirect_stdout
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    from .veri_yukleme import VeriYukleyici
+except ImportError:
+    from veri_yukleme import VeriYukleyici
+
+def _pres_dosyasi_yukle(data_path, dosya_adi, onbellek_dizini, yenile):
+    """
+    Tek bir pres dosyasını yükler (süreç havuzunda çalışır)
+    
+    Returns:
+        tuple: (dosya adı, DataFrame veya None, süre (sn))
+    """
+    baslangic = time.perf_counter()
+    
+    # Paralel süreçlerin çıktıları birbirine karışmasın
+    with redirect_stdout(io.StringIO()):
+        yukleyici = VeriYukleyici(data_path=data_path, onbellek_dizini=onbellek_dizini)
+        df = yukleyici.enjeksiyon_presi_yukle(yenile=yenile, dosya_adi=dosya_adi)
+    
+    if df is None:
+        return dosya_adi, None, time.perf_counter() - baslangic
+    
+    # Başlık satırı ('tarih', 'kalip', ...) birleştirmeden önce düşülür
+    df = df[df['TARİH'] != 'tarih'].reset_index(drop=True)
+    df['TARİH'] = pd.to_datetime(df['TARİH'], errors='coerce')
+    
+    # Makine kodu dosya adından gelir; dosyada kod varsa o korunur
+    makine_kodu = os.path.splitext(dosya_adi)[0]
+    if 'MAKİNE KODU' in df.columns:
+        df['MAKİNE KODU'] = df['MAKİNE KODU'].astype(object).where(df['MAKİNE KODU'].notna(), makine_kodu)
+    else:
+        df.insert(3, 'MAKİNE KODU', makine_kodu)
+    
+    return dosya_adi, df, time.perf_counter() - baslangic
+
+class CokluVeriYukleyici:
+    """
+    Birden fazla makinenin Excel dosyalarını paralel yükleyen sınıf
+    """
+    
+    def __init__(self, data_path='data/raw/', onbellek_dizini='data/cache/', calisan_sayisi=None):
+        """
+        Args:
+            data_path (str): Veri dosyalarının bulunduğu klasör
+            onbellek_dizini (str): Parquet önbellek klasörü (None ise önbellek kapalı)
+            calisan_sayisi (int): Süreç sayısı (None ise çekirdek sayısı)
+        """
+        self.data_path = data_path
+        self.onbellek_dizini = onbellek_dizini
+        self.calisan_sayisi = calisan_sayisi or os.cpu_count()
+    
+    def dosyalari_bul(self, desen):
+        """
+        Desene uyan Excel dosyalarını bulur
+        
+        Args:
+            desen (str): Dosya deseni (ör. '*Pres*.xlsx')
+        
+        Returns:
+            list: Sıralı dosya adları
+        """
+        yollar = glob.glob(os.path.join(self.data_path, desen))
+        return sorted(os.path.basename(y) for y in yollar if not os.path.basename(y).startswith('~$'))
+    
+    def pres_verilerini_yukle(self, desen='*Pres*.xlsx', yenile=False):
+        """
+        Desene uyan tüm pres dosyalarını paralel yükler ve birleştirir
+        
+        Args:
+            desen (str): Dosya deseni
+            yenile (bool): True ise önbelleği yok say
+        
+        Returns:
+            pd.DataFrame: Tüm preslerin birleştirilmiş verisi
+        """
+        print("\n" + "="*50)
+        print("ÇOKLU PRES VERİSİ YÜKLENİYOR")
+        print("="*50 + "\n")
+        
+        dosyalar = self.dosyalari_bul(desen)
+        
+        if not dosyalar:
+            print(f"❌ HATA: '{os.path.join(self.data_path, desen)}' desenine uyan dosya yok!")
+            return None
+        
+        calisan = min(self.calisan_sayisi, len(dosyalar))
+        print(f"📂 {len(dosyalar)} dosya bulundu, {calisan} süreçte okunuyor...")
+        
+        baslangic = time.perf_counter()
+        
+        with ProcessPoolExecutor(max_workers=calisan) as havuz:
+            sonuclar = list(havuz.map(
+                _pres_dosyasi_yukle,
+                [self.data_path] * len(dosyalar),
+                dosyalar,
+                [self.onbellek_dizini] * len(dosyalar),
+                [yenile] * len(dosyalar)
+            ))
+        
+        parcalar = []
+        for dosya_adi, df, sure in sonuclar:
+            if df is None:
+                print(f"  ⚠️  {dosya_adi}: yüklenemedi")
+                continue
+            print(f"  ✅ {dosya_adi}: {len(df)} satır ({sure:.1f} sn)")
+            parcalar.append(df)
+        
+        if not parcalar:
+            print("❌ HATA: Hiçbir dosya yüklenemedi!")
+            return None
+        
+        # Tek seferde birleştir, makine kodunu kategorik yap
+        df = pd.concat(parcalar, ignore_index=True)
+        df['MAKİNE KODU'] = df['MAKİNE KODU'].astype('category')
+        
+        print(f"\n✅ {len(parcalar)} makine, toplam {len(df)} satır "
+              f"({time.perf_counter() - baslangic:.1f} sn)")
+        
+        return df
+
+
+# Test için
+if __name__ == "__main__":
+    yukleyici = CokluVeriYukleyici()
+    df = yukleyici.pres_verilerini_yukle()
+    
+    if df is not None:
+        print(df['MAKİNE KODU'].value_counts())
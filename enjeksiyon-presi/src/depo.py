@@ -0,0 +1,369 @@
+"""
+Veri Deposu Modülü
+Bu modül temizlenmiş baskıları ve tespit edilen anomalileri yerel bir SQLite
+veritabanında saklar. Zaman, KALIP NO ve makine kodu üzerindeki indeksler
+sayesinde sorgular tüm CSV'yi taramak yerine indeks üzerinden çalışır.
+"""
+
+import os
+import sqlite3
+from contextlib import contextmanager
+import pandas as pd
+
+try:
+    from .veri_semasi import semayi_uygula
+except ImportError:
+    from veri_semasi import semayi_uygula
+
+# TARİH metin olarak bu formatta saklanır; sözlük sırası zaman sırasıyla aynıdır
+ZAMAN_FORMATI = '%Y-%m-%d %H:%M:%S'
+
+def _sql_tipi(dtype):
+    """Pandas veri tipine karşılık gelen SQLite tipini döndürür"""
+    if pd.api.types.is_bool_dtype(dtype):
+        return 'INTEGER'
+    if pd.api.types.is_integer_dtype(dtype):
+        return 'INTEGER'
+    if pd.api.types.is_float_dtype(dtype):
+        return 'REAL'
+    return 'TEXT'
+
+def _zaman_metni(deger):
+    """Tarih değerini indekslenebilir metne çevirir"""
+    return pd.Timestamp(deger).strftime(ZAMAN_FORMATI)
+
+class PresDeposu:
+    """
+    Pres baskılarını ve anomalilerini SQLite'ta saklayan sınıf
+    """
+    
+    BASKI_TABLOSU = 'baskilar'
+    ANOMALI_TABLOSU = 'anomaliler'
+    
+    # Bir baskıyı tekil tanımlayan sütunlar; aynı anahtarlı satırlar tek kayıtta tutulur
+    BASKI_ANAHTARI = ['MAKİNE KODU', 'BASKI NO', 'TARİH']
+    
+    # Bir anomali kaydını tekil tanımlayan sütunlar
+    ANOMALI_ANAHTARI = ['parametre', 'MAKİNE KODU', 'BASKI NO', 'TARİH']
+    
+    def __init__(self, db_yolu='data/processed/enjeksiyon.db'):
+        """
+        Args:
+            db_yolu (str): SQLite veritabanı dosyası
+        """
+        self.db_yolu = db_yolu
+    
+    @contextmanager
+    def baglan(self):
+        """Veritabanı bağlantısı açar; blok sonunda kaydeder ve kapatır"""
+        klasor = os.path.dirname(self.db_yolu)
+        if klasor:
+            os.makedirs(klasor, exist_ok=True)
+        baglanti = sqlite3.connect(self.db_yolu)
+        try:
+            with baglanti:
+                yield baglanti
+        finally:
+            baglanti.close()
+    
+    def mevcut_mu(self):
+        """Veritabanında baskı tablosu olup olmadığını kontrol eder"""
+        if not os.path.exists(self.db_yolu):
+            return False
+        with self.baglan() as baglanti:
+            return bool(self._sutunlar(baglanti, self.BASKI_TABLOSU))
+    
+    @staticmethod
+    def _sutunlar(baglanti, tablo):
+        return [satir[1] for satir in baglanti.execute(f'PRAGMA table_info("{tablo}")')]
+    
+    @staticmethod
+    def _satirlar(df):
+        """DataFrame'i sqlite3'ün yazabileceği tuple listesine çevirir"""
+        sutunlar = []
+        for col in df.columns:
+            seri = df[col]
+            if pd.api.types.is_datetime64_any_dtype(seri):
+                seri = seri.dt.strftime(ZAMAN_FORMATI)
+            # object'e çevirmek NumPy skalerlerini Python tiplerine dönüştürür
+            sutunlar.append(seri.astype(object).where(seri.notna(), None).tolist())
+        return list(zip(*sutunlar))
+    
+    def _tablo_olustur(self, baglanti, tablo, df, indeksler, benzersiz=None):
+        """Tabloyu ve indekslerini (yoksa) oluşturur"""
+        sutun_tanimlari = ', '.join(f'"{col}" {_sql_tipi(df[col].dtype)}' for col in df.columns)
+        baglanti.execute(f'CREATE TABLE IF NOT EXISTS "{tablo}" ({sutun_tanimlari})')
+        
+        for ad, sutunlar in indeksler.items():
+            liste = ', '.join(f'"{s}"' for s in sutunlar)
+            baglanti.execute(f'CREATE INDEX IF NOT EXISTS "{ad}" ON "{tablo}" ({liste})')
+        
+        if benzersiz:
+            ad, sutunlar = benzersiz
+            liste = ', '.join(f'"{s}"' for s in sutunlar)
+            baglanti.execute(f'CREATE UNIQUE INDEX IF NOT EXISTS "{ad}" ON "{tablo}" ({liste})')
+    
+    def baskilari_kaydet(self, df, ekle=False):
+        """
+        Temizlenmiş baskıları veritabanına yazar
+        
+        Aynı BASKI_ANAHTARI'na sahip satırlar tek kayıtta tutulur (sonuncusu
+        kalır). Bu yüzden tablo CSV'den az satır içerebilir; fark yazdırılır.
+        
+        Args:
+            df (pd.DataFrame): Temizlenmiş pres verisi
+            ekle (bool): True ise mevcut kayıtlara ekle (aynı baskı varsa
+                güncellenir), False ise tabloyu baştan yaz
+        
+        Returns:
+            int: Yazmadan sonra tablodaki satır sayısı
+        """
+        if df is None or len(df) == 0:
+            return 0
+        
+        with self.baglan() as baglanti:
+            if not ekle:
+                baglanti.execute(f'DROP TABLE IF EXISTS "{self.BASKI_TABLOSU}"')
+            
+            self._tablo_olustur(
+                baglanti, self.BASKI_TABLOSU, df,
+                indeksler={
+                    'ix_baskilar_tarih': ['TARİH'],
+                    'ix_baskilar_kalip_tarih': ['KALIP NO', 'TARİH'],
+                    'ix_baskilar_makine_tarih': ['MAKİNE KODU', 'TARİH']
+                },
+                benzersiz=('ux_baskilar_baski', self.BASKI_ANAHTARI)
+            )
+            onceki = baglanti.execute(f'SELECT COUNT(*) FROM "{self.BASKI_TABLOSU}"').fetchone()[0]
+            
+            sutunlar = [c for c in self._sutunlar(baglanti, self.BASKI_TABLOSU) if c in df.columns]
+            liste = ', '.join(f'"{c}"' for c in sutunlar)
+            yer_tutucular = ', '.join('?' * len(sutunlar))
+            baglanti.executemany(
+                f'INSERT OR REPLACE INTO "{self.BASKI_TABLOSU}" ({liste}) VALUES ({yer_tutucular})',
+                self._satirlar(df[sutunlar])
+            )
+            sonraki = baglanti.execute(f'SELECT COUNT(*) FROM "{self.BASKI_TABLOSU}"').fetchone()[0]
+        
+        print(f"🗄️  {len(df)} baskı '{self.db_yolu}' veritabanına yazıldı")
+        
+        # Aynı anahtarlı satırlar sessizce kaybolmasın
+        anahtar = [col for col in self.BASKI_ANAHTARI if col in df.columns]
+        tekrarli = int(df.duplicated(anahtar).sum()) if anahtar else 0
+        guncellenen = onceki + len(df) - tekrarli - sonraki
+        if tekrarli:
+            print(f"   ⚠️  {tekrarli} satır aynı baskının tekrarı ({', '.join(anahtar)}); "
+                  f"tek kayıt olarak tutuldu")
+        if guncellenen:
+            print(f"   🔄 {guncellenen} baskı veritabanında zaten vardı, güncellendi")
+        if tekrarli or guncellenen:
+            print(f"   Tablodaki baskı sayısı: {sonraki}")
+        
+        return sonraki
+    
+    def _indeks_var_mi(self, baglanti, ad):
+        """Verilen adda bir indeks olup olmadığını kontrol eder"""
+        return baglanti.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = ?", (ad,)
+        ).fetchone() is not None
+    
+    def _kapsamdaki_anomalileri_sil(self, baglanti, kapsam):
+        """
+        Yeniden hesaplanan verinin zaman aralığına ve MAKİNE KODU değerlerine
+        düşen anomali kayıtlarını siler
+        
+        Returns:
+            int: Silinen kayıt sayısı
+        """
+        tarih = pd.to_datetime(kapsam['TARİH'])
+        if not self._sutunlar(baglanti, self.ANOMALI_TABLOSU) or tarih.isna().all():
+            return 0
+        
+        kosullar = ['"TARİH" >= ?', '"TARİH" <= ?']
+        parametreler = [_zaman_metni(tarih.min()), _zaman_metni(tarih.max())]
+        
+        if 'MAKİNE KODU' in kapsam.columns:
+            kimlikler = kapsam['MAKİNE KODU'].dropna().astype(object).unique().tolist()
+            kosul = f'"MAKİNE KODU" IN ({", ".join("?" * len(kimlikler))})'
+            if kapsam['MAKİNE KODU'].isna().any():
+                kosul = f'({kosul} OR "MAKİNE KODU" IS NULL)'
+            kosullar.append(kosul)
+            parametreler.extend(kimlikler)
+        
+        return baglanti.execute(
+            f'DELETE FROM "{self.ANOMALI_TABLOSU}" WHERE ' + ' AND '.join(kosullar), parametreler
+        ).rowcount
+    
+    def anomalileri_kaydet(self, anomaliler, kapsam=None):
+        """
+        Anomali tespit sonuçlarını uzun formatta veritabanına yazar
+        
+        Her anomali satırı: parametre, TARİH, KALIP NO, BASKI NO, MAKİNE KODU, DEGER
+        
+        Kayıtlar ANOMALI_ANAHTARI üzerinden eklenir veya güncellenir; önceki
+        çalıştırmaların anomalileri korunur. kapsam verilirse o verinin zaman
+        aralığındaki ve makinelerindeki eski kayıtlar önce silinir, böylece
+        artık anomali sayılmayan baskılar tabloda kalmaz.
+        
+        Args:
+            anomaliler (dict): Parametre -> AnomaliSonucu
+            kapsam (pd.DataFrame): Anomalilerin arandığı veri (TARİH, MAKİNE KODU)
+        """
+        parcalar = []
+        for parametre, sonuc in (anomaliler or {}).items():
+            if parametre not in sonuc.sutunlar and parametre not in sonuc.ek:
+                continue
+            
+            # Sonuçtan sadece uzun formattaki sütunlar üretilir
+            anomali_df = sonuc.satirlar(['TARİH', 'KALIP NO', 'BASKI NO', 'MAKİNE KODU', parametre])
+            parca = pd.DataFrame({
+                'parametre': parametre,
+                'TARİH': anomali_df['TARİH'],
+                'KALIP NO': anomali_df.get('KALIP NO'),
+                'BASKI NO': anomali_df.get('BASKI NO'),
+                'MAKİNE KODU': anomali_df.get('MAKİNE KODU'),
+                'DEGER': anomali_df[parametre].astype('float64')
+            })
+            parcalar.append(parca)
+        
+        with self.baglan() as baglanti:
+            # Benzersiz anahtarı olmayan eski tablo bir kez baştan oluşturulur
+            if self._sutunlar(baglanti, self.ANOMALI_TABLOSU) \
+                    and not self._indeks_var_mi(baglanti, 'ux_anomaliler_kayit'):
+                baglanti.execute(f'DROP TABLE "{self.ANOMALI_TABLOSU}"')
+            
+            silinen = self._kapsamdaki_anomalileri_sil(baglanti, kapsam) if kapsam is not None else 0
+            
+            if not parcalar:
+                return
+            
+            df = pd.concat(parcalar, ignore_index=True)
+            df['KALIP NO'] = pd.to_numeric(df['KALIP NO'], errors='coerce').astype('Int64')
+            df['BASKI NO'] = pd.to_numeric(df['BASKI NO'], errors='coerce').astype('Int64')
+            df['MAKİNE KODU'] = df['MAKİNE KODU'].astype(object)
+            
+            self._tablo_olustur(
+                baglanti, self.ANOMALI_TABLOSU, df,
+                indeksler={
+                    'ix_anomaliler_tarih': ['TARİH'],
+                    'ix_anomaliler_parametre_tarih': ['parametre', 'TARİH'],
+                    'ix_anomaliler_kalip_tarih': ['KALIP NO', 'TARİH'],
+                    'ix_anomaliler_makine_tarih': ['MAKİNE KODU', 'TARİH']
+                },
+                benzersiz=('ux_anomaliler_kayit', self.ANOMALI_ANAHTARI)
+            )
+            
+            sutunlar = [c for c in self._sutunlar(baglanti, self.ANOMALI_TABLOSU) if c in df.columns]
+            liste = ', '.join(f'"{c}"' for c in sutunlar)
+            yer_tutucular = ', '.join('?' * len(sutunlar))
+            baglanti.executemany(
+                f'INSERT OR REPLACE INTO "{self.ANOMALI_TABLOSU}" ({liste}) VALUES ({yer_tutucular})',
+                self._satirlar(df[sutunlar])
+            )
+            toplam = baglanti.execute(f'SELECT COUNT(*) FROM "{self.ANOMALI_TABLOSU}"').fetchone()[0]
+        
+        print(f"🗄️  {len(df)} anomali kaydı '{self.db_yolu}' veritabanına yazıldı "
+              f"({silinen} eski kayıt yeniden hesaplandı, tabloda {toplam} kayıt)")
+    
+    def _sorgula(self, tablo, sutunlar=None, baslangic=None, bitis=None, esitlikler=None):
+        """
+        İndekslenmiş sütunlar üzerinden filtreli sorgu çalıştırır
+        
+        Args:
+            tablo (str): Tablo adı
+            sutunlar (list): Getirilecek sütunlar (None ise tümü)
+            baslangic: Bu zamandan itibaren (dahil)
+            bitis: Bu zamana kadar (hariç)
+            esitlikler (dict): Sütun -> aranan değer (None olanlar yok sayılır)
+        
+        Returns:
+            pd.DataFrame: Sorgu sonucu
+        """
+        with self.baglan() as baglanti:
+            mevcut = self._sutunlar(baglanti, tablo)
+            if not mevcut:
+                return pd.DataFrame()
+            
+            secilen = mevcut if sutunlar is None else [c for c in mevcut if c in sutunlar]
+            kosullar, parametreler = [], []
+            
+            if baslangic is not None:
+                kosullar.append('"TARİH" >= ?')
+                parametreler.append(_zaman_metni(baslangic))
+            if bitis is not None:
+                kosullar.append('"TARİH" < ?')
+                parametreler.append(_zaman_metni(bitis))
+            for col, deger in (esitlikler or {}).items():
+                if deger is not None:
+                    kosullar.append(f'"{col}" = ?')
+                    parametreler.append(deger.item() if hasattr(deger, 'item') else deger)
+            
+            liste = ', '.join(f'"{c}"' for c in secilen)
+            sorgu = f'SELECT {liste} FROM "{tablo}"'
+            if kosullar:
+                sorgu += ' WHERE ' + ' AND '.join(kosullar)
+            sorgu += ' ORDER BY "TARİH"'
+            
+            df = pd.read_sql_query(sorgu, baglanti, params=parametreler)
+        
+        if 'TARİH' in df.columns:
+            df['TARİH'] = pd.to_datetime(df['TARİH'])
+        return df
+    
+    def baskilari_getir(self, baslangic=None, bitis=None, kalip_no=None, makine_kodu=None, sutunlar=None):
+        """
+        Baskıları zaman, kalıp ve makineye göre getirir
+        
+        Örnek: 3 numaralı kalıbın 7 Ocak baskıları
+            depo.baskilari_getir('2025-01-07', '2025-01-08', kalip_no=3)
+        
+        Args:
+            baslangic: Başlangıç zamanı (dahil)
+            bitis: Bitiş zamanı (hariç)
+            kalip_no (int): KALIP NO filtresi
+            makine_kodu (str): MAKİNE KODU filtresi
+            sutunlar (list): Getirilecek sütunlar (None ise tümü)
+        
+        Returns:
+            pd.DataFrame: Kompakt tipli baskı verisi
+        """
+        df = self._sorgula(
+            self.BASKI_TABLOSU, sutunlar, baslangic, bitis,
+            {'KALIP NO': kalip_no, 'MAKİNE KODU': makine_kodu}
+        )
+        return semayi_uygula(df, rapor=False)
+    
+    def anomalileri_getir(self, parametre=None, baslangic=None, bitis=None, kalip_no=None, makine_kodu=None):
+        """
+        Anomalileri parametre, zaman, kalıp ve makineye göre getirir
+        
+        Args:
+            parametre (str): Anomali parametresi (ör. 'KALIP DOLUM ZAMANI')
+            baslangic: Başlangıç zamanı (dahil)
+            bitis: Bitiş zamanı (hariç)
+            kalip_no (int): KALIP NO filtresi
+            makine_kodu (str): MAKİNE KODU filtresi
+        
+        Returns:
+            pd.DataFrame: Anomali kayıtları
+        """
+        return self._sorgula(
+            self.ANOMALI_TABLOSU, None, baslangic, bitis,
+            {'parametre': parametre, 'KALIP NO': kalip_no, 'MAKİNE KODU': makine_kodu}
+        )
+
+
+# Test için
+if __name__ == "__main__":
+    depo = PresDeposu()
+    
+    if depo.mevcut_mu():
+        df = depo.baskilari_getir()
+        print(f"✅ {len(df)} baskı okundu: {df['TARİH'].min()} - {df['TARİH'].max()}")
+        
+        anomaliler = depo.anomalileri_getir()
+        if len(anomaliler) > 0:
+            print("\n📊 Parametre bazında anomali sayıları:")
+            print(anomaliler['parametre'].value_counts().to_string())
+    else:
+        print(f"❌ HATA: {depo.db_yolu} bulunamadı! Önce main.py çalıştırılmalı.")
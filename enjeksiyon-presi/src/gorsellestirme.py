@@ -11,6 +11,15 @@ from datetime import datetime
 import warnings
 warnings.filterwarnings('ignore')
 
+try:
+    from .veri_kumesi import sutunlari_filtrele
+    from .istatistik_motoru import motor
+    from .islem_baglami import paylasimli_gorunum
+except ImportError:
+    from veri_kumesi import sutunlari_filtrele
+    from istatistik_motoru import motor
+    from islem_baglami import paylasimli_gorunum
+
 # Türkçe karakter desteği
 plt.rcParams['font.family'] = 'DejaVu Sans'
 plt.rcParams['axes.unicode_minus'] = False
@@ -20,12 +29,18 @@ class Gorselestirici:
     Veri görselleştirme işlemlerini gerçekleştiren sınıf
     """
     
+    # Grafiklerde kullanılan sütunlar
+    GEREKLI_SUTUNLAR = [
+        'TARİH', 'PİSTON SÜRTÜNME BASINCI', 'İKİNCİ FAZ HIZI',
+        '3. FAZ BASINC YÜKSELME ZAMANI', 'KALIP DOLUM ZAMANI', 'SPESİFİK BASINÇ BAR'
+    ]
+    
     def __init__(self, df):
         """
         Args:
             df (pd.DataFrame): Görselleştirilecek DataFrame
         """
-        self.df = df.copy()
+        self.df = paylasimli_gorunum(df)
         self.output_dir = 'reports/figures/'
         
         # Renk paleti
@@ -40,6 +55,29 @@ class Gorselestirici:
         sns.set_style("whitegrid")
         plt.style.use('seaborn-v0_8-darkgrid')
     
+    @classmethod
+    def gerekli_sutunlar(cls, mevcut):
+        """
+        Analizin kullandığı sütunları döndürür
+        
+        Args:
+            mevcut (list): Veri kümesindeki sütunlar
+        
+        Returns:
+            list: Yüklenecek sütunlar
+        """
+        return sutunlari_filtrele(mevcut, cls.GEREKLI_SUTUNLAR)
+    
+    @classmethod
+    def veri_kumesinden(cls, kume):
+        """
+        Veri kümesinden sadece gerekli sütunları yükleyerek nesne oluşturur
+        
+        Args:
+            kume (TembelVeriKumesi): Temizlenmiş veri kümesi
+        """
+        return cls(kume.sec(cls.gerekli_sutunlar(kume.sutunlar)))
+    
     def zaman_serisi_grafigi(self):
         """
         Zaman serisi grafiklerini çizer (Dolum Zamanı, Basınç)
@@ -116,6 +154,8 @@ class Gorselestirici:
         fig, axes = plt.subplots(2, 4, figsize=(18, 10))
         fig.suptitle('Parametre Dağılım Analizi', fontsize=16, fontweight='bold')
         
+        istatistik = motor.istatistikler(self.df)
+        
         for idx, param in enumerate(parametreler):
             # Box Plot
             sns.boxplot(y=self.df[param], ax=axes[0, idx], 
@@ -127,12 +167,12 @@ class Gorselestirici:
             # Histogram
             axes[1, idx].hist(self.df[param], bins=30, 
                             color=self.colors['normal'], alpha=0.7, edgecolor='black')
-            axes[1, idx].axvline(self.df[param].mean(), 
+            axes[1, idx].axvline(istatistik.loc[param, 'ortalama'], 
                                color=self.colors['anomali'], linestyle='--', 
-                               linewidth=2, label=f'Ort: {self.df[param].mean():.1f}')
-            axes[1, idx].axvline(self.df[param].median(), 
+                               linewidth=2, label=f"Ort: {istatistik.loc[param, 'ortalama']:.1f}")
+            axes[1, idx].axvline(istatistik.loc[param, 'medyan'], 
                                color=self.colors['uyari'], linestyle='--', 
-                               linewidth=2, label=f'Med: {self.df[param].median():.1f}')
+                               linewidth=2, label=f"Med: {istatistik.loc[param, 'medyan']:.1f}")
             axes[1, idx].set_title(f'{param}\nHistogram', fontsize=11, fontweight='bold')
             axes[1, idx].set_xlabel('Değer', fontsize=10)
             axes[1, idx].set_ylabel('Frekans', fontsize=10)
@@ -162,12 +202,7 @@ class Gorselestirici:
         ]
         
         for param in parametreler:
-            Q1 = self.df[param].quantile(0.25)
-            Q3 = self.df[param].quantile(0.75)
-            IQR = Q3 - Q1
-            
-            lower = Q1 - 1.5 * IQR
-            upper = Q3 + 1.5 * IQR
+            _, _, lower, upper = motor.iqr_sinirlari(self.df, param)
             
             anomaliler = ((self.df[param] < lower) | (self.df[param] > upper)).sum()
             anomali_sayilari[param] = anomaliler
@@ -289,25 +324,25 @@ class Gorselestirici:
         """
         print("\n📅 Günlük Anomali Analizi Oluşturuluyor...")
         
-        # Her gün için anomali sayısını hesapla
+        # Sınırlar tüm veri üzerinden bir kez hesaplanır, her güne uygulanır
+        _, _, alt_basinc, ust_basinc = motor.iqr_sinirlari(self.df, 'PİSTON SÜRTÜNME BASINCI')
+        _, _, alt_dolum, ust_dolum = motor.iqr_sinirlari(self.df, 'KALIP DOLUM ZAMANI')
+        
+        # Her gün için anomali sayısını hesapla (gün anahtarı bir kez hesaplanır)
         gunluk_anomali = []
+        gunler = self.df['TARİH'].dt.normalize()
         
-        for tarih in self.df['TARİH'].dt.date.unique():
-            gun_verisi = self.df[self.df['TARİH'].dt.date == tarih]
+        for gun in gunler.unique():
+            gun_verisi = self.df[gunler == gun]
+            tarih = gun.date()
             
             # Basınç anomalileri
-            Q1 = self.df['PİSTON SÜRTÜNME BASINCI'].quantile(0.25)
-            Q3 = self.df['PİSTON SÜRTÜNME BASINCI'].quantile(0.75)
-            IQR = Q3 - Q1
-            basinc_anomali = ((gun_verisi['PİSTON SÜRTÜNME BASINCI'] < Q1 - 1.5*IQR) | 
-                             (gun_verisi['PİSTON SÜRTÜNME BASINCI'] > Q3 + 1.5*IQR)).sum()
+            basinc_anomali = ((gun_verisi['PİSTON SÜRTÜNME BASINCI'] < alt_basinc) | 
+                             (gun_verisi['PİSTON SÜRTÜNME BASINCI'] > ust_basinc)).sum()
             
             # Dolum anomalileri
-            Q1 = self.df['KALIP DOLUM ZAMANI'].quantile(0.25)
-            Q3 = self.df['KALIP DOLUM ZAMANI'].quantile(0.75)
-            IQR = Q3 - Q1
-            dolum_anomali = ((gun_verisi['KALIP DOLUM ZAMANI'] < Q1 - 1.5*IQR) | 
-                            (gun_verisi['KALIP DOLUM ZAMANI'] > Q3 + 1.5*IQR)).sum()
+            dolum_anomali = ((gun_verisi['KALIP DOLUM ZAMANI'] < alt_dolum) | 
+                            (gun_verisi['KALIP DOLUM ZAMANI'] > ust_dolum)).sum()
             
             toplam_uretim = len(gun_verisi)
             
@@ -386,9 +421,15 @@ class Gorselestirici:
 
 # Test için
 if __name__ == "__main__":
-    # Temizlenmiş veriyi yükle
-    df = pd.read_csv('data/processed/enjeksiyon_temiz.csv')
-    df['TARİH'] = pd.to_datetime(df['TARİH'])
+    from depo import PresDeposu
+    
+    # Temizlenmiş veriyi yükle (veritabanı varsa sadece gerekli sütunlar)
+    depo = PresDeposu()
+    if depo.mevcut_mu():
+        df = depo.baskilari_getir(sutunlar=Gorselestirici.GEREKLI_SUTUNLAR)
+    else:
+        df = pd.read_csv('data/processed/enjeksiyon_temiz.csv')
+        df['TARİH'] = pd.to_datetime(df['TARİH'])
     
     print(f"✅ Temizlenmiş veri yüklendi: {len(df)} satır")
     
@@ -0,0 +1,15 @@
+"""
+İşlem Bağlamı Modülü
+Bu modül analiz adımlarının temizlenmiş veriyi kopyalamadan paylaşmasını
+sağlar (HIZ_ORANI, TOPLAM_CEVRIM gibi türetilmiş sütunlar sadece ekleyen
+adımın görünümünde kalır). Uygulama fırın projesiyle paylaşılan
+ortak/islem_baglami.py'dedir.
+"""
+
+# Depo kökündeki ortak paket için
+try:
+    from . import ortak_yolu
+except ImportError:
+    import ortak_yolu
+
+from ortak.islem_baglami import IslemBaglami, paylasimli_gorunum
@@ -0,0 +1,168 @@
+"""
+İstatistik Motoru Modülü
+Bu modül tüm sayısal sütunların betimleyici istatistiklerini (sayı, ortalama,
+standart sapma, min, çeyrekler, max) tek bir 2B dizi üzerinde vektörel olarak
+hesaplar. Sonuçlar her sütunun içeriğinden türetilen bir sürüm anahtarıyla
+önbelleğe alınır; tek sütun sorgusunda sadece o sütun özetlenir. Temizleme,
+anomali, performans ve görselleştirme adımları aynı sütun için çeyrekleri
+tekrar tekrar hesaplamaz. Bir sütunun verisi
+değiştiğinde anahtarı da değiştiği için önbellek kendiliğinden geçersiz olur.
+"""
+
+import hashlib
+from collections import OrderedDict
+import numpy as np
+import pandas as pd
+
+# Hesaplanan istatistikler (sütun sırası)
+ISTATISTIKLER = ['sayi', 'ortalama', 'std', 'min', 'q1', 'medyan', 'q3', 'max']
+
+class IstatistikMotoru:
+    """
+    Sütun istatistiklerini tek geçişte hesaplayan ve sürüm bazında saklayan sınıf
+    """
+    
+    def __init__(self, onbellek_boyutu=256, blok_bellegi=4 * 1024 * 1024):
+        """
+        Args:
+            onbellek_boyutu (int): Saklanacak en fazla sütun sürümü
+            blok_bellegi (int): Birlikte hesaplanan sütunların float64 bloğu için
+                üst sınır (bayt); büyük verilerde geçici bellek bu sınırda kalır
+        """
+        self.onbellek_boyutu = onbellek_boyutu
+        self.blok_bellegi = blok_bellegi
+        self._onbellek = OrderedDict()
+        self.hesaplama_sayisi = 0
+    
+    @staticmethod
+    def sayisal_sutunlar(df):
+        """DataFrame'deki sayısal (bool olmayan) sütunları döndürür"""
+        return [col for col in df.columns
+                if pd.api.types.is_numeric_dtype(df[col]) and not pd.api.types.is_bool_dtype(df[col])]
+    
+    @staticmethod
+    def _surum(seri):
+        """
+        Sütun değerlerinden sürüm anahtarı üretir
+        
+        NumPy tabanlı sütunlar kopyalanmadan özetlenir; önbellekte bulunan
+        sütunlar için 2B dizi hiç oluşturulmaz.
+        """
+        if isinstance(seri.dtype, np.dtype):
+            degerler = seri.to_numpy()
+        else:
+            # Nullable tam sayılar (Int16, Int32) eksik değerleriyle birlikte
+            degerler = seri.to_numpy(dtype='float64', na_value=np.nan)
+        
+        ozet = hashlib.blake2b(str(degerler.dtype).encode(), digest_size=16)
+        ozet.update(np.ascontiguousarray(degerler).data)
+        return ozet.hexdigest()
+    
+    def istatistikler(self, df, sutunlar=None):
+        """
+        Sayısal sütunların istatistiklerini döndürür (önbellekten veya hesaplayarak)
+        
+        Sadece istenen sütunların sürüm anahtarı üretilir (sütun verisi
+        özetlenir); tek sütunluk sorgular tüm çerçeveyi taramaz.
+        Önbellekte olmayan sütunlar 2B dizi bloklarında birlikte hesaplanır;
+        blok boyutu blok_bellegi ile sınırlıdır. Eksik değerler (NaN) pandas'taki gibi atlanır; std örneklem (ddof=1)
+        standart sapmasıdır, çeyrekler doğrusal interpolasyonla hesaplanır.
+        
+        Args:
+            df (pd.DataFrame): İncelenecek veri
+            sutunlar (list): İstenen sütunlar (None ise tüm sayısal sütunlar)
+        
+        Returns:
+            pd.DataFrame: Satırlar sütun isimleri, sütunlar ISTATISTIKLER
+        """
+        sutunlar = self.sayisal_sutunlar(df) if sutunlar is None else list(sutunlar)
+        anahtarlar = [self._surum(df[col]) for col in sutunlar]
+        
+        eksik = [i for i, anahtar in enumerate(anahtarlar) if anahtar not in self._onbellek]
+        if eksik:
+            blok = max(1, self.blok_bellegi // max(1, 8 * len(df)))
+            for bas in range(0, len(eksik), blok):
+                parca = eksik[bas:bas + blok]
+                dizi = df[[sutunlar[i] for i in parca]].to_numpy(dtype='float64', na_value=np.nan)
+                for i, satir in zip(parca, self._hesapla(dizi)):
+                    self._onbellek[anahtarlar[i]] = satir
+        
+        satirlar = []
+        for anahtar in anahtarlar:
+            self._onbellek.move_to_end(anahtar)
+            satirlar.append(self._onbellek[anahtar])
+        
+        while len(self._onbellek) > self.onbellek_boyutu:
+            self._onbellek.popitem(last=False)
+        
+        return pd.DataFrame(satirlar, index=sutunlar, columns=ISTATISTIKLER, dtype='float64')
+    
+    def _hesapla(self, dizi):
+        """
+        2B dizinin tüm sütunları için istatistikleri tek seferde hesaplar
+        
+        Returns:
+            np.ndarray: (sütun sayısı, len(ISTATISTIKLER)) boyutlu sonuç
+        """
+        self.hesaplama_sayisi += 1
+        
+        sonuc = np.full((dizi.shape[1], len(ISTATISTIKLER)), np.nan)
+        sayi = (~np.isnan(dizi)).sum(axis=0)
+        sonuc[:, 0] = sayi
+        
+        # Tamamen boş sütunlar NaN kalır (NumPy "boş dilim" uyarısı vermesin)
+        dolu = sayi > 0
+        if not dolu.any():
+            return sonuc
+        
+        d = dizi[:, dolu]
+        q1, medyan, q3 = np.nanquantile(d, [0.25, 0.5, 0.75], axis=0)
+        sonuc[dolu, 1] = np.nanmean(d, axis=0)
+        sonuc[dolu, 3] = np.nanmin(d, axis=0)
+        sonuc[dolu, 4] = q1
+        sonuc[dolu, 5] = medyan
+        sonuc[dolu, 6] = q3
+        sonuc[dolu, 7] = np.nanmax(d, axis=0)
+        
+        # Örneklem std en az iki değer gerektirir
+        coklu = sayi > 1
+        if coklu.any():
+            sonuc[coklu, 2] = np.nanstd(dizi[:, coklu], axis=0, ddof=1)
+        
+        return sonuc
+    
+    def sutun(self, df, col):
+        """
+        Tek bir sütunun istatistiklerini döndürür
+        
+        Args:
+            df (pd.DataFrame): İncelenecek veri
+            col (str): Sütun adı
+        
+        Returns:
+            pd.Series: ISTATISTIKLER indeksli değerler
+        """
+        return self.istatistikler(df, [col]).loc[col]
+    
+    def iqr_sinirlari(self, df, col, katsayi=1.5):
+        """
+        IQR yöntemiyle alt/üst aykırı değer sınırlarını döndürür
+        
+        Args:
+            df (pd.DataFrame): İncelenecek veri
+            col (str): Sütun adı
+            katsayi (float): IQR eşik katsayısı
+        
+        Returns:
+            tuple: (Q1, Q3, alt sınır, üst sınır)
+        """
+        ist = self.sutun(df, col)
+        iqr = ist['q3'] - ist['q1']
+        return ist['q1'], ist['q3'], ist['q1'] - katsayi * iqr, ist['q3'] + katsayi * iqr
+    
+    def temizle(self):
+        """Önbelleği boşaltır"""
+        self._onbellek.clear()
+
+# Tüm modüllerin paylaştığı motor
+motor = IstatistikMotoru()
@@ -0,0 +1,192 @@
+"""
+Kalıp Temelleri Modülü
+Bu modül her kalıp (KALIP NO) için parametre çeyreklerini tek bir groupby
+geçişinde hesaplar ve saklar. Kalıplar arasındaki normal farklar (bir
+kalıbın dolum süresinin diğerinden uzun olması gibi) genel sınırlarla
+anomali gibi görünür; kalıp temelleriyle her baskı kendi kalıbının
+sınırlarıyla karşılaştırılır. Sınırlar satırlara kalıp koduyla vektörel
+olarak dağıtılır, kalıplar üzerinde döngü kurulmaz. Temeller diske
+kaydedilir; yeni baskılar geçmiş yeniden hesaplanmadan kontrol edilir.
+"""
+
+import json
+import os
+import numpy as np
+import pandas as pd
+
+# Temellerin varsayılan kayıt yeri
+TEMEL_DOSYASI = 'data/processed/kalip_temelleri.json'
+
+class KalipTemelleri:
+    """
+    Kalıp bazında Q1/Q3 tablosu ve satır bazında sınır araması
+    
+    Baskı sayısı en_az'dan küçük kalıplar ile tabloda olmayan (yeni)
+    kalıplar tüm verinin genel çeyrekleriyle kontrol edilir.
+    """
+    
+    def __init__(self, q1, q3, sayilar, genel_q1, genel_q3, grup_sutunu='KALIP NO'):
+        """
+        Args:
+            q1 (pd.DataFrame): Kalıp x parametre birinci çeyrekler
+            q3 (pd.DataFrame): Kalıp x parametre üçüncü çeyrekler
+            sayilar (pd.Series): Kalıp başına baskı sayısı
+            genel_q1 (pd.Series): Parametre başına genel birinci çeyrek
+            genel_q3 (pd.Series): Parametre başına genel üçüncü çeyrek
+            grup_sutunu (str): Kalıp sütunu
+        """
+        self.q1 = q1
+        self.q3 = q3
+        self.sayilar = sayilar
+        self.genel_q1 = genel_q1
+        self.genel_q3 = genel_q3
+        self.grup_sutunu = grup_sutunu
+    
+    @classmethod
+    def veriden(cls, df, sutunlar, grup_sutunu='KALIP NO', en_az=30):
+        """
+        Temelleri temiz veriden tek groupby geçişinde hesaplar
+        
+        Args:
+            df (pd.DataFrame): Temizlenmiş baskılar
+            sutunlar (list): Temeli tutulacak parametreler
+            grup_sutunu (str): Kalıp sütunu
+            en_az (int): Kendi temeli tutulacak kalıbın en az baskı sayısı
+        
+        Returns:
+            KalipTemelleri: Hesaplanan temeller
+        """
+        sutunlar = [col for col in sutunlar if col in df.columns]
+        genel = df[sutunlar].quantile([0.25, 0.75])
+        
+        if grup_sutunu in df.columns:
+            gruplar = df.groupby(grup_sutunu, observed=True, sort=True)[sutunlar]
+            ceyrekler = gruplar.quantile([0.25, 0.75])
+            sayilar = gruplar.size()
+            yeterli = sayilar.index[sayilar >= en_az]
+            q1 = ceyrekler.xs(0.25, level=-1).loc[yeterli]
+            q3 = ceyrekler.xs(0.75, level=-1).loc[yeterli]
+            sayilar = sayilar.loc[yeterli]
+        else:
+            q1 = q3 = pd.DataFrame(columns=sutunlar, dtype='float64')
+            sayilar = pd.Series(dtype='int64')
+        
+        return cls(q1.astype('float64'), q3.astype('float64'), sayilar.astype('int64'),
+                   genel.loc[0.25].astype('float64'), genel.loc[0.75].astype('float64'), grup_sutunu)
+    
+    @property
+    def kaliplar(self):
+        """Kendi temeli olan kalıplar"""
+        return list(self.q1.index)
+    
+    def _satir_indeksi(self, df):
+        """Her satırın temel tablosundaki konumu; genel temel için son konum (len)"""
+        if self.grup_sutunu not in df.columns:
+            return np.full(len(df), len(self.q1), dtype=np.intp)
+        konum = self.q1.index.get_indexer(df[self.grup_sutunu])
+        return np.where(konum < 0, len(self.q1), konum)
+    
+    def sinir_dizileri(self, df, col, katsayi=1.5):
+        """
+        Her satırın kendi kalıbının IQR sınırları
+        
+        Args:
+            df (pd.DataFrame): Kontrol edilecek baskılar
+            col (str): Parametre
+            katsayi (float): IQR eşik katsayısı
+        
+        Returns:
+            tuple: (alt sınırlar, üst sınırlar) satır başına NumPy dizileri
+        """
+        q1 = np.append(self.q1[col].to_numpy(), self.genel_q1[col])
+        q3 = np.append(self.q3[col].to_numpy(), self.genel_q3[col])
+        iqr = q3 - q1
+        konum = self._satir_indeksi(df)
+        return (q1 - katsayi * iqr)[konum], (q3 + katsayi * iqr)[konum]
+    
+    def maske(self, df, col, katsayi=1.5):
+        """
+        Kendi kalıbının sınırları dışında kalan baskılar
+        
+        Returns:
+            np.ndarray: bool maske (eksik değerler anomali değildir)
+        """
+        alt, ust = self.sinir_dizileri(df, col, katsayi)
+        degerler = df[col].to_numpy(dtype='float64', na_value=np.nan)
+        return (degerler < alt) | (degerler > ust)
+    
+    def disarida_kalanlar(self, df, sutunlar, katsayi=1.5):
+        """
+        Herhangi bir parametrede kendi kalıbının sınırları dışında kalan baskılar
+        
+        Args:
+            df (pd.DataFrame): Kontrol edilecek baskılar
+            sutunlar (list): Kontrol edilecek parametreler (temeli olmayanlar atlanır)
+            katsayi (float): IQR eşik katsayısı
+        
+        Returns:
+            np.ndarray: bool maske
+        """
+        disarida = np.zeros(len(df), dtype=bool)
+        for col in sutunlar:
+            if col in df.columns and col in self.q1.columns:
+                disarida |= self.maske(df, col, katsayi)
+        return disarida
+    
+    def sinir_tablosu(self, col, katsayi=1.5):
+        """
+        Kalıp başına sınır tablosu (rapor için)
+        
+        Returns:
+            pd.DataFrame: Kalıp indeksli Q1, Q3, Alt Sınır, Üst Sınır, Baskı sütunları
+        """
+        q1, q3 = self.q1[col], self.q3[col]
+        iqr = q3 - q1
+        return pd.DataFrame({
+            'Q1': q1, 'Q3': q3,
+            'Alt Sınır': q1 - katsayi * iqr, 'Üst Sınır': q3 + katsayi * iqr,
+            'Baskı': self.sayilar
+        })
+    
+    def kaydet(self, yol=TEMEL_DOSYASI):
+        """Temelleri JSON dosyasına yazar"""
+        klasor = os.path.dirname(yol)
+        if klasor:
+            os.makedirs(klasor, exist_ok=True)
+        
+        veri = {
+            'grup_sutunu': self.grup_sutunu,
+            'kaliplar': [k.item() if hasattr(k, 'item') else k for k in self.q1.index],
+            'sutunlar': list(self.q1.columns),
+            'q1': self.q1.to_numpy().tolist(),
+            'q3': self.q3.to_numpy().tolist(),
+            'sayilar': self.sayilar.to_numpy().tolist(),
+            'genel_q1': self.genel_q1.to_dict(),
+            'genel_q3': self.genel_q3.to_dict()
+        }
+        with open(yol, 'w', encoding='utf-8') as f:
+            json.dump(veri, f, ensure_ascii=False)
+        
+        print(f"💾 {len(self.q1)} kalıp temeli '{yol}' dosyasına kaydedildi")
+    
+    @classmethod
+    def yukle(cls, yol=TEMEL_DOSYASI):
+        """
+        JSON dosyasından temelleri okur
+        
+        Returns:
+            KalipTemelleri: Okunan temeller (dosya yoksa None)
+        """
+        if not os.path.exists(yol):
+            return None
+        
+        with open(yol, encoding='utf-8') as f:
+            veri = json.load(f)
+        
+        indeks = pd.Index(veri['kaliplar'])
+        sutunlar = veri['sutunlar']
+        q1 = pd.DataFrame(veri['q1'], index=indeks, columns=sutunlar, dtype='float64')
+        q3 = pd.DataFrame(veri['q3'], index=indeks, columns=sutunlar, dtype='float64')
+        return cls(q1, q3, pd.Series(veri['sayilar'], index=indeks, dtype='int64'),
+                   pd.Series(veri['genel_q1'], dtype='float64'), pd.Series(veri['genel_q3'], dtype='float64'),
+                   veri['grup_sutunu'])
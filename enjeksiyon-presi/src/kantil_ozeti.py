@@ -0,0 +1,22 @@
+"""
+Kantil Özeti Modülü
+Bu modül KLL kantil özetlerini makine kodu bazında tutar. Canlı takip, veri
+sunucusu ve çoklu makine (filo) modu sınırları bu özetlerden alır. Özetlerin
+uygulaması fırın projesiyle paylaşılan ortak/kantil_ozeti.py'dedir.
+"""
+
+# Depo kökündeki ortak paket için
+try:
+    from . import ortak_yolu
+except ImportError:
+    import ortak_yolu
+
+from ortak.kantil_ozeti import KLLOzeti, VARSAYILAN_GRUP, OZET_DOSYASI
+from ortak.kantil_ozeti import KantilOzetleri as _KantilOzetleri
+
+class KantilOzetleri(_KantilOzetleri):
+    """
+    Makine (grup) ve sütun bazında KLL özetleri
+    """
+    
+    GRUP_SUTUNU = 'MAKİNE KODU'
@@ -0,0 +1,164 @@
+"""
+Önbellek Modülü
+Bu modül Excel'den ayrıştırılan ve temizlenen verileri sütunlu formatta (Parquet)
+diskte saklar. Kaynak dosya değişmediği sürece sonraki çalıştırmalar Excel'i
+yeniden ayrıştırmaz; ham veri ve temizleyici değişmediği sürece veriyi yeniden
+temizlemez. Excel önbelleği fırın projesiyle paylaşılan ortak/onbellek.py'dedir.
+"""
+
+import os
+import json
+import time
+import hashlib
+import pandas as pd
+
+# Depo kökündeki ortak paket için
+try:
+    from . import ortak_yolu
+except ImportError:
+    import ortak_yolu
+
+from ortak.onbellek import ExcelOnbellek
+
+class TemizlikOnbellegi(ExcelOnbellek):
+    """
+    Temizlenmiş DataFrame'i ve temizlik raporunu birlikte saklayan disk önbelleği
+    
+    Temizlik ham veriye ve temizleyicinin koduna/ayarlarına göre belirlidir;
+    anahtar bu üçünden oluşur. Aynı ham veri aynı temizleyiciyle tekrar
+    işlenirken temizlik adımı tamamen atlanabilir.
+    
+    Anahtar: ham verinin parmak izi + temizleyici sürümü + yapılandırma
+    Tahliye: ExcelOnbellek ile aynı (LRU, kayıt sayısı ve boyut sınırı)
+    """
+    
+    INDEKS_DOSYASI = 'temizlik_indeks.json'
+    KAYNAK = 'temizlik'
+    
+    # Temizlenmiş çıktıların (CSV, Parquet, veritabanı) hangi anahtardan üretildiği
+    CIKTI_ISARETI = 'data/processed/temizlik_anahtari.txt'
+    
+    def __init__(self, onbellek_dizini='data/cache/', max_boyut_mb=500, max_kayit=5):
+        super().__init__(onbellek_dizini, max_boyut_mb, max_kayit)
+    
+    @staticmethod
+    def veri_parmak_izi(df):
+        """
+        DataFrame içeriğinin özetini (sütunlar, tipler ve satır hash'leri) hesaplar
+        
+        Args:
+            df (pd.DataFrame): Ham veri
+        
+        Returns:
+            str: Hex formatında parmak izi
+        """
+        ozet = hashlib.blake2b(digest_size=16)
+        ozet.update('|'.join(f'{col}:{tip}' for col, tip in df.dtypes.items()).encode('utf-8'))
+        ozet.update(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes())
+        return ozet.hexdigest()
+    
+    def anahtar_olustur(self, df, surum, yapilandirma):
+        """
+        Ham veri ve temizleyici için önbellek anahtarını oluşturur
+        
+        Args:
+            df (pd.DataFrame): Ham veri
+            surum (str): Temizleyici sürümü
+            yapilandirma (dict): Temizleyici ayarları (JSON'a çevrilebilir)
+        
+        Returns:
+            str: Önbellek anahtarı
+        """
+        parcalar = [
+            self.veri_parmak_izi(df),
+            surum,
+            json.dumps(yapilandirma, sort_keys=True, ensure_ascii=False, default=str)
+        ]
+        return hashlib.blake2b('|'.join(parcalar).encode('utf-8'), digest_size=16).hexdigest()
+    
+    def getir(self, anahtar):
+        """
+        Anahtara ait temizlenmiş veriyi ve raporu döndürür
+        
+        Args:
+            anahtar (str): anahtar_olustur() çıktısı
+        
+        Returns:
+            tuple: (pd.DataFrame, dict) veya kayıt yoksa None
+        """
+        kayit = self._indeks_oku().get(anahtar)
+        
+        if kayit is None:
+            return None
+        
+        try:
+            df = pd.read_parquet(os.path.join(self.onbellek_dizini, kayit['dosya']))
+        except Exception:
+            with self._indeks_kilidi():
+                indeks = self._indeks_oku()
+                indeks.pop(anahtar, None)
+                self._indeks_yaz(indeks)
+            return None
+        
+        self._erisimi_guncelle(anahtar)
+        return df, kayit['rapor']
+    
+    def kaydet(self, anahtar, df, rapor):
+        """
+        Temizlenmiş veriyi ve raporu önbelleğe yazar
+        
+        Args:
+            anahtar (str): anahtar_olustur() çıktısı
+            df (pd.DataFrame): Temizlenmiş veri
+            rapor (dict): Temizlik raporu
+        """
+        os.makedirs(self.onbellek_dizini, exist_ok=True)
+        hedef = os.path.join(self.onbellek_dizini, f'temiz_{anahtar}.parquet')
+        df.to_parquet(hedef)
+        
+        # Rapordaki NumPy sayıları JSON'a yazılabilir tiplere çevrilir
+        rapor = json.loads(json.dumps(rapor, ensure_ascii=False,
+                                      default=lambda o: o.item() if hasattr(o, 'item') else str(o)))
+        
+        with self._indeks_kilidi():
+            indeks = self._indeks_oku()
+            indeks[anahtar] = {
+                'kaynak': self.KAYNAK,
+                'dosya': os.path.basename(hedef),
+                'format': 'parquet',
+                'boyut_bayt': os.path.getsize(hedef),
+                'son_erisim': time.time(),
+                'rapor': rapor
+            }
+            
+            self._tahliye_et(indeks)
+            self._indeks_yaz(indeks)
+    
+    def ciktilar_guncel_mi(self, anahtar, dosyalar=()):
+        """
+        Temizlenmiş çıktı dosyaları bu anahtardan mı üretildi
+        
+        Args:
+            anahtar (str): Önbellek anahtarı
+            dosyalar (list): Var olması gereken çıktı dosyaları
+        
+        Returns:
+            bool: İşaret aynı anahtarı gösteriyor ve dosyaların hepsi varsa True
+        """
+        try:
+            with open(self.CIKTI_ISARETI, 'r', encoding='utf-8') as f:
+                isaret = f.read().strip()
+        except FileNotFoundError:
+            return False
+        return isaret == anahtar and all(os.path.exists(yol) for yol in dosyalar)
+    
+    def ciktilari_isaretle(self, anahtar):
+        """Temizlenmiş çıktıların bu anahtardan üretildiğini kaydeder"""
+        os.makedirs(os.path.dirname(self.CIKTI_ISARETI), exist_ok=True)
+        with open(self.CIKTI_ISARETI, 'w', encoding='utf-8') as f:
+            f.write(anahtar)
+    
+    def isareti_kaldir(self):
+        """Çıktılar başka bir yoldan (artımlı yükleme, canlı takip) değişince işareti siler"""
+        if os.path.exists(self.CIKTI_ISARETI):
+            os.remove(self.CIKTI_ISARETI)
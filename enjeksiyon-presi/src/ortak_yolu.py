@@ -0,0 +1,16 @@
+"""
+Ortak Yol Modülü
+Pres ve fırın projelerinin paylaştığı modüller depo kökündeki ortak/
+paketindedir. Bu modül içe aktarılınca depo kökü sys.path'e eklenir; böylece
+modüller hem paket olarak (src.x) hem de betik olarak (python src/x.py)
+çalışırken ortak paketi bulunur.
+"""
+
+import os
+import sys
+
+# src/ klasörünün iki üstü (sembolik bağlantılar çözülerek)
+DEPO_KOKU = os.path.dirname(os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+
+if DEPO_KOKU not in sys.path:
+    sys.path.append(DEPO_KOKU)
@@ -11,19 +11,67 @@ from datetime import datetime
 import warnings
 warnings.filterwarnings('ignore')
 
+try:
+    from .veri_kumesi import sutunlari_filtrele
+    from .istatistik_motoru import motor
+    from .islem_baglami import paylasimli_gorunum
+except ImportError:
+    from veri_kumesi import sutunlari_filtrele
+    from istatistik_motoru import motor
+    from islem_baglami import paylasimli_gorunum
+
 class PerformansAnalizci:
     """
     Makine performans analizlerini gerçekleştiren sınıf
     """
     
-    def __init__(self, df):
+    # Analizde kullanılan sütunlar
+    GEREKLI_SUTUNLAR = [
+        'TARİH', 'PİSTON SÜRTÜNME BASINCI',
+        '3. FAZ BASINC YÜKSELME ZAMANI', 'KALIP DOLUM ZAMANI'
+    ]
+    
+    def __init__(self, df, ozetler=None):
         """
         Args:
             df (pd.DataFrame): Analiz edilecek DataFrame
+            ozetler (KantilOzetleri): Verilirse kalite metriklerindeki IQR
+                sınırları bu kantil özetlerinden alınır (akış / filo modu)
         """
-        self.df = df.copy()
+        self.df = paylasimli_gorunum(df)
+        self.ozetler = ozetler
         self.performans_raporu = {}
         
+    @classmethod
+    def gerekli_sutunlar(cls, mevcut):
+        """
+        Analizin kullandığı sütunları döndürür
+        
+        Args:
+            mevcut (list): Veri kümesindeki sütunlar
+        
+        Returns:
+            list: Yüklenecek sütunlar
+        """
+        return sutunlari_filtrele(mevcut, cls.GEREKLI_SUTUNLAR)
+    
+    @classmethod
+    def veri_kumesinden(cls, kume, ozetler=None):
+        """
+        Veri kümesinden sadece gerekli sütunları yükleyerek nesne oluşturur
+        
+        Args:
+            kume (TembelVeriKumesi): Temizlenmiş veri kümesi
+            ozetler (KantilOzetleri): IQR sınırları için kantil özetleri
+        """
+        return cls(kume.sec(cls.gerekli_sutunlar(kume.sutunlar)), ozetler)
+    
+    def _iqr_sinirlari(self, col, katsayi=1.5):
+        """IQR sınırları: özet varsa kantil özetinden, yoksa kesin çeyreklerden"""
+        if self.ozetler is not None and self.ozetler.ozet(col) is not None:
+            return self.ozetler.iqr_sinirlari(col, katsayi)
+        return motor.iqr_sinirlari(self.df, col, katsayi)
+    
     def cevrim_suresi_analizi(self):
         """
         Çevrim süresi (cycle time) analizi yapar
@@ -119,8 +167,9 @@ class PerformansAnalizci:
         else:
             print(f"\n   ✅ İYİ: Verimlilik kabul edilebilir seviyede.")
         
-        # Günlük ortalama üretim
-        gunluk_uretim = self.df.groupby(self.df['TARİH'].dt.date).size()
+        # Günlük ortalama üretim (satır başına date nesnesi üretmeden gruplanır)
+        gunluk_uretim = self.df.groupby(self.df['TARİH'].dt.normalize()).size()
+        gunluk_uretim.index = gunluk_uretim.index.date
         
         print(f"\n📈 Günlük Üretim:")
         print(f"   Ortalama: {gunluk_uretim.mean():.0f} ürün/gün")
@@ -148,18 +197,14 @@ class PerformansAnalizci:
         toplam_uretim = len(self.df)
         
         # Basınç anomalileri
-        Q1_basinc = self.df['PİSTON SÜRTÜNME BASINCI'].quantile(0.25)
-        Q3_basinc = self.df['PİSTON SÜRTÜNME BASINCI'].quantile(0.75)
-        IQR_basinc = Q3_basinc - Q1_basinc
-        basinc_anomali = ((self.df['PİSTON SÜRTÜNME BASINCI'] < Q1_basinc - 1.5*IQR_basinc) | 
-                         (self.df['PİSTON SÜRTÜNME BASINCI'] > Q3_basinc + 1.5*IQR_basinc)).sum()
+        _, _, alt_basinc, ust_basinc = self._iqr_sinirlari('PİSTON SÜRTÜNME BASINCI')
+        basinc_anomali = ((self.df['PİSTON SÜRTÜNME BASINCI'] < alt_basinc) | 
+                         (self.df['PİSTON SÜRTÜNME BASINCI'] > ust_basinc)).sum()
         
         # Dolum anomalileri
-        Q1_dolum = self.df['KALIP DOLUM ZAMANI'].quantile(0.25)
-        Q3_dolum = self.df['KALIP DOLUM ZAMANI'].quantile(0.75)
-        IQR_dolum = Q3_dolum - Q1_dolum
-        dolum_anomali = ((self.df['KALIP DOLUM ZAMANI'] < Q1_dolum - 1.5*IQR_dolum) | 
-                        (self.df['KALIP DOLUM ZAMANI'] > Q3_dolum + 1.5*IQR_dolum)).sum()
+        _, _, alt_dolum, ust_dolum = self._iqr_sinirlari('KALIP DOLUM ZAMANI')
+        dolum_anomali = ((self.df['KALIP DOLUM ZAMANI'] < alt_dolum) | 
+                        (self.df['KALIP DOLUM ZAMANI'] > ust_dolum)).sum()
         
         # Toplam kalite sorunlu ürün
         kalite_sorunlu = basinc_anomali + dolum_anomali
@@ -375,9 +420,15 @@ class PerformansAnalizci:
 
 # Test için
 if __name__ == "__main__":
-    # Temizlenmiş veriyi yükle
-    df = pd.read_csv('data/processed/enjeksiyon_temiz.csv')
-    df['TARİH'] = pd.to_datetime(df['TARİH'])
+    from depo import PresDeposu
+    
+    # Temizlenmiş veriyi yükle (veritabanı varsa sadece gerekli sütunlar)
+    depo = PresDeposu()
+    if depo.mevcut_mu():
+        df = depo.baskilari_getir(sutunlar=PerformansAnalizci.GEREKLI_SUTUNLAR)
+    else:
+        df = pd.read_csv('data/processed/enjeksiyon_temiz.csv')
+        df['TARİH'] = pd.to_datetime(df['TARİH'])
     
     print(f"✅ Temizlenmiş veri yüklendi: {len(df)} satır")
     
@@ -0,0 +1,268 @@
+"""
+Temizlik Kuralları Modülü
+Bu modül veri kalitesi kontrollerini bildirimsel kurallar olarak tanımlar.
+Kurallar veri üzerinde bir kez derlenir (sütunlar ve sınırlar çözülür) ve
+tek bir geçişte, satır blokları halinde birlikte değerlendirilir: her blok
+önbellekteyken tüm kurallar ona uygulanır. Yeni bir kural eklemek veriyi
+yeniden taramaz. Sonuç, kural/sütun bazında ihlal sayıları ve her satır
+için hangi kuralları ihlal ettiğini tutan bit maskesidir.
+
+Kural yazımı ("<sütunlar> <koşul>", koşul geçerli değerleri tanımlar):
+    "SPESİFİK BASINÇ BAR > 0"
+    "KALIP DOLUM ZAMANI != 0"
+    "BİRİNCİ FAZ HIZI, İKİNCİ FAZ HIZI != 0"
+    "'ISI' in [-100, 2000]"      # adında ISI geçen tüm sayısal sütunlar
+    "* >= 0"                     # tüm sayısal sütunlar
+    "* iqr 1.5"                  # IQR sınırları içinde (Q1 - 1.5*IQR, Q3 + 1.5*IQR)
+"""
+
+import re
+import numpy as np
+
+try:
+    from .istatistik_motoru import motor
+except ImportError:
+    from istatistik_motoru import motor
+
+# Kural metnini seçici / işlem / değer olarak ayırır
+KURAL_DESENI = re.compile(r'^(?P<secici>.+?)\s+(?P<islem>>=|<=|!=|==|>|<|in|iqr)\s+(?P<deger>.+)$')
+
+# Bir blokta işlenen satır sayısı (blok sütunları işlemci önbelleğinde kalır)
+BLOK_SATIR = 65536
+
+class Kural:
+    """
+    Tek bir veri kalitesi kuralı
+    
+    Sütun seçici açık sütun adları listesi, '*' (tüm sayısal sütunlar) veya
+    tırnak içinde bir parça ('ISI': adında bu parça geçen sayısal sütunlar)
+    olabilir. Koşul geçerli değerleri tanımlar; eksik (NaN) değerler ihlal
+    sayılmaz.
+    """
+    
+    ISLEMLER = ('>', '>=', '<', '<=', '!=', '==', 'in', 'iqr')
+    
+    def __init__(self, ad, secici, islem, deger):
+        """
+        Args:
+            ad (str): Raporlarda kullanılacak kural adı
+            secici (list | str): Sütun adları, '*' veya "'parça'"
+            islem (str): Kural.ISLEMLER'den biri
+            deger: Karşılaştırma değeri; 'in' için (alt, üst), 'iqr' için katsayı
+        """
+        if islem not in self.ISLEMLER:
+            raise ValueError(f"Bilinmeyen kural işlemi: {islem}")
+        
+        self.ad = ad
+        self.secici = secici
+        self.islem = islem
+        self.deger = deger
+    
+    @classmethod
+    def metinden(cls, metin, ad=None):
+        """
+        Kural metnini ayrıştırır
+        
+        Args:
+            metin (str): Ör. "SPESİFİK BASINÇ BAR > 0" veya "'ISI' in [-100, 2000]"
+            ad (str): Kural adı (None ise metnin kendisi)
+        
+        Returns:
+            Kural: Ayrıştırılmış kural
+        """
+        eslesme = KURAL_DESENI.match(metin.strip())
+        if eslesme is None:
+            raise ValueError(f"Kural ayrıştırılamadı: {metin}")
+        
+        secici = eslesme['secici'].strip()
+        if secici != '*' and not (secici.startswith("'") and secici.endswith("'")):
+            secici = [col.strip() for col in secici.split(',')]
+        
+        islem = eslesme['islem']
+        deger = eslesme['deger'].strip()
+        if islem == 'in':
+            alt, ust = deger.strip('[]').split(',')
+            deger = (float(alt), float(ust))
+        else:
+            deger = float(deger)
+        
+        return cls(ad or metin.strip(), secici, islem, deger)
+    
+    def sutunlari_sec(self, df):
+        """
+        Kuralın uygulanacağı sayısal sütunlar
+        
+        Args:
+            df (pd.DataFrame): Veri
+        
+        Returns:
+            list: Sütun adları (veride olmayanlar ve sayısal olmayanlar atlanır)
+        """
+        sayisal = list(df.select_dtypes(include=[np.number]).columns)
+        
+        if self.secici == '*':
+            return sayisal
+        if isinstance(self.secici, str):
+            parca = self.secici.strip("'").upper()
+            return [col for col in sayisal if parca in col.upper()]
+        return [col for col in self.secici if col in sayisal]
+    
+    def sinirlar(self, df, col):
+        """
+        Kuralı sütun için (işlem, a, b) ihlal kontrolüne çevirir
+        
+        IQR kuralının sınırları istatistik motorundan (tek geçişte
+        hesaplanmış çeyreklerden) alınır.
+        
+        Returns:
+            tuple: (ihlal işlemi, a, b)
+        """
+        if self.islem == 'iqr':
+            _, _, alt, ust = motor.iqr_sinirlari(df, col, self.deger)
+            return 'disinda', np.float64(alt), np.float64(ust)
+        if self.islem == 'in':
+            return 'disinda', np.float64(self.deger[0]), np.float64(self.deger[1])
+        return self.islem, np.float64(self.deger), None
+    
+    def __repr__(self):
+        return f"Kural({self.ad!r})"
+
+def _ihlal(degerler, islem, a, b):
+    """Bloktaki değerlerden kuralı ihlal edenlerin maskesi (NaN ihlal değildir)"""
+    if islem == 'disinda':
+        return (degerler < a) | (degerler > b)
+    if islem == '>':
+        return degerler <= a
+    if islem == '>=':
+        return degerler < a
+    if islem == '<':
+        return degerler >= a
+    if islem == '<=':
+        return degerler > a
+    if islem == '!=':
+        return degerler == a
+    return (degerler != a) & ~np.isnan(degerler)
+
+def _dizi(seri):
+    """Sütunun NumPy dizisi; nullable tamsayılar (Int16, Int32) NaN'lı float64 olur"""
+    if isinstance(seri.dtype, np.dtype):
+        return seri.to_numpy()
+    return seri.to_numpy(dtype='float64', na_value=np.nan)
+
+class KuralSonucu:
+    """
+    Kuralların tek geçişte değerlendirilmesinin sonucu
+    """
+    
+    def __init__(self, kurallar, sayilar, bitler):
+        """
+        Args:
+            kurallar (list): Kural adları (i. kural bit maskesinin i. biti)
+            sayilar (dict): Kural adı -> {sütun: ihlal sayısı}
+            bitler (np.ndarray): Satır başına ihlal edilen kuralların bit maskesi
+        """
+        self.kurallar = kurallar
+        self.sayilar = sayilar
+        self.bitler = bitler
+    
+    def maske(self, ad):
+        """
+        Kuralı ihlal eden satırların maskesi
+        
+        Args:
+            ad (str): Kural adı
+        
+        Returns:
+            np.ndarray: bool maske
+        """
+        bit = self.bitler.dtype.type(1) << self.bitler.dtype.type(self.kurallar.index(ad))
+        return (self.bitler & bit) != 0
+    
+    def temiz_satirlar(self):
+        """Hiçbir kuralı ihlal etmeyen satırların maskesi"""
+        return self.bitler == 0
+    
+    def ozet(self):
+        """
+        JSON'a yazılabilir özet
+        
+        Returns:
+            dict: Kural adı -> {'satir': ihlal eden satır, 'sutunlar': {sütun: sayı}}
+        """
+        return {
+            ad: {
+                'satir': int(np.count_nonzero(self.maske(ad))),
+                'sutunlar': {col: sayi for col, sayi in self.sayilar[ad].items() if sayi > 0}
+            }
+            for ad in self.kurallar
+        }
+
+class KuralMotoru:
+    """
+    Kural listesini derleyip veriyi tek geçişte kontrol eden motor
+    """
+    
+    def __init__(self, kurallar, blok_satir=BLOK_SATIR):
+        """
+        Args:
+            kurallar (list): Kural nesneleri veya kural metinleri
+            blok_satir (int): Bir blokta işlenecek satır sayısı
+        """
+        self.kurallar = [k if isinstance(k, Kural) else Kural.metinden(k) for k in kurallar]
+        if len(self.kurallar) > 64:
+            raise ValueError("En fazla 64 kural desteklenir (bit maskesi uint64)")
+        if len({k.ad for k in self.kurallar}) != len(self.kurallar):
+            raise ValueError("Kural adları benzersiz olmalı")
+        self.blok_satir = blok_satir
+    
+    def _bit_tipi(self):
+        """Kural sayısına yeten en küçük işaretsiz tamsayı tipi"""
+        for tip in (np.uint8, np.uint16, np.uint32, np.uint64):
+            if len(self.kurallar) <= np.iinfo(tip).bits:
+                return tip
+    
+    def derle(self, df):
+        """
+        Kuralları veri üzerinde çözer
+        
+        Returns:
+            list: (kural no, sütun, işlem, a, b) kontrolleri
+        """
+        kontroller = []
+        for no, kural in enumerate(self.kurallar):
+            for col in kural.sutunlari_sec(df):
+                kontroller.append((no, col, *kural.sinirlar(df, col)))
+        return kontroller
+    
+    def uygula(self, df):
+        """
+        Tüm kuralları veri üzerinde tek geçişte değerlendirir
+        
+        Args:
+            df (pd.DataFrame): Kontrol edilecek veri
+        
+        Returns:
+            KuralSonucu: İhlal sayıları ve satır bit maskesi
+        """
+        kontroller = self.derle(df)
+        tip = self._bit_tipi()
+        bitler = np.zeros(len(df), dtype=tip)
+        sayilar = np.zeros(len(kontroller), dtype=np.int64)
+        
+        # Sütun dizileri bir kez alınır (sayısal sütunlarda kopyasız)
+        diziler = {col: _dizi(df[col]) for col in {k[1] for k in kontroller}}
+        
+        for bas in range(0, len(df), self.blok_satir):
+            son = min(bas + self.blok_satir, len(df))
+            blok_bitleri = bitler[bas:son]
+            
+            for i, (no, col, islem, a, b) in enumerate(kontroller):
+                ihlal = _ihlal(diziler[col][bas:son], islem, a, b)
+                sayilar[i] += np.count_nonzero(ihlal)
+                np.bitwise_or(blok_bitleri, tip(1) << tip(no), out=blok_bitleri, where=ihlal)
+        
+        sonuc = {kural.ad: {} for kural in self.kurallar}
+        for (no, col, *_), sayi in zip(kontroller, sayilar):
+            sonuc[self.kurallar[no].ad][col] = int(sayi)
+        
+        return KuralSonucu([kural.ad for kural in self.kurallar], sonuc, bitler)
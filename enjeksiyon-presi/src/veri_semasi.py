@@ -0,0 +1,74 @@
+"""
+Veri Şeması Modülü
+Bu modül enjeksiyon presi verileri için kompakt veri tiplerini tanımlar.
+Sayaçlar küçük tam sayı, makine kodu kategorik tutulur. Sensör okumaları
+float64 kalır: float32 yuvarlaması IQR sınırlarını tam sınırda duran değerlerin
+(ör. İKİNCİ FAZ HIZI 3.37) öbür tarafına taşıyıp anomali sayılarını değiştirir.
+"""
+
+import pandas as pd
+
+# Sensör okumaları (anomali sınırları bu değerlerle karşılaştırılır; tam hassasiyet)
+SENSOR_SUTUNLARI = [
+    'BİRİNCİ FAZ HIZI', 'PİSTON SÜRTÜNME BASINCI', 'İKİNCİ FAZ HIZI',
+    'İKİNCİ FAZ MESAFE', '3. FAZ BASINC YÜKSELME ZAMANI', '3. FAZ BASINCI',
+    'TOPUK BOYU', 'KALIP DOLUM ZAMANI', 'SPESİFİK BASINÇ BAR'
+]
+
+# Sütun -> hedef veri tipi (eksik değer olabileceği için nullable tam sayılar)
+PRES_SEMASI = {
+    'KALIP NO': 'Int16',
+    'BASKI NO': 'Int32',
+    'MAKİNE KODU': 'category',
+    **{col: 'float64' for col in SENSOR_SUTUNLARI}
+}
+
+def bellek_kullanimi(df):
+    """
+    DataFrame'in bellekte kapladığı alanı hesaplar
+    
+    Args:
+        df (pd.DataFrame): İncelenecek DataFrame
+    
+    Returns:
+        float: Bellek kullanımı (MB)
+    """
+    return df.memory_usage(deep=True).sum() / (1024 * 1024)
+
+def semayi_uygula(df, rapor=True):
+    """
+    Kompakt şemayı DataFrame'e uygular
+    
+    Şemada olmayan sütunlara dokunulmaz. Metin içeren sütunlar (ör. henüz
+    silinmemiş başlık satırı) önce sayıya çevrilir, çevrilemeyenler NaN olur.
+    Çağıranın DataFrame'i değişmez; dönüşümler sığ bir kopyaya yazılır.
+    
+    Args:
+        df (pd.DataFrame): Dönüştürülecek DataFrame
+        rapor (bool): True ise önce/sonra bellek kullanımını yazdır
+    
+    Returns:
+        pd.DataFrame: Kompakt tipli DataFrame
+    """
+    onceki_mb = bellek_kullanimi(df) if rapor else None
+    
+    # Sütun atamaları çağıranın çerçevesine yansımasın (veri kopyalanmaz)
+    df = df.copy(deep=False)
+    
+    for col, tip in PRES_SEMASI.items():
+        if col not in df.columns or df[col].dtype == tip:
+            continue
+        
+        if tip == 'category':
+            # Tamamen boş sütun (ör. doldurulmamış MAKİNE KODU) olduğu gibi kalır
+            if not df[col].isna().all():
+                df[col] = df[col].astype('category')
+        else:
+            df[col] = pd.to_numeric(df[col], errors='coerce').astype(tip)
+    
+    if rapor:
+        sonraki_mb = bellek_kullanimi(df)
+        print(f"\n🗜️  Bellek: {onceki_mb:.2f} MB → {sonraki_mb:.2f} MB "
+              f"({(1 - sonraki_mb / onceki_mb) * 100 if onceki_mb else 0:.0f}% azaldı)")
+    
+    return df
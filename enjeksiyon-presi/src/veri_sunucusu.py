@@ -0,0 +1,74 @@
+"""
+Veri Sunucusu Modülü
+Bu modül pres baskılarını ağ üzerinden alan veri sunucusunu (ortak/
+veri_sunucusu.py, fırın projesiyle paylaşılır) canlı takibin parti
+kontrolüne bağlar.
+
+Protokol (her satır bir kayıt):
+    {"TARİH": "2025-01-07 08:00:00", "KALIP NO": 3, "BASKI NO": 1201, ...}
+    veya CSV: bağlantının ilk CSV satırı başlık, sonrakiler kayıt
+"""
+
+import asyncio
+
+# Depo kökündeki ortak paket için
+try:
+    from . import ortak_yolu
+except ImportError:
+    import ortak_yolu
+
+from ortak.veri_sunucusu import SutunTamponu, satiri_coz, VeriSunucusu, tekrar_oynat
+
+try:
+    from .canli_takip import CanliTakip
+except ImportError:
+    from canli_takip import CanliTakip
+
+
+# Test için
+if __name__ == "__main__":
+    import os
+    import sys
+    import argparse
+    from veri_kumesi import TembelVeriKumesi
+    
+    parser = argparse.ArgumentParser(description='Pres telemetri sunucusu ve test istemcisi')
+    alt = parser.add_subparsers(dest='komut', required=True)
+    
+    p_sunucu = alt.add_parser('sunucu', help='Sunucuyu başlat')
+    p_sunucu.add_argument('--port', type=int, default=9009)
+    p_sunucu.add_argument('--udp-port', type=int)
+    p_sunucu.add_argument('--parti', type=int, default=1000)
+    
+    p_oynat = alt.add_parser('oynat', help='CSV kayıtlarını sunucuya gönder')
+    p_oynat.add_argument('dosya', nargs='?', default='data/processed/enjeksiyon_temiz.csv')
+    p_oynat.add_argument('--port', type=int, default=9009)
+    p_oynat.add_argument('--hiz', type=float, help='Saniyedeki kayıt sayısı')
+    p_oynat.add_argument('--baglanti', type=int, default=4)
+    p_oynat.add_argument('--bicim', choices=['json', 'csv'], default='json')
+    
+    args = parser.parse_args()
+    
+    if args.komut == 'oynat':
+        asyncio.run(tekrar_oynat(args.dosya, port=args.port, hiz=args.hiz,
+                                 baglanti_sayisi=args.baglanti, bicim=args.bicim))
+        sys.exit(0)
+    
+    referans = 'data/processed/enjeksiyon_temiz.parquet'
+    if not os.path.exists(referans):
+        print(f"❌ HATA: {referans} bulunamadı! Önce main.py çalıştırılmalı.")
+        sys.exit(1)
+    
+    from anomali_tespiti import AnomaliBulucu
+    
+    ozetler = CanliTakip.referans_ozetleri(TembelVeriKumesi(referans))
+    takip = CanliTakip(None, ozetler.sinirlar(AnomaliBulucu.IQR_ESIKLERI), ozetler=ozetler)
+    sunucu = VeriSunucusu(takip.partiyi_isle, parti_boyutu=args.parti,
+                          port=args.port, udp_port=args.udp_port)
+    
+    try:
+        asyncio.run(sunucu.calistir())
+    except KeyboardInterrupt:
+        print("\n⏹️  Sunucu durduruldu")
+    finally:
+        ozetler.kaydet()
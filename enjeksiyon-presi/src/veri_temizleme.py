@@ -5,25 +5,88 @@ Bu modül eksik değerleri, aykırı değerleri ve veri kalitesi sorunlarını e
 
 import pandas as pd
 import numpy as np
+import time
+import hashlib
 from datetime import datetime
 
+try:
+    from . import veri_semasi, istatistik_motoru, temizlik_kurallari
+    from .veri_semasi import PRES_SEMASI, semayi_uygula
+    from .istatistik_motoru import motor
+    from .islem_baglami import paylasimli_gorunum
+    from .temizlik_kurallari import Kural, KuralMotoru
+except ImportError:
+    import veri_semasi, istatistik_motoru, temizlik_kurallari
+    from veri_semasi import PRES_SEMASI, semayi_uygula
+    from istatistik_motoru import motor
+    from islem_baglami import paylasimli_gorunum
+    from temizlik_kurallari import Kural, KuralMotoru
+
+# Sıfır olmaması gereken sütunlar
+KRITIK_SUTUNLAR = [
+    'BİRİNCİ FAZ HIZI', 'İKİNCİ FAZ HIZI',
+    'KALIP DOLUM ZAMANI', 'SPESİFİK BASINÇ BAR'
+]
+
+# Aykırı, negatif ve sıfır değer kontrolleri; hepsi tek geçişte değerlendirilir
+TEMIZLIK_KURALLARI = [
+    Kural.metinden("* iqr 1.5", ad='aykiri'),
+    Kural.metinden("* >= 0", ad='negatif'),
+    Kural.metinden(f"{', '.join(KRITIK_SUTUNLAR)} != 0", ad='sifir'),
+]
+
+def temizleyici_surumu():
+    """
+    Temizleme sonucunu belirleyen modüllerin kaynak kodunun özeti
+    
+    Elle artırılan bir sürüm numarası yerine kodun kendisi kullanılır;
+    temizleme kodu değişince eski önbellek kayıtları kendiliğinden geçersiz olur.
+    
+    Returns:
+        str: Hex formatında sürüm özeti
+    """
+    ozet = hashlib.blake2b(digest_size=16)
+    for modul_yolu in (__file__, veri_semasi.__file__, istatistik_motoru.__file__,
+                       temizlik_kurallari.__file__):
+        with open(modul_yolu, 'rb') as f:
+            ozet.update(f.read())
+    return ozet.hexdigest()
+
 class VeriTemizleyici:
     """
     Veri kalitesini artırmak için temizleme işlemleri yapan sınıf
     """
     
-    def __init__(self, df):
+    def __init__(self, df, ek_kurallar=None):
         """
         Args:
             df (pd.DataFrame): Temizlenecek DataFrame
+            ek_kurallar (list): Standart kontrollere eklenecek kurallar (Kural
+                veya "SPESİFİK BASINÇ BAR > 0" gibi kural metinleri); aynı
+                geçişte değerlendirilir
         """
-        self.df = df.copy()
+        self.df = paylasimli_gorunum(df)
         self.temizlik_raporu = {
             'baslangic_satir': len(df),
             'silinen_satir': 0,
             'duzeltilen_deger': 0,
             'sorunlar': []
         }
+        self.kural_motoru = KuralMotoru(TEMIZLIK_KURALLARI + list(ek_kurallar or []))
+        self.kural_sonucu = None
+        self._kural_df = None
+    
+    def yapilandirma(self):
+        """
+        Temizleme sonucunu etkileyen ayarlar (önbellek anahtarı için)
+        
+        Returns:
+            dict: Kurallar ve şema
+        """
+        return {
+            'kurallar': [[k.ad, k.secici, k.islem, k.deger] for k in self.kural_motoru.kurallar],
+            'sema': PRES_SEMASI
+        }
     
     def eksik_degerleri_analiz_et(self):
         """
@@ -98,16 +161,16 @@ class VeriTemizleyici:
         # KALIP NO'yu integer'a çevir
         if 'KALIP NO' in self.df.columns:
             try:
-                self.df['KALIP NO'] = pd.to_numeric(self.df['KALIP NO'], errors='coerce').astype('Int64')
-                print("✅ KALIP NO sütunu integer'a çevrildi")
+                self.df['KALIP NO'] = pd.to_numeric(self.df['KALIP NO'], errors='coerce').astype(PRES_SEMASI['KALIP NO'])
+                print(f"✅ KALIP NO sütunu {PRES_SEMASI['KALIP NO']} tipine çevrildi")
             except:
                 print("⚠️  KALIP NO sütunu dönüştürülemedi")
         
         # BASKI NO'yu integer'a çevir
         if 'BASKI NO' in self.df.columns:
             try:
-                self.df['BASKI NO'] = pd.to_numeric(self.df['BASKI NO'], errors='coerce').astype('Int64')
-                print("✅ BASKI NO sütunu integer'a çevrildi")
+                self.df['BASKI NO'] = pd.to_numeric(self.df['BASKI NO'], errors='coerce').astype(PRES_SEMASI['BASKI NO'])
+                print(f"✅ BASKI NO sütunu {PRES_SEMASI['BASKI NO']} tipine çevrildi")
             except:
                 print("⚠️  BASKI NO sütunu dönüştürülemedi")
         
@@ -132,6 +195,9 @@ class VeriTemizleyici:
         
         print("\n✅ Tüm sayısal sütunlar float'a çevrildi")
         
+        # Kompakt şema: küçük tam sayılar, MAKİNE KODU kategorik
+        self.df = semayi_uygula(self.df)
+        
         return self
     
     def aykiri_degerleri_bul(self, col_name, method='iqr', threshold=3):
@@ -149,23 +215,16 @@ class VeriTemizleyici:
         if col_name not in self.df.columns:
             return pd.Series([False] * len(self.df))
         
-        col = self.df[col_name].dropna()
-        
         if method == 'iqr':
-            Q1 = col.quantile(0.25)
-            Q3 = col.quantile(0.75)
-            IQR = Q3 - Q1
-            
-            lower_bound = Q1 - 1.5 * IQR
-            upper_bound = Q3 + 1.5 * IQR
+            # Çeyrekler tüm sayısal sütunlar için bir kez hesaplanır
+            Q1, Q3, lower_bound, upper_bound = motor.iqr_sinirlari(self.df, col_name)
             
             outliers = (self.df[col_name] < lower_bound) | (self.df[col_name] > upper_bound)
             
         elif method == 'zscore':
-            mean = col.mean()
-            std = col.std()
+            ist = motor.sutun(self.df, col_name)
             
-            z_scores = np.abs((self.df[col_name] - mean) / std)
+            z_scores = np.abs((self.df[col_name] - ist['ortalama']) / ist['std'])
             outliers = z_scores > threshold
         
         else:
@@ -173,6 +232,23 @@ class VeriTemizleyici:
         
         return outliers
     
+    def kurallari_uygula(self):
+        """
+        Tüm temizlik kurallarını veri üzerinde tek geçişte değerlendirir
+        
+        Sonuç veri değişmediği sürece saklanır; aykırı, negatif ve sıfır
+        kontrolleri bu sonucu okur.
+        
+        Returns:
+            KuralSonucu: Kural/sütun bazında ihlal sayıları ve satır bit maskesi
+        """
+        if self.kural_sonucu is None or self._kural_df is not self.df:
+            self.kural_sonucu = self.kural_motoru.uygula(self.df)
+            self._kural_df = self.df
+            self.temizlik_raporu['kural_ihlalleri'] = self.kural_sonucu.ozet()
+        
+        return self.kural_sonucu
+    
     def aykiri_deger_analizi(self):
         """
         Tüm sayısal sütunlarda aykırı değer analizi yapar
@@ -181,22 +257,20 @@ class VeriTemizleyici:
         print("AYKIRI DEĞER ANALİZİ (IQR Metodu)")
         print("="*60)
         
-        numeric_columns = self.df.select_dtypes(include=[np.number]).columns
+        sayilar = self.kurallari_uygula().sayilar['aykiri']
+        istatistik = motor.istatistikler(self.df)
         
         aykiri_rapor = []
         
-        for col in numeric_columns:
-            outliers = self.aykiri_degerleri_bul(col, method='iqr')
-            outlier_count = outliers.sum()
-            
+        for col, outlier_count in sayilar.items():
             if outlier_count > 0:
                 outlier_percent = (outlier_count / len(self.df)) * 100
                 aykiri_rapor.append({
                     'Sütun': col,
                     'Aykırı Sayı': outlier_count,
                     'Aykırı Yüzde (%)': round(outlier_percent, 2),
-                    'Min': self.df[col].min(),
-                    'Max': self.df[col].max()
+                    'Min': istatistik.loc[col, 'min'],
+                    'Max': istatistik.loc[col, 'max']
                 })
         
         if aykiri_rapor:
@@ -219,11 +293,10 @@ class VeriTemizleyici:
         print("NEGATİF DEĞER KONTROLÜ")
         print("="*60)
         
-        numeric_columns = self.df.select_dtypes(include=[np.number]).columns
+        sayilar = self.kurallari_uygula().sayilar['negatif']
         negatif_bulundu = False
         
-        for col in numeric_columns:
-            negatif_count = (self.df[col] < 0).sum()
+        for col, negatif_count in sayilar.items():
             if negatif_count > 0:
                 print(f"\n⚠️  {col}: {negatif_count} negatif değer bulundu!")
                 negatif_bulundu = True
@@ -242,27 +315,47 @@ class VeriTemizleyici:
         print("SIFIR DEĞER KONTROLÜ")
         print("="*60)
         
-        # Sıfır olmaması gereken sütunlar
-        critical_columns = [
-            'BİRİNCİ FAZ HIZI', 'İKİNCİ FAZ HIZI', 
-            'KALIP DOLUM ZAMANI', 'SPESİFİK BASINÇ BAR'
-        ]
-        
+        sayilar = self.kurallari_uygula().sayilar['sifir']
         sifir_bulundu = False
         
-        for col in critical_columns:
-            if col in self.df.columns:
-                sifir_count = (self.df[col] == 0).sum()
-                if sifir_count > 0:
-                    print(f"\n⚠️  {col}: {sifir_count} sıfır değer bulundu!")
-                    sifir_bulundu = True
-                    self.temizlik_raporu['sorunlar'].append(
-                        f"{col} sütununda {sifir_count} sıfır değer"
-                    )
+        for col, sifir_count in sayilar.items():
+            if sifir_count > 0:
+                print(f"\n⚠️  {col}: {sifir_count} sıfır değer bulundu!")
+                sifir_bulundu = True
+                self.temizlik_raporu['sorunlar'].append(
+                    f"{col} sütununda {sifir_count} sıfır değer"
+                )
         
         if not sifir_bulundu:
             print("\n✅ Kritik sütunlarda sıfır değer yok!")
     
+    def ek_kurallari_kontrol_et(self):
+        """
+        Standart kontrollerin dışında eklenen kuralların ihlallerini raporlar
+        """
+        ek_kurallar = self.kural_motoru.kurallar[len(TEMIZLIK_KURALLARI):]
+        if not ek_kurallar:
+            return
+        
+        print("\n" + "="*60)
+        print("EK KURAL KONTROLÜ")
+        print("="*60)
+        
+        sonuc = self.kurallari_uygula()
+        ihlal_bulundu = False
+        
+        for kural in ek_kurallar:
+            for col, sayi in sonuc.sayilar[kural.ad].items():
+                if sayi > 0:
+                    print(f"\n⚠️  {col}: {sayi} değer '{kural.ad}' kuralına uymuyor!")
+                    ihlal_bulundu = True
+                    self.temizlik_raporu['sorunlar'].append(
+                        f"{col} sütununda {sayi} değer '{kural.ad}' kuralına uymuyor"
+                    )
+        
+        if not ihlal_bulundu:
+            print("\n✅ Ek kuralların ihlali yok!")
+    
     def temizlik_raporu_olustur(self):
         """
         Temizlik sürecinin detaylı raporunu oluşturur
@@ -314,6 +407,9 @@ class VeriTemizleyici:
         # 6. Sıfır değer kontrolü
         self.sifir_degerleri_kontrol_et()
         
+        # Ek kurallar (4-6 ile aynı geçişte değerlendirildi)
+        self.ek_kurallari_kontrol_et()
+        
         # 7. Rapor oluştur
         self.temizlik_raporu_olustur()
         
@@ -322,6 +418,50 @@ class VeriTemizleyici:
         return self.df
 
 
+def onbellekli_temizle(df, onbellek, yenile=False, ek_kurallar=None):
+    """
+    Ham veriyi temizler; aynı veri aynı temizleyiciyle daha önce temizlendiyse
+    sonucu önbellekten okur
+    
+    Args:
+        df (pd.DataFrame): Ham veri
+        onbellek (TemizlikOnbellegi): Temizlik önbelleği (None ise her zaman temizlenir)
+        yenile (bool): True ise önbellek okunmaz (sonuç yine yazılır)
+        ek_kurallar (list): VeriTemizleyici'ye verilecek ek kurallar
+    
+    Returns:
+        tuple: (temiz DataFrame, temizlik raporu, önbellek anahtarı, önbellekten mi)
+    """
+    temizleyici = VeriTemizleyici(df, ek_kurallar=ek_kurallar)
+    anahtar = None
+    
+    if onbellek is not None:
+        baslangic = time.perf_counter()
+        anahtar = onbellek.anahtar_olustur(df, temizleyici_surumu(), temizleyici.yapilandirma())
+        kayit = None if yenile else onbellek.getir(anahtar)
+        
+        if kayit is not None:
+            df_temiz, rapor = kayit
+            print(f"⚡ Temizlik önbellekten okundu ({anahtar[:8]}, {len(df_temiz)} satır, "
+                  f"{time.perf_counter() - baslangic:.2f} sn) - temizlik adımı atlandı")
+            return df_temiz, rapor, anahtar, True
+        
+        print(f"🔍 Temizlik önbelleğinde kayıt yok ({anahtar[:8]}, "
+              f"{time.perf_counter() - baslangic:.2f} sn) - veri temizleniyor")
+    
+    baslangic = time.perf_counter()
+    df_temiz = temizleyici.temizle()
+    sure = time.perf_counter() - baslangic
+    
+    if onbellek is not None:
+        baslangic = time.perf_counter()
+        onbellek.kaydet(anahtar, df_temiz, temizleyici.temizlik_raporu)
+        print(f"💾 Temizlik sonucu önbelleğe yazıldı (temizlik {sure:.2f} sn, "
+              f"yazma {time.perf_counter() - baslangic:.2f} sn)")
+    
+    return df_temiz, temizleyici.temizlik_raporu, anahtar, False
+
+
 # Test için
 if __name__ == "__main__":
     from veri_yukleme import VeriYukleyici
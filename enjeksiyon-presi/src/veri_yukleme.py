@@ -5,26 +5,46 @@ Bu modül Excel dosyalarını okuyup pandas DataFrame'e dönüştürür.
 
 import pandas as pd
 import os
+import time
 from datetime import datetime
 
+try:
+    from .onbellek import ExcelOnbellek
+    from .veri_semasi import semayi_uygula
+except ImportError:
+    from onbellek import ExcelOnbellek
+    from veri_semasi import semayi_uygula
+
 class VeriYukleyici:
     """
     Excel dosyalarını yüklemek ve temel bilgileri göstermek için sınıf
     """
     
-    def __init__(self, data_path='data/raw/'):
+    # Önbellekteki pres tablosunun biçimi; _pres_tablosunu_duzenle değişirse artırılır
+    PRES_ONBELLEK_SURUMU = 'pres-1'
+    
+    def __init__(self, data_path='data/raw/', onbellek_dizini='data/cache/'):
         """
         Args:
             data_path (str): Veri dosyalarının bulunduğu klasör
+            onbellek_dizini (str): Parquet önbellek klasörü (None ise önbellek kapalı)
         """
         self.data_path = data_path
+        self.onbellek = ExcelOnbellek(onbellek_dizini) if onbellek_dizini else None
         
-    def excel_oku(self, dosya_adi):
+    def excel_oku(self, dosya_adi, yenile=False, donustur=None, surum=None):
         """
         Excel dosyasını okur ve DataFrame olarak döndürür
         
+        Kaynak dosya değişmediyse veri Excel yerine Parquet önbellekten okunur.
+        donustur verilirse önbelleğe ham tablo yerine dönüştürülmüş (başlıkları
+        düzeltilmiş, tiplendirilmiş) tablo yazılır.
+        
         Args:
             dosya_adi (str): Okunacak Excel dosyasının adı
+            yenile (bool): True ise önbelleği yok say ve Excel'i yeniden ayrıştır
+            donustur (callable): Ham tabloyu önbelleğe yazmadan önce düzenleyen fonksiyon
+            surum (str): donustur'un sürümü; önbellek anahtarına eklenir
             
         Returns:
             pd.DataFrame: Yüklenen veri
@@ -33,8 +53,26 @@ class VeriYukleyici:
             dosya_yolu = os.path.join(self.data_path, dosya_adi)
             print(f"📂 Dosya okunuyor: {dosya_yolu}")
             
-            # Excel dosyasını oku
-            df = pd.read_excel(dosya_yolu)
+            baslangic = time.perf_counter()
+            df = None
+            
+            if self.onbellek is not None and not yenile:
+                df = self.onbellek.getir(dosya_yolu, surum)
+                if df is not None:
+                    print(f"⚡ Önbellekten yüklendi ({(time.perf_counter() - baslangic)*1000:.0f} ms)")
+            
+            if df is None:
+                # Excel dosyasını oku
+                df = pd.read_excel(dosya_yolu)
+                if donustur is not None:
+                    df = donustur(df)
+                
+                if self.onbellek is not None:
+                    try:
+                        self.onbellek.kaydet(dosya_yolu, df, surum)
+                        print(f"💾 Önbelleğe yazıldı ({(time.perf_counter() - baslangic)*1000:.0f} ms)")
+                    except Exception as e:
+                        print(f"⚠️  Önbelleğe yazılamadı: {str(e)}")
             
             print(f"✅ Dosya başarıyla yüklendi!")
             print(f"📊 Satır sayısı: {len(df)}")
@@ -49,10 +87,14 @@ class VeriYukleyici:
             print(f"❌ HATA: {str(e)}")
             return None
     
-    def enjeksiyon_presi_yukle(self):
+    def enjeksiyon_presi_yukle(self, yenile=False, dosya_adi='520TonEnjPres.xlsx'):
         """
         Enjeksiyon presi verilerini yükler ve temizler
         
+        Args:
+            yenile (bool): True ise önbelleği yok say
+            dosya_adi (str): Pres Excel dosyasının adı
+        
         Returns:
             pd.DataFrame: Temizlenmiş enjeksiyon presi verileri
         """
@@ -60,11 +102,35 @@ class VeriYukleyici:
         print("ENJEKSİYON PRESİ VERİLERİ YÜKLENİYOR")
         print("="*50 + "\n")
         
-        df = self.excel_oku('520TonEnjPres.xlsx')
+        # Önbelleğe başlıkları düzeltilmiş, tiplendirilmiş tablo yazılır (Parquet)
+        df = self.excel_oku(dosya_adi, yenile=yenile, donustur=self._pres_tablosunu_duzenle,
+                            surum=self.PRES_ONBELLEK_SURUMU)
         
         if df is None:
             return None
         
+        print("\n📋 Sütun İsimleri:")
+        for i, col in enumerate(df.columns, 1):
+            print(f"  {i}. {col}")
+        
+        if 'TARİH' in df.columns:
+            print(f"\n📅 Tarih Aralığı: {df['TARİH'].min()} - {df['TARİH'].max()}")
+        
+        print("\n✅ Veri yükleme tamamlandı!")
+        
+        return df
+    
+    @staticmethod
+    def _pres_tablosunu_duzenle(df):
+        """
+        Ham pres tablosunun başlıklarını düzeltir ve sütunları tiplendirir
+        
+        Args:
+            df (pd.DataFrame): pd.read_excel çıktısı
+        
+        Returns:
+            pd.DataFrame: Teknik başlıklı, kompakt tipli tablo
+        """
         # İlk iki satır başlık satırı, onları kaldır
         # İlk satırda Türkçe başlıklar, ikinci satırda teknik isimler var
         if len(df) > 2:
@@ -76,28 +142,26 @@ class VeriYukleyici:
         # Sütun isimlerini düzelt (boşlukları kaldır)
         df.columns = df.columns.str.strip()
         
-        print("\n📋 Sütun İsimleri:")
-        for i, col in enumerate(df.columns, 1):
-            print(f"  {i}. {col}")
-        
-        # Tarih sütununu datetime'a çevir
-        if 'tarih' in df.columns:
-            df['tarih'] = pd.to_datetime(df['tarih'])
-            print(f"\n📅 Tarih Aralığı: {df['tarih'].min()} - {df['tarih'].max()}")
+        # Küçük harfli alan adları satırı ('tarih', 'kalip', ...) veri değildir
+        if 'TARİH' in df.columns:
+            df = df[df['TARİH'] != 'tarih'].reset_index(drop=True)
+            df['TARİH'] = pd.to_datetime(df['TARİH'], errors='coerce')
         
         # Sayısal sütunları kontrol et ve dönüştür
         numeric_columns = df.columns[3:]  # İlk 3 sütun kategorik
         for col in numeric_columns:
             df[col] = pd.to_numeric(df[col], errors='coerce')
         
-        print("\n✅ Veri yükleme tamamlandı!")
-        
-        return df
+        # Kompakt veri tipleri (küçük tam sayılar, kategorik makine kodu)
+        return semayi_uygula(df)
     
-    def firin_verileri_yukle(self):
+    def firin_verileri_yukle(self, yenile=False):
         """
         Fırın verilerini yükler
         
+        Args:
+            yenile (bool): True ise önbelleği yok say
+        
         Returns:
             pd.DataFrame: Fırın verileri
         """
@@ -105,7 +169,7 @@ class VeriYukleyici:
         print("FIRIN VERİLERİ YÜKLENİYOR")
         print("="*50 + "\n")
         
-        df = self.excel_oku('Fırın Verileri18.xlsx')
+        df = self.excel_oku('Fırın Verileri18.xlsx', yenile=yenile)
         
         if df is None:
             return None
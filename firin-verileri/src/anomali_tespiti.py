@@ -1,6 +1,12 @@
 """
 Fırın Verileri - Anomali Tespiti Modülü
 Bu modül fırın verilerindeki anormal davranışları tespit eder.
+
+Sıcaklık kontrol anomalileri dakika dakika satırlar yerine bölümler
+(episodes) olarak raporlanır: aynı fırında ardışık anormal kayıtlar tek
+bir bölümde (başlangıç, bitiş, süre, en büyük ve ortalama fark) birleşir.
+Bölümler vektörel bir run-length encoding geçişiyle bulunur; satır
+ayrıntısı istenirse satir_detayi ile üretilir.
 """
 
 import pandas as pd
@@ -8,6 +14,49 @@ import numpy as np
 import warnings
 warnings.filterwarnings('ignore')
 
+try:
+    from .islem_baglami import paylasimli_gorunum
+    from .zaman_indeksi import ZamanIndeksi, DAKIKA_NS
+except ImportError:
+    from islem_baglami import paylasimli_gorunum
+    from zaman_indeksi import ZamanIndeksi, DAKIKA_NS
+
+# Sıcaklık kontrol anomalisi eşiği (SET ile gerçek ısı farkı, °C)
+FARK_ESIGI = 50
+
+# Bölüm tablosunun sütunları
+BOLUM_SUTUNLARI = ['FIRIN KODU', 'BÖLGE', 'BAŞLANGIÇ', 'BİTİŞ', 'SÜRE (DK)',
+                   'KAYIT', 'EN BÜYÜK FARK', 'ORTALAMA FARK']
+
+def bolumlere_ayir(maske, zaman, firin, kesinti_dk=30):
+    """
+    Sıralı kayıtlardaki anormal satırları bölümlere ayırır (run-length encoding)
+    
+    Ardışık anormal satırlar; fırın değişirse, araya normal bir satır girerse
+    veya iki kayıt arası kesinti_dk'dan uzunsa yeni bölüme geçer.
+    
+    Args:
+        maske (np.ndarray): Sıralı satırların anomali maskesi
+        zaman (np.ndarray): Sıralı satırların int64 ns zamanları
+        firin (np.ndarray): Sıralı satırların fırın kodları (tamsayı)
+        kesinti_dk (float): Bu süreden uzun kayıt aralığı bölümü böler
+    
+    Returns:
+        tuple: (anormal satırların sıralı konumları, bölüm başlangıçlarının
+            bu konumlar içindeki sırası, bölüm başına kayıt sayısı)
+    """
+    konum = np.flatnonzero(maske)
+    if len(konum) == 0:
+        return konum, konum, konum
+    
+    yeni = np.ones(len(konum), dtype=bool)
+    yeni[1:] = ((np.diff(konum) != 1)
+                | (firin[konum[1:]] != firin[konum[:-1]])
+                | (np.diff(zaman[konum]) > kesinti_dk * DAKIKA_NS))
+    baslar = np.flatnonzero(yeni)
+    sayilar = np.diff(np.append(baslar, len(konum)))
+    return konum, baslar, sayilar
+
 class FirinAnomaliBulucu:
     """
     Fırın anomali tespit işlemlerini gerçekleştiren sınıf
@@ -18,12 +67,70 @@ class FirinAnomaliBulucu:
         Args:
             df (pd.DataFrame): Temizlenmiş DataFrame
         """
-        self.df = df.copy()
+        self.df = paylasimli_gorunum(df)
         self.anomaliler = {}
+        
+        # Anomali adı -> (satır konumları, satırın bölüm numarası); satir_detayi için
+        self._bolum_satirlari = {}
+    
+    @classmethod
+    def gerekli_sutunlar(cls, mevcut):
+        """
+        Analizin kullandığı sütunları döndürür
+        
+        Args:
+            mevcut (list): Veri kümesindeki sütunlar
+        
+        Returns:
+            list: Yüklenecek sütunlar
+        """
+        # Gerçek ISI, SET farkı (_FARK) ve GÜÇ sütunları; SET ISI ve AMP. gerekmez
+        return [col for col in mevcut
+                if col in ('TARİH', 'FIRIN KODU') or col.endswith('_FARK') or 'GÜÇ %' in col
+                or ('ISI' in col and 'SET' not in col)]
+    
+    @classmethod
+    def veri_kumesinden(cls, kume):
+        """
+        Veri kümesinden sadece gerekli sütunları yükleyerek nesne oluşturur
+        
+        Args:
+            kume (TembelVeriKumesi): Temizlenmiş veri kümesi
+        """
+        return cls(kume.sec(cls.gerekli_sutunlar(kume.sutunlar)))
     
-    def sicaklik_kontrolu_anomalisi(self):
+    def _sira(self):
+        """
+        Satırların fırın ve zaman sırası
+        
+        Returns:
+            tuple: (sıra konumları, int64 ns zamanlar, tamsayı fırın kodları) sıralı halde
+        """
+        zaman = self.df['TARİH'].to_numpy(dtype='datetime64[ns]').view('int64')
+        if 'FIRIN KODU' in self.df.columns:
+            firin = pd.factorize(self.df['FIRIN KODU'], sort=True)[0]
+        else:
+            firin = np.zeros(len(self.df), dtype=np.intp)
+        
+        # Temizlenmiş veri genelde zaten sıralıdır; o zaman sıralama atlanır
+        if ZamanIndeksi.sirali_mi(self.df):
+            sira = np.arange(len(self.df))
+        else:
+            sira = np.lexsort((zaman, firin))
+        return sira, zaman[sira], firin[sira]
+    
+    def sicaklik_kontrolu_anomalisi(self, kesinti_dk=30):
         """
         Hedef sıcaklık ile gerçek sıcaklık arasındaki büyük farkları tespit eder
+        
+        Her bölge için anomaliler bölüm tablosu olarak self.anomaliler'e yazılır
+        (BOLUM_SUTUNLARI); satır ayrıntısı satir_detayi ile alınır.
+        
+        Args:
+            kesinti_dk (float): Bu süreden uzun kayıt aralığı bölümü böler
+        
+        Returns:
+            int: Toplam anormal kayıt sayısı
         """
         print("\n" + "="*70)
         print("SICAKLIK KONTROL ANOMALİSİ")
@@ -34,24 +141,84 @@ class FirinAnomaliBulucu:
         
         anomali_sayisi = 0
         
+        # Sıralama tüm bölgeler için bir kez yapılır
+        if fark_sutunlari and 'TARİH' in self.df.columns:
+            sira, zaman, firin = self._sira()
+            firin_kodlari = (self.df['FIRIN KODU'].to_numpy()[sira] if 'FIRIN KODU' in self.df.columns
+                             else np.full(len(sira), None, dtype=object))
+            gecerli = zaman != np.iinfo(np.int64).min
+            
+            # Bölüm süresine son kaydın örnekleme aralığı (medyan kayıt aralığı) eklenir
+            adimlar = np.diff(zaman)[(firin[1:] == firin[:-1]) & gecerli[1:] & gecerli[:-1]]
+            adimlar = adimlar[adimlar > 0]
+            adim_dk = np.median(adimlar) / DAKIKA_NS if len(adimlar) else 0.0
+        else:
+            fark_sutunlari = []
+        
         for fark_col in fark_sutunlari:
-            # 50°C üzeri fark = anomali
-            anomali_mask = self.df[fark_col] > 50
-            anomali_count = anomali_mask.sum()
+            # 50°C üzeri fark = anomali (zamanı olmayan satırlar bölüme giremez)
+            degerler = self.df[fark_col].to_numpy(dtype='float64', na_value=np.nan)[sira]
+            anomali_mask = (degerler > FARK_ESIGI) & gecerli
+            konum, baslar, sayilar = bolumlere_ayir(anomali_mask, zaman, firin, kesinti_dk)
             
-            if anomali_count > 0:
+            if len(konum) > 0:
                 bolge = fark_col.replace('_FARK', '').replace(' SET ISI', '')
-                print(f"\n⚠️  {bolge}: {anomali_count} sıcaklık kontrol anomalisi")
                 
-                # Anomalileri kaydet
-                anomali_df = self.df[anomali_mask][['TARİH', 'SAAT', fark_col]].copy()
-                self.anomaliler[f'SICAKLIK_KONTROL_{bolge}'] = anomali_df
-                anomali_sayisi += anomali_count
+                fark = degerler[konum]
+                baslangic = zaman[konum[baslar]]
+                bitis = zaman[konum[baslar + sayilar - 1]]
+                bolumler = pd.DataFrame({
+                    'FIRIN KODU': firin_kodlari[konum[baslar]],
+                    'BÖLGE': bolge,
+                    'BAŞLANGIÇ': pd.to_datetime(baslangic),
+                    'BİTİŞ': pd.to_datetime(bitis),
+                    'SÜRE (DK)': (bitis - baslangic) / DAKIKA_NS + adim_dk,
+                    'KAYIT': sayilar,
+                    'EN BÜYÜK FARK': np.maximum.reduceat(fark, baslar),
+                    'ORTALAMA FARK': np.add.reduceat(fark, baslar) / sayilar
+                }, columns=BOLUM_SUTUNLARI)
+                
+                anahtar = f'SICAKLIK_KONTROL_{bolge}'
+                self.anomaliler[anahtar] = bolumler
+                self._bolum_satirlari[anahtar] = (sira[konum], np.repeat(np.arange(len(baslar)), sayilar))
+                anomali_sayisi += len(konum)
+                
+                en_uzun = bolumler['SÜRE (DK)'].max()
+                print(f"\n⚠️  {bolge}: {len(konum)} sıcaklık kontrol anomalisi, "
+                      f"{len(bolumler)} bölüm (en uzun {en_uzun:.0f} dk, en büyük fark {fark.max():.1f}°C)")
         
         print(f"\n📊 Toplam Sıcaklık Kontrol Anomalisi: {anomali_sayisi}")
         
         return anomali_sayisi
     
+    def satir_detayi(self, anahtar, bolum=None):
+        """
+        Bir anomali bölümünün (veya tüm bölümlerin) satır ayrıntısı
+        
+        Args:
+            anahtar (str): Anomali adı (ör. 'SICAKLIK_KONTROL_CEH.2 ALT1')
+            bolum (int): Bölüm tablosundaki sıra (None ise tüm bölümler)
+        
+        Returns:
+            pd.DataFrame: FIRIN KODU, TARİH, fark sütunu ve BÖLÜM numarası
+        """
+        if anahtar not in self._bolum_satirlari:
+            raise KeyError(f"Bölüm bilgisi yok: {anahtar}")
+        
+        konum, bolum_no = self._bolum_satirlari[anahtar]
+        if bolum is not None:
+            secim = bolum_no == bolum
+            konum, bolum_no = konum[secim], bolum_no[secim]
+        
+        bolge = anahtar.replace('SICAKLIK_KONTROL_', '')
+        fark_col = next(col for col in self.df.columns
+                        if col.endswith('_FARK') and col.replace('_FARK', '').replace(' SET ISI', '') == bolge)
+        zaman_sutunlari = [c for c in ('FIRIN KODU', 'TARİH') if c in self.df.columns]
+        
+        detay = self.df[zaman_sutunlari + [fark_col]].iloc[konum]
+        detay['BÖLÜM'] = bolum_no
+        return detay
+    
     def ani_sicaklik_degisimi(self):
         """
         Ani ve beklenmeyen sıcaklık değişimlerini tespit eder
@@ -213,7 +380,10 @@ class FirinAnomaliBulucu:
         if self.anomaliler:
             print(f"\n⚠️  ANOMALİ DAĞILIMI:")
             for anom_tipi, anom_df in self.anomaliler.items():
-                print(f"   • {anom_tipi}: {len(anom_df)} adet")
+                if 'KAYIT' in anom_df.columns:
+                    print(f"   • {anom_tipi}: {len(anom_df)} bölüm ({anom_df['KAYIT'].sum()} kayıt)")
+                else:
+                    print(f"   • {anom_tipi}: {len(anom_df)} adet")
         
         # Öneriler
         print(f"\n💡 ÖNERİLER:")
@@ -257,6 +427,9 @@ class FirinAnomaliBulucu:
 if __name__ == "__main__":
     from veri_yukleme import FirinVeriYukleyici
     from veri_temizleme import FirinVeriTemizleyici
+    from veri_kumesi import TembelVeriKumesi
+    from depo import FirinDeposu, anomalileri_birlestir
+    from bolumlu_kayit import BolumluParquet
     
     # Veri yükle
     yukleyici = FirinVeriYukleyici()
@@ -268,7 +441,7 @@ if __name__ == "__main__":
         df_temiz = temizleyici.temizle()
         
         # Anomali tespit et
-        bulucu = FirinAnomaliBulucu(df_temiz)
+        bulucu = FirinAnomaliBulucu.veri_kumesinden(TembelVeriKumesi(df_temiz))
         anomaliler = bulucu.tam_analiz_yap()
         
         # Anomalileri kaydet
@@ -276,4 +449,8 @@ if __name__ == "__main__":
             for anom_tipi, anom_df in anomaliler.items():
                 dosya_adi = anom_tipi.lower().replace(' ', '_')
                 anom_df.to_csv(f'data/processed/anomali_{dosya_adi}.csv', index=False)
-            print(f"\n💾 {len(anomaliler)} adet anomali dosyası kaydedildi!")
\ No newline at end of file
+            print(f"\n💾 {len(anomaliler)} adet anomali bölüm dosyası kaydedildi!")
+            
+            # Bölge/zaman sorguları için veritabanına da yaz
+            FirinDeposu().anomalileri_kaydet(anomaliler, kapsam=df_temiz)
+            BolumluParquet('data/processed/firin_anomaliler').kaydet(anomalileri_birlestir(anomaliler))
\ No newline at end of file
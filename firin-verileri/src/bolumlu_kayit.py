@@ -0,0 +1,225 @@
+"""
+Fırın Verileri - Bölümlü Parquet Kayıt Modülü
+Bu modül işlenmiş fırın verisini gün ve fırın bazında bölümlenmiş Parquet
+dosyalarına yazar. Okuma sırasında sadece istenen tarih aralığına düşen
+bölümler açılır; "son 7 gün" raporu geçmişin uzunluğundan bağımsız olarak
+en fazla 7 günlük bölümü okur.
+
+Klasör yapısı:
+    data/processed/firin_temiz/GUN=2024-11-01/FIRIN=Fırın Verileri18/veri.parquet
+    data/processed/firin_temiz/GUN=__YOK__/...  (zamanı okunamayan satırlar)
+"""
+
+import os
+import shutil
+import pandas as pd
+
+try:
+    from .veri_semasi import semayi_uygula
+except ImportError:
+    from veri_semasi import semayi_uygula
+
+# Fırın kodu olmayan (tek dosyadan yüklenmiş) veriler bu bölüme yazılır
+VARSAYILAN_FIRIN = 'TUMU'
+
+# TARİH'i eksik (NaT) satırlar bu gün bölümüne yazılır
+TARIHSIZ_GUN = '__YOK__'
+
+def _bolum_adi(deger):
+    """Bölüm değerini klasör adında kullanılabilir hale getirir"""
+    return str(deger).replace(os.sep, '_')
+
+class BolumluParquet:
+    """
+    Gün ve fırın bazında bölümlenmiş Parquet veri kümesi
+    """
+    
+    DOSYA_ADI = 'veri.parquet'
+    
+    def __init__(self, kok_dizin='data/processed/firin_temiz'):
+        """
+        Args:
+            kok_dizin (str): Bölümlerin yazılacağı kök klasör
+        """
+        self.kok_dizin = kok_dizin
+    
+    def kaydet(self, df, ekle=False):
+        """
+        DataFrame'i gün ve fırın bölümlerine yazar
+        
+        Args:
+            df (pd.DataFrame): TARİH sütunu olan işlenmiş fırın verisi
+            ekle (bool): True ise df'in satırları kapsadığı bölümlerdeki mevcut
+                satırlara eklenir (birebir aynı satırlar tekrarlanmaz), diğer
+                bölümlere dokunulmaz; False ise kök klasör baştan yazılır
+        
+        Returns:
+            int: Yazılan bölüm sayısı
+        """
+        if df is None or len(df) == 0:
+            return 0
+        
+        if not ekle and os.path.exists(self.kok_dizin):
+            shutil.rmtree(self.kok_dizin)
+        
+        gunler = df['TARİH'].dt.strftime('%Y-%m-%d').fillna(TARIHSIZ_GUN)
+        if 'FIRIN KODU' in df.columns:
+            firinlar = df['FIRIN KODU'].astype(object).fillna(VARSAYILAN_FIRIN)
+        else:
+            firinlar = pd.Series(VARSAYILAN_FIRIN, index=df.index)
+        
+        bolum_sayisi = 0
+        # indices konum döndürür; indeks tekrarlı olsa da satırlar çoğalmaz
+        for (gun, firin), konumlar in df.groupby([gunler, firinlar], sort=True).indices.items():
+            klasor = os.path.join(self.kok_dizin, f'GUN={gun}', f'FIRIN={_bolum_adi(firin)}')
+            os.makedirs(klasor, exist_ok=True)
+            yol = os.path.join(klasor, self.DOSYA_ADI)
+            
+            parca = df.iloc[konumlar]
+            if ekle and os.path.exists(yol):
+                parca = pd.concat([pd.read_parquet(yol), parca], ignore_index=True).drop_duplicates()
+            parca.to_parquet(yol, index=False)
+            bolum_sayisi += 1
+        
+        print(f"💾 {len(df)} satır {bolum_sayisi} bölüm halinde '{self.kok_dizin}' klasörüne yazıldı")
+        
+        tarihsiz = int((gunler == TARIHSIZ_GUN).sum())
+        if tarihsiz:
+            print(f"⚠️  {tarihsiz} satırın TARİH değeri yok, 'GUN={TARIHSIZ_GUN}' bölümüne yazıldı")
+        
+        return bolum_sayisi
+    
+    def gunler(self):
+        """
+        Diskte bulunan gün bölümlerini listeler (tarihsiz bölüm hariç)
+        
+        Returns:
+            list: Sıralı gün listesi (pd.Timestamp)
+        """
+        if not os.path.isdir(self.kok_dizin):
+            return []
+        
+        return sorted(
+            pd.Timestamp(ad.split('=', 1)[1])
+            for ad in os.listdir(self.kok_dizin)
+            if ad.startswith('GUN=') and ad != f'GUN={TARIHSIZ_GUN}'
+        )
+    
+    def bolumler(self, baslangic=None, bitis=None, firin_kodu=None):
+        """
+        Tarih aralığına ve fırına uyan bölüm dosyalarını bulur (bölüm budama)
+        
+        Sadece klasör adlarına bakılır; aralık dışındaki günlerin
+        dosyaları hiç açılmaz. Tarihsiz bölüm sadece aralık verilmediğinde
+        okunur.
+        
+        Args:
+            baslangic: Başlangıç zamanı (dahil)
+            bitis: Bitiş zamanı (hariç)
+            firin_kodu (str): Sadece bu fırının bölümleri
+        
+        Returns:
+            list: Parquet dosya yolları
+        """
+        ilk_gun = pd.Timestamp(baslangic).normalize() if baslangic is not None else None
+        bitis = pd.Timestamp(bitis) if bitis is not None else None
+        
+        gun_adlari = []
+        for gun in self.gunler():
+            if ilk_gun is not None and gun < ilk_gun:
+                continue
+            if bitis is not None and gun >= bitis:
+                continue
+            gun_adlari.append(gun.strftime('%Y-%m-%d'))
+        
+        if ilk_gun is None and bitis is None and os.path.isdir(os.path.join(self.kok_dizin, f'GUN={TARIHSIZ_GUN}')):
+            gun_adlari.append(TARIHSIZ_GUN)
+        
+        yollar = []
+        for gun_adi in gun_adlari:
+            gun_klasoru = os.path.join(self.kok_dizin, f'GUN={gun_adi}')
+            for ad in sorted(os.listdir(gun_klasoru)):
+                if firin_kodu is not None and ad != f'FIRIN={_bolum_adi(firin_kodu)}':
+                    continue
+                yol = os.path.join(gun_klasoru, ad, self.DOSYA_ADI)
+                if os.path.exists(yol):
+                    yollar.append(yol)
+        
+        return yollar
+    
+    def oku(self, baslangic=None, bitis=None, firin_kodu=None, sutunlar=None):
+        """
+        Tarih aralığındaki veriyi sadece ilgili bölümlerden okur
+        
+        Args:
+            baslangic: Başlangıç zamanı (dahil)
+            bitis: Bitiş zamanı (hariç)
+            firin_kodu (str): FIRIN KODU filtresi
+            sutunlar (list): Yüklenecek sütunlar (None ise tümü)
+        
+        Returns:
+            pd.DataFrame: Kompakt tipli veri (bölüm yoksa None)
+        """
+        yollar = self.bolumler(baslangic, bitis, firin_kodu)
+        
+        if not yollar:
+            print(f"❌ HATA: '{self.kok_dizin}' içinde istenen aralıkta bölüm yok!")
+            return None
+        
+        # Satır filtresi için TARİH her zaman okunur
+        okunacak = None if sutunlar is None else list(dict.fromkeys(['TARİH'] + list(sutunlar)))
+        df = pd.concat(
+            [pd.read_parquet(yol, columns=okunacak) for yol in yollar],
+            ignore_index=True
+        )
+        
+        # Sınır günlerindeki aralık dışı satırları at
+        maske = pd.Series(True, index=df.index)
+        if baslangic is not None:
+            maske &= df['TARİH'] >= pd.Timestamp(baslangic)
+        if bitis is not None:
+            maske &= df['TARİH'] < pd.Timestamp(bitis)
+        df = df[maske].reset_index(drop=True)
+        
+        if sutunlar is not None:
+            df = df[list(sutunlar)]
+        
+        print(f"📂 {len(yollar)} bölümden {len(df)} satır okundu")
+        
+        return semayi_uygula(df, rapor=False)
+    
+    def son_gunler(self, gun_sayisi=7, firin_kodu=None, sutunlar=None):
+        """
+        Verideki en son günden geriye doğru gun_sayisi günü okur
+        
+        Args:
+            gun_sayisi (int): Okunacak gün sayısı
+            firin_kodu (str): FIRIN KODU filtresi
+            sutunlar (list): Yüklenecek sütunlar (None ise tümü)
+        
+        Returns:
+            pd.DataFrame: Son günlerin verisi (bölüm yoksa None)
+        """
+        gunler = self.gunler()
+        
+        if not gunler:
+            print(f"❌ HATA: '{self.kok_dizin}' içinde bölüm yok!")
+            return None
+        
+        bitis = gunler[-1] + pd.Timedelta(days=1)
+        return self.oku(bitis - pd.Timedelta(days=gun_sayisi), bitis, firin_kodu, sutunlar)
+
+
+# Test için
+if __name__ == "__main__":
+    kume = BolumluParquet()
+    gunler = kume.gunler()
+    
+    if gunler:
+        print(f"📅 {len(gunler)} gün bölümü: {gunler[0].date()} - {gunler[-1].date()}")
+        
+        df = kume.son_gunler(7)
+        if df is not None:
+            print(f"✅ Son 7 gün: {df['TARİH'].min()} - {df['TARİH'].max()}")
+    else:
+        print(f"❌ HATA: {kume.kok_dizin} bulunamadı! Önce veri_temizleme.py çalıştırılmalı.")
@@ -0,0 +1,132 @@
+"""
+Fırın Verileri - Çoklu Dosya Yükleme Modülü
+Bu modül birden fazla fırının Excel dışa aktarımlarını süreç havuzunda paralel
+olarak okur, her birini fırın koduyla etiketler ve tek bir DataFrame'de birleştirir.
+"""
+
+import pandas as pd
+import os
+import io
+import glob
+import time
+from contextlib import redirect_stdout
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    from .veri_yukleme import FirinVeriYukleyici
+except ImportError:
+    from veri_yukleme import FirinVeriYukleyici
+
+def _firin_dosyasi_yukle(data_path, dosya_adi, onbellek_dizini, yenile):
+    """
+    Tek bir fırın dosyasını yükler (süreç havuzunda çalışır)
+    
+    Returns:
+        tuple: (dosya adı, DataFrame veya None, süre (sn))
+    """
+    baslangic = time.perf_counter()
+    
+    # Paralel süreçlerin çıktıları birbirine karışmasın
+    with redirect_stdout(io.StringIO()):
+        yukleyici = FirinVeriYukleyici(data_path=data_path, onbellek_dizini=onbellek_dizini)
+        df = yukleyici.firin_verileri_yukle(yenile=yenile, dosya_adi=dosya_adi)
+    
+    if df is not None:
+        # Fırın kodu dosya adından gelir
+        df.insert(0, 'FIRIN KODU', os.path.splitext(dosya_adi)[0])
+    
+    return dosya_adi, df, time.perf_counter() - baslangic
+
+class CokluFirinYukleyici:
+    """
+    Birden fazla fırının Excel dosyalarını paralel yükleyen sınıf
+    """
+    
+    def __init__(self, data_path='data/raw/', onbellek_dizini='data/cache/', calisan_sayisi=None):
+        """
+        Args:
+            data_path (str): Veri dosyalarının bulunduğu klasör
+            onbellek_dizini (str): Parquet önbellek klasörü (None ise önbellek kapalı)
+            calisan_sayisi (int): Süreç sayısı (None ise çekirdek sayısı)
+        """
+        self.data_path = data_path
+        self.onbellek_dizini = onbellek_dizini
+        self.calisan_sayisi = calisan_sayisi or os.cpu_count()
+    
+    def dosyalari_bul(self, desen):
+        """
+        Desene uyan Excel dosyalarını bulur
+        
+        Args:
+            desen (str): Dosya deseni (ör. 'Fırın*.xlsx')
+        
+        Returns:
+            list: Sıralı dosya adları
+        """
+        yollar = glob.glob(os.path.join(self.data_path, desen))
+        return sorted(os.path.basename(y) for y in yollar if not os.path.basename(y).startswith('~$'))
+    
+    def firin_verilerini_yukle(self, desen='Fırın*.xlsx', yenile=False):
+        """
+        Desene uyan tüm fırın dosyalarını paralel yükler ve birleştirir
+        
+        Args:
+            desen (str): Dosya deseni
+            yenile (bool): True ise önbelleği yok say
+        
+        Returns:
+            pd.DataFrame: Tüm fırınların birleştirilmiş verisi
+        """
+        print("\n" + "="*50)
+        print("ÇOKLU FIRIN VERİSİ YÜKLENİYOR")
+        print("="*50 + "\n")
+        
+        dosyalar = self.dosyalari_bul(desen)
+        
+        if not dosyalar:
+            print(f"❌ HATA: '{os.path.join(self.data_path, desen)}' desenine uyan dosya yok!")
+            return None
+        
+        calisan = min(self.calisan_sayisi, len(dosyalar))
+        print(f"📂 {len(dosyalar)} dosya bulundu, {calisan} süreçte okunuyor...")
+        
+        baslangic = time.perf_counter()
+        
+        with ProcessPoolExecutor(max_workers=calisan) as havuz:
+            sonuclar = list(havuz.map(
+                _firin_dosyasi_yukle,
+                [self.data_path] * len(dosyalar),
+                dosyalar,
+                [self.onbellek_dizini] * len(dosyalar),
+                [yenile] * len(dosyalar)
+            ))
+        
+        parcalar = []
+        for dosya_adi, df, sure in sonuclar:
+            if df is None:
+                print(f"  ⚠️  {dosya_adi}: yüklenemedi")
+                continue
+            print(f"  ✅ {dosya_adi}: {len(df)} satır ({sure:.1f} sn)")
+            parcalar.append(df)
+        
+        if not parcalar:
+            print("❌ HATA: Hiçbir dosya yüklenemedi!")
+            return None
+        
+        # Tek seferde birleştir, fırın kodunu kategorik yap
+        df = pd.concat(parcalar, ignore_index=True)
+        df['FIRIN KODU'] = df['FIRIN KODU'].astype('category')
+        
+        print(f"\n✅ {len(parcalar)} fırın, toplam {len(df)} satır "
+              f"({time.perf_counter() - baslangic:.1f} sn)")
+        
+        return df
+
+
+# Test için
+if __name__ == "__main__":
+    yukleyici = CokluFirinYukleyici()
+    df = yukleyici.firin_verilerini_yukle()
+    
+    if df is not None:
+        print(df['FIRIN KODU'].value_counts())
@@ -0,0 +1,361 @@
+"""
+Fırın Verileri - Veri Deposu Modülü
+Bu modül temizlenmiş fırın ölçümlerini ve sıcaklık anomalilerini yerel bir
+SQLite veritabanında saklar. Zaman, fırın kodu ve bölge üzerindeki indeksler
+sayesinde sorgular tüm CSV'yi taramak yerine indeks üzerinden çalışır.
+"""
+
+import os
+import sqlite3
+from contextlib import contextmanager
+import pandas as pd
+
+try:
+    from .veri_semasi import semayi_uygula
+except ImportError:
+    from veri_semasi import semayi_uygula
+
+# TARİH metin olarak bu formatta saklanır; sözlük sırası zaman sırasıyla aynıdır
+ZAMAN_FORMATI = '%Y-%m-%d %H:%M:%S'
+
+def _sql_tipi(dtype):
+    """Pandas veri tipine karşılık gelen SQLite tipini döndürür"""
+    if pd.api.types.is_bool_dtype(dtype):
+        return 'INTEGER'
+    if pd.api.types.is_integer_dtype(dtype):
+        return 'INTEGER'
+    if pd.api.types.is_float_dtype(dtype):
+        return 'REAL'
+    return 'TEXT'
+
+def _zaman_metni(deger):
+    """Tarih değerini indekslenebilir metne çevirir"""
+    return pd.Timestamp(deger).strftime(ZAMAN_FORMATI)
+
+def anomalileri_birlestir(anomaliler):
+    """
+    Anomali sözlüğünü tek bir uzun formatlı DataFrame'e çevirir
+    
+    Her satır: anomali, bolge, FIRIN KODU, TARİH, DEGER. Bölüm tablolarında
+    TARİH bölümün başlangıcı, DEGER en büyük farktır; bitiş, süre, kayıt
+    sayısı ve ortalama fark ek sütunlarda tutulur.
+    
+    Args:
+        anomaliler (dict): Anomali adı (ör. 'SICAKLIK_KONTROL_CEH.2 ALT1') -> DataFrame
+    
+    Returns:
+        pd.DataFrame: Birleştirilmiş anomaliler (anomali yoksa None)
+    """
+    parcalar = []
+    for anomali, anomali_df in (anomaliler or {}).items():
+        if 'BAŞLANGIÇ' in anomali_df.columns:
+            parcalar.append(pd.DataFrame({
+                'anomali': anomali,
+                'bolge': anomali_df['BÖLGE'],
+                'FIRIN KODU': anomali_df['FIRIN KODU'],
+                'TARİH': anomali_df['BAŞLANGIÇ'],
+                'BİTİŞ': anomali_df['BİTİŞ'],
+                'SÜRE (DK)': anomali_df['SÜRE (DK)'].astype('float64'),
+                'KAYIT': anomali_df['KAYIT'].astype('int64'),
+                'DEGER': anomali_df['EN BÜYÜK FARK'].astype('float64'),
+                'ORTALAMA FARK': anomali_df['ORTALAMA FARK'].astype('float64')
+            }))
+            continue
+        
+        deger_sutunlari = [c for c in anomali_df.columns if c not in ('FIRIN KODU', 'TARİH', 'SAAT')]
+        if 'TARİH' not in anomali_df.columns or not deger_sutunlari:
+            continue
+        parca = pd.DataFrame({
+            'anomali': anomali,
+            'bolge': anomali.replace('SICAKLIK_KONTROL_', ''),
+            'FIRIN KODU': anomali_df.get('FIRIN KODU'),
+            'TARİH': anomali_df['TARİH'],
+            'DEGER': anomali_df[deger_sutunlari[0]].astype('float64')
+        })
+        parcalar.append(parca)
+    
+    if not parcalar:
+        return None
+    
+    df = pd.concat(parcalar, ignore_index=True)
+    df['FIRIN KODU'] = df['FIRIN KODU'].astype(object)
+    return df
+
+class FirinDeposu:
+    """
+    Fırın ölçümlerini ve anomalilerini SQLite'ta saklayan sınıf
+    """
+    
+    OLCUM_TABLOSU = 'olcumler'
+    ANOMALI_TABLOSU = 'anomaliler'
+    
+    # Bir anomali kaydını tekil tanımlayan sütunlar
+    ANOMALI_ANAHTARI = ['anomali', 'FIRIN KODU', 'TARİH']
+    
+    def __init__(self, db_yolu='data/processed/firin.db'):
+        """
+        Args:
+            db_yolu (str): SQLite veritabanı dosyası
+        """
+        self.db_yolu = db_yolu
+    
+    @contextmanager
+    def baglan(self):
+        """Veritabanı bağlantısı açar; blok sonunda kaydeder ve kapatır"""
+        klasor = os.path.dirname(self.db_yolu)
+        if klasor:
+            os.makedirs(klasor, exist_ok=True)
+        baglanti = sqlite3.connect(self.db_yolu)
+        try:
+            with baglanti:
+                yield baglanti
+        finally:
+            baglanti.close()
+    
+    def mevcut_mu(self):
+        """Veritabanında ölçüm tablosu olup olmadığını kontrol eder"""
+        if not os.path.exists(self.db_yolu):
+            return False
+        with self.baglan() as baglanti:
+            return bool(self._sutunlar(baglanti, self.OLCUM_TABLOSU))
+    
+    @staticmethod
+    def _sutunlar(baglanti, tablo):
+        return [satir[1] for satir in baglanti.execute(f'PRAGMA table_info("{tablo}")')]
+    
+    @staticmethod
+    def _satirlar(df):
+        """DataFrame'i sqlite3'ün yazabileceği tuple listesine çevirir"""
+        sutunlar = []
+        for col in df.columns:
+            seri = df[col]
+            if pd.api.types.is_datetime64_any_dtype(seri):
+                seri = seri.dt.strftime(ZAMAN_FORMATI)
+            # object'e çevirmek NumPy skalerlerini Python tiplerine dönüştürür
+            sutunlar.append(seri.astype(object).where(seri.notna(), None).tolist())
+        return list(zip(*sutunlar))
+    
+    def _tablo_olustur(self, baglanti, tablo, df, indeksler, benzersiz=None):
+        """Tabloyu ve indekslerini (yoksa) oluşturur"""
+        sutun_tanimlari = ', '.join(f'"{col}" {_sql_tipi(df[col].dtype)}' for col in df.columns)
+        baglanti.execute(f'CREATE TABLE IF NOT EXISTS "{tablo}" ({sutun_tanimlari})')
+        
+        for ad, sutunlar in indeksler.items():
+            liste = ', '.join(f'"{s}"' for s in sutunlar)
+            baglanti.execute(f'CREATE INDEX IF NOT EXISTS "{ad}" ON "{tablo}" ({liste})')
+        
+        if benzersiz:
+            ad, sutunlar = benzersiz
+            liste = ', '.join(f'"{s}"' for s in sutunlar)
+            baglanti.execute(f'CREATE UNIQUE INDEX IF NOT EXISTS "{ad}" ON "{tablo}" ({liste})')
+    
+    def olcumleri_kaydet(self, df):
+        """
+        Temizlenmiş fırın ölçümlerini veritabanına yazar (tablo baştan yazılır)
+        
+        Args:
+            df (pd.DataFrame): Temizlenmiş fırın verisi
+        """
+        if df is None or len(df) == 0:
+            return
+        
+        with self.baglan() as baglanti:
+            baglanti.execute(f'DROP TABLE IF EXISTS "{self.OLCUM_TABLOSU}"')
+            
+            indeksler = {'ix_olcumler_tarih': ['TARİH']}
+            if 'FIRIN KODU' in df.columns:
+                indeksler['ix_olcumler_firin_tarih'] = ['FIRIN KODU', 'TARİH']
+            self._tablo_olustur(baglanti, self.OLCUM_TABLOSU, df, indeksler)
+            
+            liste = ', '.join(f'"{c}"' for c in df.columns)
+            yer_tutucular = ', '.join('?' * len(df.columns))
+            baglanti.executemany(
+                f'INSERT INTO "{self.OLCUM_TABLOSU}" ({liste}) VALUES ({yer_tutucular})',
+                self._satirlar(df)
+            )
+        
+        print(f"🗄️  {len(df)} ölçüm '{self.db_yolu}' veritabanına yazıldı")
+    
+    def _indeks_var_mi(self, baglanti, ad):
+        """Verilen adda bir indeks olup olmadığını kontrol eder"""
+        return baglanti.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = ?", (ad,)
+        ).fetchone() is not None
+    
+    def _kapsamdaki_anomalileri_sil(self, baglanti, kapsam):
+        """
+        Yeniden hesaplanan verinin zaman aralığına ve FIRIN KODU değerlerine
+        düşen anomali kayıtlarını siler
+        
+        Returns:
+            int: Silinen kayıt sayısı
+        """
+        tarih = pd.to_datetime(kapsam['TARİH'])
+        if not self._sutunlar(baglanti, self.ANOMALI_TABLOSU) or tarih.isna().all():
+            return 0
+        
+        kosullar = ['"TARİH" >= ?', '"TARİH" <= ?']
+        parametreler = [_zaman_metni(tarih.min()), _zaman_metni(tarih.max())]
+        
+        if 'FIRIN KODU' in kapsam.columns:
+            kimlikler = kapsam['FIRIN KODU'].dropna().astype(object).unique().tolist()
+            kosul = f'"FIRIN KODU" IN ({", ".join("?" * len(kimlikler))})'
+            if kapsam['FIRIN KODU'].isna().any():
+                kosul = f'({kosul} OR "FIRIN KODU" IS NULL)'
+            kosullar.append(kosul)
+            parametreler.extend(kimlikler)
+        
+        return baglanti.execute(
+            f'DELETE FROM "{self.ANOMALI_TABLOSU}" WHERE ' + ' AND '.join(kosullar), parametreler
+        ).rowcount
+    
+    def anomalileri_kaydet(self, anomaliler, kapsam=None):
+        """
+        Anomali tespit sonuçlarını uzun formatta veritabanına yazar
+        
+        Her anomali satırı: anomali, bolge, FIRIN KODU, TARİH, DEGER (bölüm
+        tablolarında ayrıca BİTİŞ, SÜRE (DK), KAYIT, ORTALAMA FARK)
+        
+        Kayıtlar ANOMALI_ANAHTARI üzerinden eklenir veya güncellenir; önceki
+        çalıştırmaların anomalileri korunur. kapsam verilirse o verinin zaman
+        aralığındaki ve fırınlarındaki eski kayıtlar önce silinir.
+        
+        Args:
+            anomaliler (dict): Anomali adı (ör. 'SICAKLIK_KONTROL_CEH.2 ALT1') -> DataFrame
+            kapsam (pd.DataFrame): Anomalilerin arandığı veri (TARİH, FIRIN KODU)
+        """
+        df = anomalileri_birlestir(anomaliler)
+        
+        with self.baglan() as baglanti:
+            # Benzersiz anahtarı olmayan eski tablo bir kez baştan oluşturulur
+            if self._sutunlar(baglanti, self.ANOMALI_TABLOSU) \
+                    and not self._indeks_var_mi(baglanti, 'ux_anomaliler_kayit'):
+                baglanti.execute(f'DROP TABLE "{self.ANOMALI_TABLOSU}"')
+            
+            silinen = self._kapsamdaki_anomalileri_sil(baglanti, kapsam) if kapsam is not None else 0
+            
+            if df is None:
+                return
+            
+            self._tablo_olustur(
+                baglanti, self.ANOMALI_TABLOSU, df,
+                indeksler={
+                    'ix_anomaliler_tarih': ['TARİH'],
+                    'ix_anomaliler_bolge_tarih': ['bolge', 'TARİH'],
+                    'ix_anomaliler_firin_tarih': ['FIRIN KODU', 'TARİH']
+                },
+                benzersiz=('ux_anomaliler_kayit', self.ANOMALI_ANAHTARI)
+            )
+            
+            sutunlar = [c for c in self._sutunlar(baglanti, self.ANOMALI_TABLOSU) if c in df.columns]
+            liste = ', '.join(f'"{c}"' for c in sutunlar)
+            yer_tutucular = ', '.join('?' * len(sutunlar))
+            baglanti.executemany(
+                f'INSERT OR REPLACE INTO "{self.ANOMALI_TABLOSU}" ({liste}) VALUES ({yer_tutucular})',
+                self._satirlar(df[sutunlar])
+            )
+            toplam = baglanti.execute(f'SELECT COUNT(*) FROM "{self.ANOMALI_TABLOSU}"').fetchone()[0]
+        
+        print(f"🗄️  {len(df)} anomali kaydı '{self.db_yolu}' veritabanına yazıldı "
+              f"({silinen} eski kayıt yeniden hesaplandı, tabloda {toplam} kayıt)")
+    
+    def _sorgula(self, tablo, sutunlar=None, baslangic=None, bitis=None, esitlikler=None):
+        """
+        İndekslenmiş sütunlar üzerinden filtreli sorgu çalıştırır
+        
+        Args:
+            tablo (str): Tablo adı
+            sutunlar (list): Getirilecek sütunlar (None ise tümü)
+            baslangic: Bu zamandan itibaren (dahil)
+            bitis: Bu zamana kadar (hariç)
+            esitlikler (dict): Sütun -> aranan değer (None olanlar yok sayılır)
+        
+        Returns:
+            pd.DataFrame: Sorgu sonucu
+        """
+        with self.baglan() as baglanti:
+            mevcut = self._sutunlar(baglanti, tablo)
+            if not mevcut:
+                return pd.DataFrame()
+            
+            secilen = mevcut if sutunlar is None else [c for c in mevcut if c in sutunlar]
+            kosullar, parametreler = [], []
+            
+            if baslangic is not None:
+                kosullar.append('"TARİH" >= ?')
+                parametreler.append(_zaman_metni(baslangic))
+            if bitis is not None:
+                kosullar.append('"TARİH" < ?')
+                parametreler.append(_zaman_metni(bitis))
+            for col, deger in (esitlikler or {}).items():
+                if deger is not None:
+                    kosullar.append(f'"{col}" = ?')
+                    parametreler.append(deger.item() if hasattr(deger, 'item') else deger)
+            
+            liste = ', '.join(f'"{c}"' for c in secilen)
+            sorgu = f'SELECT {liste} FROM "{tablo}"'
+            if kosullar:
+                sorgu += ' WHERE ' + ' AND '.join(kosullar)
+            sorgu += ' ORDER BY "TARİH"'
+            
+            df = pd.read_sql_query(sorgu, baglanti, params=parametreler)
+        
+        if 'TARİH' in df.columns:
+            df['TARİH'] = pd.to_datetime(df['TARİH'])
+        return df
+    
+    def olcumleri_getir(self, baslangic=None, bitis=None, firin_kodu=None, sutunlar=None):
+        """
+        Ölçümleri zaman ve fırına göre getirir
+        
+        Args:
+            baslangic: Başlangıç zamanı (dahil)
+            bitis: Bitiş zamanı (hariç)
+            firin_kodu (str): FIRIN KODU filtresi
+            sutunlar (list): Getirilecek sütunlar (None ise tümü)
+        
+        Returns:
+            pd.DataFrame: Kompakt tipli ölçüm verisi
+        """
+        df = self._sorgula(self.OLCUM_TABLOSU, sutunlar, baslangic, bitis, {'FIRIN KODU': firin_kodu})
+        return semayi_uygula(df, rapor=False)
+    
+    def anomalileri_getir(self, bolge=None, baslangic=None, bitis=None, firin_kodu=None):
+        """
+        Anomalileri bölge, zaman ve fırına göre getirir
+        
+        Örnek: CEH.2 ALT1 bölgesinin Kasım ayı anomalileri
+            depo.anomalileri_getir('CEH.2 ALT1', '2024-11-01', '2024-12-01')
+        
+        Args:
+            bolge (str): Bölge adı (ör. 'CEH.2 ALT1')
+            baslangic: Başlangıç zamanı (dahil)
+            bitis: Bitiş zamanı (hariç)
+            firin_kodu (str): FIRIN KODU filtresi
+        
+        Returns:
+            pd.DataFrame: Anomali kayıtları (bölümler başlangıç zamanına göre)
+        """
+        df = self._sorgula(
+            self.ANOMALI_TABLOSU, None, baslangic, bitis,
+            {'bolge': bolge, 'FIRIN KODU': firin_kodu}
+        )
+        if 'BİTİŞ' in df.columns:
+            df['BİTİŞ'] = pd.to_datetime(df['BİTİŞ'])
+        return df
+
+
+# Test için
+if __name__ == "__main__":
+    depo = FirinDeposu()
+    
+    if depo.mevcut_mu():
+        df = depo.olcumleri_getir()
+        print(f"✅ {len(df)} ölçüm okundu: {df['TARİH'].min()} - {df['TARİH'].max()}")
+        
+        anomaliler = depo.anomalileri_getir()
+        if len(anomaliler) > 0:
+            print("\n📊 Bölge bazında anomali sayıları:")
+            print(anomaliler['bolge'].value_counts().to_string())
+    else:
+        print(f"❌ HATA: {depo.db_yolu} bulunamadı! Önce veri_temizleme.py çalıştırılmalı.")
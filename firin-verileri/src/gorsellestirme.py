@@ -11,6 +11,13 @@ from datetime import datetime
 import warnings
 warnings.filterwarnings('ignore')
 
+try:
+    from .islem_baglami import paylasimli_gorunum
+    from .veri_semasi import gun_anahtari
+except ImportError:
+    from islem_baglami import paylasimli_gorunum
+    from veri_semasi import gun_anahtari
+
 # Türkçe karakter desteği
 plt.rcParams['font.family'] = 'DejaVu Sans'
 plt.rcParams['axes.unicode_minus'] = False
@@ -25,7 +32,7 @@ class FirinGorselestirici:
         Args:
             df (pd.DataFrame): Görselleştirilecek DataFrame
         """
-        self.df = df.copy()
+        self.df = paylasimli_gorunum(df)
         self.output_dir = 'reports/figures/'
         
         # Renk paleti
@@ -42,6 +49,33 @@ class FirinGorselestirici:
         sns.set_style("whitegrid")
         plt.style.use('seaborn-v0_8-darkgrid')
     
+    @classmethod
+    def gerekli_sutunlar(cls, mevcut):
+        """
+        Analizin kullandığı sütunları döndürür
+        
+        Args:
+            mevcut (list): Veri kümesindeki sütunlar
+        
+        Returns:
+            list: Yüklenecek sütunlar
+        """
+        # Grafikler ISI, GÜÇ ve AMP. sütunlarını kullanır; _FARK gerekmez
+        return [col for col in mevcut
+                if col in ('TARİH', 'FIRIN KODU', 'GUN') or col.startswith('SICAKLIK_KONTROL_')
+                or 'GÜÇ %' in col or 'AMP.' in col
+                or col.endswith('ISI')]
+    
+    @classmethod
+    def veri_kumesinden(cls, kume):
+        """
+        Veri kümesinden sadece gerekli sütunları yükleyerek nesne oluşturur
+        
+        Args:
+            kume (TembelVeriKumesi): Temizlenmiş veri kümesi
+        """
+        return cls(kume.sec(cls.gerekli_sutunlar(kume.sutunlar)))
+    
     def sicaklik_zaman_serisi(self):
         """
         Tüm sıcaklık sensörlerinin zaman serisi grafiği
@@ -49,7 +83,7 @@ class FirinGorselestirici:
         print("\n🌡️ Sıcaklık Zaman Serisi Grafikleri Oluşturuluyor...")
         
         # Günlük ortalamalar
-        gunluk = self.df.groupby(self.df['TARİH'].dt.date).agg({
+        gunluk = self.df.groupby(gun_anahtari(self.df)).agg({
             'GİRİŞ ISI': 'mean',
             'ÖN ISITMA ISI': 'mean',
             'CEH.1 ÜST1 ISI': 'mean',
@@ -227,7 +261,7 @@ class FirinGorselestirici:
         amp_cols = [col for col in self.df.columns if 'AMP.' in col]
         
         # Günlük ortalamalar
-        gunluk = self.df.groupby(self.df['TARİH'].dt.date).agg({
+        gunluk = self.df.groupby(gun_anahtari(self.df)).agg({
             col: 'mean' for col in guc_cols[:4]
         })
         
@@ -281,7 +315,7 @@ class FirinGorselestirici:
         fig.suptitle('Soğutma Sistemi Performans Analizi', fontsize=18, fontweight='bold')
         
         # 1. Soğutma Trendi
-        gunluk = self.df.groupby(self.df['TARİH'].dt.date).agg({
+        gunluk = self.df.groupby(gun_anahtari(self.df)).agg({
             'SOĞUTMA1 ISI': 'mean',
             'SOĞUTMA2 ISI': 'mean',
             'SOĞUTMA3 ISI': 'mean'
@@ -301,7 +335,7 @@ class FirinGorselestirici:
         
         # 2. Soğutma Farkı
         self.df['SOGUTMA_FARKI'] = self.df['SOĞUTMA1 ISI'] - self.df['SOĞUTMA3 ISI']
-        gunluk_fark = self.df.groupby(self.df['TARİH'].dt.date)['SOGUTMA_FARKI'].mean()
+        gunluk_fark = self.df.groupby(gun_anahtari(self.df))['SOGUTMA_FARKI'].mean()
         
         axes[0, 1].plot(gunluk_fark.index, gunluk_fark.values, 
                        marker='o', linewidth=2.5, markersize=8, color=self.colors['bilgi'])
@@ -514,7 +548,7 @@ class FirinGorselestirici:
         
         # 3. Günlük Trend (Line)
         ax3 = fig.add_subplot(gs[1, :])
-        gunluk_ort = self.df.groupby(self.df['TARİH'].dt.date).agg({
+        gunluk_ort = self.df.groupby(gun_anahtari(self.df)).agg({
             'CEH.2 ÜST1 ISI': 'mean',
             'CEH.3 ÜST1 ISI': 'mean'
         })
@@ -624,12 +658,14 @@ class FirinGorselestirici:
 
 # Test için
 if __name__ == "__main__":
-    # Temizlenmiş veriyi yükle
+    from veri_kumesi import TembelVeriKumesi
+    
+    # Temizlenmiş veriyi yükle (sadece analizin kullandığı sütunlar)
     print("\n📂 Temizlenmiş fırın verisi yükleniyor...")
-    df = pd.read_csv('data/processed/firin_temiz.csv')
-    df['TARİH'] = pd.to_datetime(df['TARİH'])
+    kume = TembelVeriKumesi('data/processed/firin_temiz.parquet')
     
-    print(f"✅ Veri yüklendi: {len(df)} satır, {len(df.columns)} sütun")
+    df = kume.sec(FirinGorselestirici.gerekli_sutunlar(kume.sutunlar))
+    print(f"✅ Veri yüklendi: {len(df)} satır, {len(df.columns)}/{len(kume.sutunlar)} sütun")
     print(f"📅 Tarih aralığı: {df['TARİH'].min()} - {df['TARİH'].max()}")
     
     # Görselleştirici oluştur
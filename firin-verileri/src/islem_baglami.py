@@ -0,0 +1,15 @@
+"""
+Fırın Verileri - İşlem Bağlamı Modülü
+Bu modül analiz adımlarının temizlenmiş veriyi kopyalamadan paylaşmasını
+sağlar (*_FARK, *_DEGISIM gibi türetilmiş sütunlar sadece ekleyen adımın
+görünümünde kalır). Uygulama pres projesiyle paylaşılan
+ortak/islem_baglami.py'dedir.
+"""
+
+# Depo kökündeki ortak paket için
+try:
+    from . import ortak_yolu
+except ImportError:
+    import ortak_yolu
+
+from ortak.islem_baglami import IslemBaglami, paylasimli_gorunum
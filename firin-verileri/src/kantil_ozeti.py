@@ -0,0 +1,22 @@
+"""
+Fırın Verileri - Kantil Özeti Modülü
+Bu modül KLL kantil özetlerini fırın kodu bazında tutar. Akış
+temizleyicisinin aykırı değer raporu bu özetlerden üretilir. Özetlerin
+uygulaması pres projesiyle paylaşılan ortak/kantil_ozeti.py'dedir.
+"""
+
+# Depo kökündeki ortak paket için
+try:
+    from . import ortak_yolu
+except ImportError:
+    import ortak_yolu
+
+from ortak.kantil_ozeti import KLLOzeti, VARSAYILAN_GRUP, OZET_DOSYASI
+from ortak.kantil_ozeti import KantilOzetleri as _KantilOzetleri
+
+class KantilOzetleri(_KantilOzetleri):
+    """
+    Fırın (grup) ve sütun bazında KLL özetleri
+    """
+    
+    GRUP_SUTUNU = 'FIRIN KODU'
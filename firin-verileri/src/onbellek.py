@@ -0,0 +1,14 @@
+"""
+Fırın Verileri - Önbellek Modülü
+Bu modül Excel'den ayrıştırılan fırın verilerini sütunlu formatta (Parquet) diskte saklar.
+Kaynak dosya değişmediği sürece sonraki çalıştırmalar Excel'i yeniden ayrıştırmaz.
+Uygulama pres projesiyle paylaşılan ortak/onbellek.py'dedir.
+"""
+
+# Depo kökündeki ortak paket için
+try:
+    from . import ortak_yolu
+except ImportError:
+    import ortak_yolu
+
+from ortak.onbellek import ExcelOnbellek
@@ -8,6 +8,11 @@ import json
 from datetime import datetime
 import os
 
+try:
+    from .veri_kumesi import TembelVeriKumesi
+except ImportError:
+    from veri_kumesi import TembelVeriKumesi
+
 def ozet_rapor_olustur():
     """
     Fırın analizi için özet TXT raporu oluşturur
@@ -17,9 +22,9 @@ def ozet_rapor_olustur():
     with open('reports/firin_performans_raporu.json', 'r', encoding='utf-8') as f:
         performans = json.load(f)
     
-    # Temizlenmiş veriyi yükle
-    df = pd.read_csv('data/processed/firin_temiz.csv')
-    df['TARİH'] = pd.to_datetime(df['TARİH'])
+    # Temizlenmiş veriyi yükle (rapor sadece zaman ve soğutma sütunlarını kullanır)
+    kume = TembelVeriKumesi('data/processed/firin_temiz.parquet')
+    df = kume.sec(['TARİH', 'SOĞUTMA1 ISI', 'SOĞUTMA2 ISI', 'SOĞUTMA3 ISI'])
     
     # Rapor metni
     rapor = []
@@ -37,7 +42,7 @@ def ozet_rapor_olustur():
     rapor.append("-" * 80)
     rapor.append(f"   Ham Veri Satırı: {len(df):,}")
     rapor.append(f"   Temizlenmiş Veri Satırı: {len(df):,}")
-    rapor.append(f"   Sütun Sayısı: {len(df.columns)}")
+    rapor.append(f"   Sütun Sayısı: {len(kume.sutunlar)}")
     rapor.append(f"   Tarih Aralığı: {df['TARİH'].min().date()} - {df['TARİH'].max().date()}")
     rapor.append(f"   Analiz Dönemi: {(df['TARİH'].max() - df['TARİH'].min()).days + 1} gün")
     rapor.append(f"   Toplam Sıcaklık Sensörü: 30 adet")
@@ -197,6 +202,10 @@ def ozet_rapor_olustur():
     rapor.append(f"   Analiz Dönemi: {performans['operasyonel_verimlilik']['toplam_gun']} gün")
     rapor.append(f"   Günlük Ortalama Kayıt: {performans['operasyonel_verimlilik']['gunluk_ortalama']:.0f}")
     rapor.append(f"   Veri Tutarlılığı: {performans['operasyonel_verimlilik']['tutarlilik_skoru']:.1f}/100")
+    if 'kapsama' in performans['operasyonel_verimlilik']:
+        rapor.append(f"   Kesinti: {performans['operasyonel_verimlilik']['kesinti_sayisi']} adet, "
+                     f"{performans['operasyonel_verimlilik']['kesinti_saat']:.1f} saat")
+        rapor.append(f"   Veri Kapsaması: {performans['operasyonel_verimlilik']['kapsama']*100:.2f}%")
     
     # 10. SONUÇ VE ÖNERİLER
     rapor.append("\n10. SONUÇ VE DEĞERLENDİRME")
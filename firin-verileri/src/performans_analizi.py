@@ -10,19 +10,75 @@ from datetime import datetime
 import warnings
 warnings.filterwarnings('ignore')
 
+try:
+    from .islem_baglami import paylasimli_gorunum
+    from .veri_semasi import gun_anahtari
+    from .zaman_indeksi import ZamanIndeksi
+except ImportError:
+    from islem_baglami import paylasimli_gorunum
+    from veri_semasi import gun_anahtari
+    from zaman_indeksi import ZamanIndeksi
+
 class FirinPerformansAnalizci:
     """
     Fırın performans analizlerini gerçekleştiren sınıf
     """
     
-    def __init__(self, df):
+    def __init__(self, df, zaman_indeksi=None):
         """
         Args:
             df (pd.DataFrame): Analiz edilecek DataFrame
+            zaman_indeksi (ZamanIndeksi): Temizlikte oluşturulan kesinti indeksi
+                (None ise kaydedilmiş indeks veriyle uyumluysa o, değilse
+                veriden yenisi kullanılır)
         """
-        self.df = df.copy()
+        self.df = paylasimli_gorunum(df)
+        self.zaman_indeksi = zaman_indeksi
         self.performans_raporu = {}
         
+    @classmethod
+    def gerekli_sutunlar(cls, mevcut):
+        """
+        Analizin kullandığı sütunları döndürür
+        
+        Args:
+            mevcut (list): Veri kümesindeki sütunlar
+        
+        Returns:
+            list: Yüklenecek sütunlar
+        """
+        # SET ve gerçek ISI ile GÜÇ sütunları; AMP. ve _FARK gerekmez
+        return [col for col in mevcut
+                if col in ('TARİH', 'FIRIN KODU', 'GUN') or 'GÜÇ %' in col
+                or col.endswith('ISI')]
+    
+    @classmethod
+    def veri_kumesinden(cls, kume, zaman_indeksi=None):
+        """
+        Veri kümesinden sadece gerekli sütunları yükleyerek nesne oluşturur
+        
+        Args:
+            kume (TembelVeriKumesi): Temizlenmiş veri kümesi
+            zaman_indeksi (ZamanIndeksi): Kesinti indeksi (opsiyonel)
+        """
+        return cls(kume.sec(cls.gerekli_sutunlar(kume.sutunlar)), zaman_indeksi)
+    
+    def _zaman_indeksini_hazirla(self):
+        """
+        Kesinti indeksini döndürür; verilmemişse kaydedilmiş olanı dener,
+        o da veriyle uyumlu değilse zaman sütunlarından oluşturur
+        """
+        if self.zaman_indeksi is None:
+            indeks = ZamanIndeksi.yukle()
+            if indeks is not None and indeks.uyumlu_mu(self.df):
+                print("   (kesinti tablosu kaydedilmiş zaman indeksinden okundu)")
+            else:
+                sutunlar = [col for col in ('FIRIN KODU', 'TARİH') if col in self.df.columns]
+                indeks = ZamanIndeksi.veriden(ZamanIndeksi.sirala(self.df[sutunlar]))
+            self.zaman_indeksi = indeks
+        
+        return self.zaman_indeksi
+    
     def sicaklik_kontrol_performansi(self):
         """
         Sıcaklık kontrol sisteminin performansını değerlendirir
@@ -128,7 +184,7 @@ class FirinPerformansAnalizci:
             print(f"   Durum: {durum}")
             
             # Günlük güç kullanımı trendi
-            gunluk_guc = self.df.groupby(self.df['TARİH'].dt.date)[guc_cols].mean().mean(axis=1)
+            gunluk_guc = self.df.groupby(gun_anahtari(self.df))[guc_cols].mean().mean(axis=1)
             trend_artis = gunluk_guc.iloc[-1] - gunluk_guc.iloc[0]
             
             if abs(trend_artis) < 5:
@@ -285,17 +341,33 @@ class FirinPerformansAnalizci:
         print(f"   Bitiş: {bitis.date()}")
         print(f"   Toplam: {toplam_gun} gün ({toplam_saat} saat)")
         
-        # Kayıt sayısı analizi
+        # Kayıt sayısı analizi (beklenen kayıt, kesintiler dışındaki sürenin
+        # nominal kayıt aralığına bölümü)
+        indeks = self._zaman_indeksini_hazirla()
         toplam_kayit = len(self.df)
-        beklenen_kayit = toplam_saat * 20  # Saatte ~20 kayıt bekleniyor
+        beklenen_kayit = indeks.beklenen_kayit()
+        ornekleme_dk = indeks.ornekleme_dk()
         
         print(f"\n📊 Veri Kayıt Analizi:")
         print(f"   Gerçek Kayıt: {toplam_kayit:,}")
-        print(f"   Beklenen Kayıt: {beklenen_kayit:,}")
+        print(f"   Beklenen Kayıt: {beklenen_kayit:,.0f} (kayıt aralığı {ornekleme_dk:.1f} dk)")
         print(f"   Kayıt Oranı: {(toplam_kayit/beklenen_kayit)*100:.1f}%")
         
+        # Kesinti ve kapsama (kesinti tablosundan)
+        kesintiler = indeks.bosluklar()
+        kesinti_saat = indeks.kesinti_suresi() / 60
+        kapsama = indeks.kapsama()
+        
+        print(f"\n⏸️  Kesintiler ({indeks.esik_dk:.0f} dakikadan uzun kayıt aralıkları):")
+        print(f"   Kesinti Sayısı: {len(kesintiler)}")
+        print(f"   Toplam Kesinti: {kesinti_saat:.1f} saat")
+        if len(kesintiler) > 0:
+            en_uzun = kesintiler.loc[kesintiler['SURE_DK'].idxmax()]
+            print(f"   En Uzun: {en_uzun['SURE_DK']/60:.1f} saat ({en_uzun['BASLANGIC']} - {en_uzun['BITIS']})")
+        print(f"   Veri Kapsaması: {kapsama*100:.2f}%")
+        
         # Günlük kayıt dağılımı
-        gunluk_kayit = self.df.groupby(self.df['TARİH'].dt.date).size()
+        gunluk_kayit = self.df.groupby(gun_anahtari(self.df)).size()
         
         print(f"\n📈 Günlük Veri Dağılımı:")
         print(f"   Ortalama: {gunluk_kayit.mean():.0f} kayıt/gün")
@@ -325,7 +397,12 @@ class FirinPerformansAnalizci:
             'toplam_gun': toplam_gun,
             'toplam_kayit': toplam_kayit,
             'gunluk_ortalama': gunluk_kayit.mean(),
-            'tutarlilik_skoru': tutarlilik_skoru
+            'tutarlilik_skoru': tutarlilik_skoru,
+            'beklenen_kayit': beklenen_kayit,
+            'ornekleme_dk': ornekleme_dk,
+            'kesinti_sayisi': len(kesintiler),
+            'kesinti_saat': kesinti_saat,
+            'kapsama': kapsama
         }
         
         return tutarlilik_skoru
@@ -528,12 +605,14 @@ class FirinPerformansAnalizci:
 
 # Test için
 if __name__ == "__main__":
-    # Temizlenmiş veriyi yükle
+    from veri_kumesi import TembelVeriKumesi
+    
+    # Temizlenmiş veriyi yükle (sadece analizin kullandığı sütunlar)
     print("\n📂 Temizlenmiş fırın verisi yükleniyor...")
-    df = pd.read_csv('data/processed/firin_temiz.csv')
-    df['TARİH'] = pd.to_datetime(df['TARİH'])
+    kume = TembelVeriKumesi('data/processed/firin_temiz.parquet')
     
-    print(f"✅ Veri yüklendi: {len(df)} satır, {len(df.columns)} sütun")
+    df = kume.sec(FirinPerformansAnalizci.gerekli_sutunlar(kume.sutunlar))
+    print(f"✅ Veri yüklendi: {len(df)} satır, {len(df.columns)}/{len(kume.sutunlar)} sütun")
     print(f"📅 Tarih aralığı: {df['TARİH'].min()} - {df['TARİH'].max()}")
     
     # Performans analizi yap
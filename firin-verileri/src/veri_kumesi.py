@@ -0,0 +1,14 @@
+"""
+Fırın Verileri - Veri Kümesi Modülü
+Bu modül temizlenmiş veriyi sütunlu (Parquet) olarak saklar ve analiz
+adımlarına sadece ihtiyaç duydukları sütunları yükler (tembel yükleme).
+Uygulama pres projesiyle paylaşılan ortak/veri_kumesi.py'dedir.
+"""
+
+# Depo kökündeki ortak paket için
+try:
+    from . import ortak_yolu
+except ImportError:
+    import ortak_yolu
+
+from ortak.veri_kumesi import TembelVeriKumesi, sutunlari_filtrele
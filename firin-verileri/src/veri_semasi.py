@@ -0,0 +1,145 @@
+"""
+Fırın Verileri - Veri Şeması Modülü
+Bu modül fırın verileri için kompakt veri tiplerini tanımlar.
+TARİH ve SAAT tek bir datetime64 zaman damgasında (TARİH) birleştirilir.
+Sensör okumaları float64 kalır: sıcaklık kontrol ve IQR eşikleri bu değerlerle
+karşılaştırılır, float32 yuvarlaması sınırdaki okumaları öbür tarafa taşır. Günlük, saatlik ve vardiya bazlı gruplamalar
+için zaman damgasından bir kez hesaplanan anahtar sütunları (GUN, SAAT_NO,
+VARDIYA) eklenir; analizler Python date nesneleri üretmeden bunlarla gruplar.
+"""
+
+import numpy as np
+import pandas as pd
+
+# Tüm sensör okumaları (ISI, GÜÇ %, AMP.) için hedef tip (tam hassasiyet)
+SENSOR_TIPI = 'float64'
+
+# SAAT sütununun metin formatı
+SAAT_FORMATI = '%H:%M:%S'
+
+# Zaman damgasından türetilen gruplama anahtarları
+ZAMAN_ANAHTARLARI = ('GUN', 'SAAT_NO', 'VARDIYA')
+
+# Sensör tipine çevrilmeyen zaman ve kimlik sütunları
+SENSOR_OLMAYANLAR = ('TARİH', 'SAAT', 'FIRIN KODU') + ZAMAN_ANAHTARLARI
+
+# Vardiya uzunluğu (saat); 00-08 1., 08-16 2., 16-24 3. vardiya
+VARDIYA_SAATI = 8
+
+def bellek_kullanimi(df):
+    """
+    DataFrame'in bellekte kapladığı alanı hesaplar
+    
+    Args:
+        df (pd.DataFrame): İncelenecek DataFrame
+    
+    Returns:
+        float: Bellek kullanımı (MB)
+    """
+    return df.memory_usage(deep=True).sum() / (1024 * 1024)
+
+def zaman_damgasi_olustur(tarih, saat):
+    """
+    Sadece gün bilgisi içeren TARİH ile SAAT sütununu birleştirir
+    
+    Saat değerleri az sayıda farklı değerden oluştuğu için önce benzersiz
+    değerler çıkarılır, sadece onlar açık formatla (SAAT_FORMATI) ayrıştırılır
+    ve sonuç kodlar üzerinden satırlara dağıtılır. Saati eksik veya
+    okunamayan satırların zaman damgası NaT olur.
+    
+    Args:
+        tarih (pd.Series): Tarih sütunu
+        saat (pd.Series): 'HH:MM:SS' metni veya datetime.time nesneleri
+    
+    Returns:
+        pd.Series: datetime64 zaman damgası
+    """
+    tarih = pd.to_datetime(tarih, errors='coerce').dt.normalize()
+    
+    kodlar, benzersiz = pd.factorize(saat)
+    metin = pd.Index(benzersiz).astype(str)
+    gun_ici = pd.to_datetime(metin, format=SAAT_FORMATI, errors='coerce') - pd.Timestamp('1900-01-01')
+    
+    # Formata uymayanlar (ör. mikrosaniyeli saatler) zaman farkı olarak okunur
+    uymayan = gun_ici.isna()
+    if uymayan.any():
+        gun_ici = gun_ici.where(~uymayan, pd.to_timedelta(metin, errors='coerce'))
+    
+    # Eksik saatin kodu -1'dir; sona eklenen NaT'a düşer
+    gun_ici = np.append(gun_ici.to_numpy(dtype='timedelta64[ns]'),
+                        np.timedelta64('NaT', 'ns'))
+    return tarih + pd.to_timedelta(gun_ici[kodlar], unit='ns')
+
+def zaman_anahtarlari_ekle(df):
+    """
+    TARİH zaman damgasından gün, saat ve vardiya anahtarlarını ekler
+    
+    GUN gün başına yuvarlanmış datetime64, SAAT_NO (0-23) ve VARDIYA (1-3)
+    int8'dir; zamanı eksik satırlarda saat ve vardiya -1 olur.
+    
+    Args:
+        df (pd.DataFrame): TARİH sütunlu DataFrame
+    
+    Returns:
+        pd.DataFrame: Anahtar sütunları eklenmiş DataFrame
+    """
+    zaman = df['TARİH']
+    saat = zaman.dt.hour.fillna(-1).astype('int8')
+    
+    df['GUN'] = zaman.dt.normalize()
+    df['SAAT_NO'] = saat
+    df['VARDIYA'] = saat.where(saat < 0, saat // VARDIYA_SAATI + 1).astype('int8')
+    return df
+
+def gun_anahtari(df):
+    """
+    Günlük gruplama anahtarı (GUN sütunu yoksa TARİH'ten hesaplanır)
+    
+    Args:
+        df (pd.DataFrame): TARİH veya GUN sütunlu DataFrame
+    
+    Returns:
+        pd.Series: Gün başına yuvarlanmış datetime64 seri
+    """
+    if 'GUN' in df.columns:
+        return df['GUN']
+    return df['TARİH'].dt.normalize().rename('GUN')
+
+def semayi_uygula(df, rapor=True):
+    """
+    Kompakt şemayı fırın DataFrame'ine uygular
+    
+    Çağıranın DataFrame'i değişmez; dönüşümler sığ bir kopyaya yazılır.
+    
+    Args:
+        df (pd.DataFrame): Dönüştürülecek DataFrame
+        rapor (bool): True ise önce/sonra bellek kullanımını yazdır
+    
+    Returns:
+        pd.DataFrame: Kompakt tipli DataFrame
+    """
+    onceki_mb = bellek_kullanimi(df) if rapor else None
+    
+    # Sütun atamaları çağıranın çerçevesine yansımasın (veri kopyalanmaz)
+    df = df.copy(deep=False)
+    
+    if 'TARİH' in df.columns and 'SAAT' in df.columns:
+        df['TARİH'] = zaman_damgasi_olustur(df['TARİH'], df['SAAT'])
+        df = df.drop(columns='SAAT')
+    elif 'TARİH' in df.columns:
+        df['TARİH'] = pd.to_datetime(df['TARİH'], errors='coerce')
+    
+    for col in df.columns:
+        if col not in SENSOR_OLMAYANLAR and pd.api.types.is_numeric_dtype(df[col]) \
+                and not pd.api.types.is_bool_dtype(df[col]) and df[col].dtype != SENSOR_TIPI:
+            df[col] = df[col].astype(SENSOR_TIPI)
+    
+    if 'TARİH' in df.columns:
+        df = zaman_anahtarlari_ekle(df)
+    
+    if rapor:
+        sonraki_mb = bellek_kullanimi(df)
+        print(f"\n🗜️  Bellek: {onceki_mb:.2f} MB → {sonraki_mb:.2f} MB "
+              f"({(1 - sonraki_mb / onceki_mb) * 100 if onceki_mb else 0:.0f}% azaldı)")
+    
+    return df
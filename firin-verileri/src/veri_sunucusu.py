@@ -0,0 +1,134 @@
+"""
+Fırın Verileri - Veri Sunucusu Modülü
+Bu modül fırın ölçümlerini ağ üzerinden alan veri sunucusunu (ortak/
+veri_sunucusu.py, pres projesiyle paylaşılır) fırının temizleme ve sıcaklık
+kontrol anomalisi adımlarına bağlar.
+
+Protokol (her satır bir kayıt):
+    {"FIRIN KODU": "F1", "TARİH": "2024-11-01 08:00:00", "GİRİŞ ISI": 512, ...}
+    veya CSV: bağlantının ilk CSV satırı başlık, sonrakiler kayıt
+"""
+
+import pandas as pd
+import asyncio
+import io
+from contextlib import redirect_stdout
+from datetime import datetime
+
+# Depo kökündeki ortak paket için
+try:
+    from . import ortak_yolu
+except ImportError:
+    import ortak_yolu
+
+from ortak.veri_sunucusu import SutunTamponu, satiri_coz, tekrar_oynat
+from ortak.veri_sunucusu import VeriSunucusu as _VeriSunucusu
+
+try:
+    from .veri_semasi import SENSOR_OLMAYANLAR, SENSOR_TIPI, semayi_uygula
+    from .veri_temizleme import FirinVeriTemizleyici
+    from .anomali_tespiti import FirinAnomaliBulucu
+except ImportError:
+    from veri_semasi import SENSOR_OLMAYANLAR, SENSOR_TIPI, semayi_uygula
+    from veri_temizleme import FirinVeriTemizleyici
+    from anomali_tespiti import FirinAnomaliBulucu
+
+class VeriSunucusu(_VeriSunucusu):
+    """
+    Fırın ölçümlerini dinleyen veri sunucusu (pres sunucusuyla aynı makinede
+    çalışabilmesi için ayrı port)
+    """
+    
+    VARSAYILAN_PORT = 9010
+
+def olcumleri_tiplendir(df):
+    """
+    Ham ölçüm partisini akış okuyucusuyla (_parcayi_donustur) aynı şemaya çevirir
+    
+    Args:
+        df (pd.DataFrame): Ham ölçümler (metin veya sayı)
+    
+    Returns:
+        pd.DataFrame: Kompakt tipli ölçümler
+    """
+    for col in df.columns:
+        if col not in SENSOR_OLMAYANLAR:
+            df[col] = pd.to_numeric(df[col], errors='coerce').astype(SENSOR_TIPI)
+    
+    return semayi_uygula(df, rapor=False)
+
+class FirinPartiIsleyici:
+    """
+    Gelen ölçüm partilerini temizleyip sıcaklık kontrol anomalilerini raporlayan sınıf
+    """
+    
+    def __init__(self):
+        self.toplam_olcum = 0
+        self.toplam_anomali = 0
+    
+    def partiyi_isle(self, ham):
+        """
+        Ham ölçüm partisini tiplendirir, temizler ve anomali kontrolünden geçirir
+        
+        Args:
+            ham (pd.DataFrame): Ham ölçüm satırları
+        
+        Returns:
+            dict: Bölge anahtarı -> anomali bölümleri DataFrame'i
+        """
+        df = olcumleri_tiplendir(ham)
+        
+        # Her partinin temizlik/analiz çıktısı ekranı doldurmasın
+        with redirect_stdout(io.StringIO()):
+            df = FirinVeriTemizleyici(df).temizle()
+            bulucu = FirinAnomaliBulucu(df)
+            bulucu.sicaklik_kontrolu_anomalisi()
+        
+        anomali_sayisi = sum(int(a['KAYIT'].sum()) for a in bulucu.anomaliler.values())
+        self.toplam_olcum += len(df)
+        self.toplam_anomali += anomali_sayisi
+        
+        print(f"📥 {datetime.now().strftime('%H:%M:%S')} - {len(df)} yeni ölçüm, "
+              f"{anomali_sayisi} sıcaklık kontrol anomalisi")
+        for anomali, anomali_df in bulucu.anomaliler.items():
+            print(f"   ⚠️  {anomali.replace('SICAKLIK_KONTROL_', '')}: {anomali_df['KAYIT'].sum()} kayıt, "
+                  f"{len(anomali_df)} bölüm")
+        
+        return bulucu.anomaliler
+
+
+# Test için
+if __name__ == "__main__":
+    import sys
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='Fırın telemetri sunucusu ve test istemcisi')
+    alt = parser.add_subparsers(dest='komut', required=True)
+    
+    p_sunucu = alt.add_parser('sunucu', help='Sunucuyu başlat')
+    p_sunucu.add_argument('--port', type=int, default=9010)
+    p_sunucu.add_argument('--udp-port', type=int)
+    p_sunucu.add_argument('--parti', type=int, default=1000)
+    
+    p_oynat = alt.add_parser('oynat', help='CSV kayıtlarını sunucuya gönder')
+    p_oynat.add_argument('dosya', nargs='?', default='data/processed/firin_temiz.csv')
+    p_oynat.add_argument('--port', type=int, default=9010)
+    p_oynat.add_argument('--hiz', type=float, help='Saniyedeki kayıt sayısı')
+    p_oynat.add_argument('--baglanti', type=int, default=4)
+    p_oynat.add_argument('--bicim', choices=['json', 'csv'], default='json')
+    
+    args = parser.parse_args()
+    
+    if args.komut == 'oynat':
+        asyncio.run(tekrar_oynat(args.dosya, port=args.port, hiz=args.hiz,
+                                 baglanti_sayisi=args.baglanti, bicim=args.bicim))
+        sys.exit(0)
+    
+    isleyici = FirinPartiIsleyici()
+    sunucu = VeriSunucusu(isleyici.partiyi_isle, parti_boyutu=args.parti,
+                          port=args.port, udp_port=args.udp_port)
+    
+    try:
+        asyncio.run(sunucu.calistir())
+    except KeyboardInterrupt:
+        print("\n⏹️  Sunucu durduruldu")
@@ -5,62 +5,404 @@ Bu modül eksik değerleri, aykırı değerleri ve veri kalitesi sorunlarını e
 
 import pandas as pd
 import numpy as np
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+try:
+    from .islem_baglami import paylasimli_gorunum
+    from .kantil_ozeti import KantilOzetleri
+    from .zaman_indeksi import ZamanIndeksi
+except ImportError:
+    from islem_baglami import paylasimli_gorunum
+    from kantil_ozeti import KantilOzetleri
+    from zaman_indeksi import ZamanIndeksi
+
+def _seriler(maske):
+    """
+    Maskedeki kesintisiz True serilerini sütun sütun bulur
+    
+    Sadece True konumları üzerinde çalışır; hatalar seyrek olduğunda
+    maliyet matrisin boyutuna değil hata sayısına bağlıdır.
+    
+    Args:
+        maske (np.ndarray): (satır, sütun) boyutlu bool matris
+    
+    Returns:
+        tuple: (sütun, ilk satır, son satır) dizileri, her seri için bir eleman
+    """
+    # Transpoz üzerinden nonzero: konumlar önce sütuna, sonra satıra göre sıralı
+    sutunlar, satirlar = np.nonzero(maske.T)
+    if len(satirlar) == 0:
+        bos = np.array([], dtype=np.intp)
+        return bos, bos, bos
+    
+    yeni_seri = np.ones(len(satirlar), dtype=bool)
+    yeni_seri[1:] = (np.diff(satirlar) != 1) | (np.diff(sutunlar) != 0)
+    baslangiclar = np.flatnonzero(yeni_seri)
+    bitisler = np.append(baslangiclar[1:], len(satirlar)) - 1
+    
+    return sutunlar[baslangiclar], satirlar[baslangiclar], satirlar[bitisler]
+
+def en_uzun_seri(maske):
+    """
+    Her sütundaki en uzun kesintisiz True serisinin uzunluğunu bulur
+    
+    Args:
+        maske (np.ndarray): (satır, sütun) boyutlu bool matris
+    
+    Returns:
+        np.ndarray: Sütun başına en uzun seri uzunluğu
+    """
+    sutunlar, ilk, son = _seriler(maske)
+    en_uzun = np.zeros(maske.shape[1], dtype=np.int64)
+    np.maximum.at(en_uzun, sutunlar, son - ilk + 1)
+    return en_uzun
+
+def bosluklari_doldur(matris, acik_son=False):
+    """
+    Matrisin tüm sütunlarındaki NaN boşlukları yerinde doğrusal interpolasyonla doldurur
+    
+    Her boşluk serisi, sütundaki bir önceki ve bir sonraki geçerli değer
+    arasında satır sırasına göre doğrusal olarak doldurulur. Baştaki ve
+    sondaki boşluklar en yakın geçerli değerle doldurulur (pandas'taki
+    interpolate(method='linear', limit_direction='both') ile aynı).
+    Tamamen boş sütunlar NaN kalır.
+    
+    Args:
+        matris (np.ndarray): (satır, sütun) boyutlu float matris
+        acik_son (bool): True ise son satıra ulaşan seriler doldurulmaz
+            (akış modunda sağ komşusu henüz gelmemiş boşluklar)
+    
+    Returns:
+        np.ndarray: Doldurulmuş matris (aynı nesne)
+    """
+    n = matris.shape[0]
+    sutunlar, ilk, son = _seriler(np.isnan(matris))
+    
+    if acik_son:
+        kapali = son < n - 1
+        sutunlar, ilk, son = sutunlar[kapali], ilk[kapali], son[kapali]
+    
+    # Serinin hemen öncesi ve sonrası geçerli değerdir; kenarda tek taraf kullanılır
+    onceki = ilk - 1
+    sonraki = son + 1
+    bastaki = onceki < 0
+    sondaki = sonraki >= n
+    onceki[bastaki] = sonraki[bastaki]
+    sonraki[sondaki] = onceki[sondaki]
+    
+    # Tamamen boş sütunlarda geçerli değer yok
+    gecerli = (onceki >= 0) & (onceki < n)
+    sutunlar, ilk, son = sutunlar[gecerli], ilk[gecerli], son[gecerli]
+    onceki, sonraki = onceki[gecerli], sonraki[gecerli]
+    
+    # Her boş hücreyi ait olduğu seriye eşle
+    uzunluklar = son - ilk + 1
+    seri = np.repeat(np.arange(len(uzunluklar)), uzunluklar)
+    satirlar = ilk[seri] + np.arange(len(seri)) - np.repeat(np.cumsum(uzunluklar) - uzunluklar, uzunluklar)
+    
+    y0 = matris[onceki, sutunlar].astype('float64')
+    y1 = matris[sonraki, sutunlar].astype('float64')
+    aralik = (sonraki - onceki)[seri]
+    oran = np.divide(satirlar - onceki[seri], aralik, out=np.zeros(len(seri)), where=aralik > 0)
+    matris[satirlar, sutunlar[seri]] = y0[seri] + (y1 - y0)[seri] * oran
+    
+    return matris
+
+def bosluklari_tasi(matris):
+    """
+    Matrisin tüm sütunlarındaki NaN boşlukları yerinde önceki geçerli değerle,
+    sütun başındakileri ilk geçerli değerle doldurur (ffill().bfill() ile aynı)
+    
+    Args:
+        matris (np.ndarray): (satır, sütun) boyutlu float matris
+    
+    Returns:
+        np.ndarray: Doldurulmuş matris (aynı nesne)
+    """
+    n = matris.shape[0]
+    sutunlar, ilk, son = _seriler(np.isnan(matris))
+    
+    kaynak = ilk - 1
+    bastaki = kaynak < 0
+    kaynak[bastaki] = son[bastaki] + 1
+    
+    gecerli = kaynak < n
+    sutunlar, ilk, son, kaynak = sutunlar[gecerli], ilk[gecerli], son[gecerli], kaynak[gecerli]
+    
+    uzunluklar = son - ilk + 1
+    seri = np.repeat(np.arange(len(uzunluklar)), uzunluklar)
+    satirlar = ilk[seri] + np.arange(len(seri)) - np.repeat(np.cumsum(uzunluklar) - uzunluklar, uzunluklar)
+    matris[satirlar, sutunlar[seri]] = matris[kaynak, sutunlar][seri]
+    
+    return matris
+
+def sensor_grubu(sutun):
+    """
+    Sütunun ait olduğu sensör grubu (ısıtma bölgesi)
+    
+    'CEH.1 ÜST1 SET ISI', 'CEH.1 ÜST1 ISI', 'CEH.1 ÜST1 GÜÇ %' ve
+    'CEH.1 ÜST1 AMP.' aynı gruptadır: 'CEH.1 ÜST1'.
+    """
+    return re.sub(r'\s*(SET ISI|ISI|GÜÇ %|AMP\.)$', '', sutun.strip()) or sutun
+
+def sutun_grubunu_temizle(matris, sensor, ceyrek=None):
+    """
+    Bir sütun grubunu yerinde temizler ve profilini çıkarır
+    
+    Toplu temizleyicinin sütun bazlı adımları: sıcaklık sensörlerinde
+    imkansız değerler interpolasyonla düzeltilir, kalan eksikler ileri/geri
+    doldurulur, aykırı değer analizi için çeyrekler hesaplanır. Sütunlar
+    birbirinden bağımsız olduğu için gruplar ayrı süreçlerde işlenebilir.
+    
+    Args:
+        matris (np.ndarray): (satır, sütun) boyutlu float matris (yerinde değişir)
+        sensor (np.ndarray): Sıcaklık (ISI) sütunlarının bool maskesi
+        ceyrek (np.ndarray): Çeyrekleri hesaplanacak sütunların bool maskesi
+            (None ise sensör sütunları)
+    
+    Returns:
+        dict: Sütun başına hata_sayisi, en_uzun_seri, eksik, degisen, q1, q3
+        dizileri (eksik: interpolasyondan sonra kalan NaN sayısı; degisen:
+        doldurmadan önce hatalı veya eksik değeri olan, yani değiştirilen
+        sütunlar; çeyrek hesaplanmayan sütunlarda q1/q3 NaN)
+    """
+    k = matris.shape[1]
+    hata_sayilari = np.zeros(k, dtype=np.int64)
+    en_uzun = np.zeros(k, dtype=np.int64)
+    
+    # Doldurmadan önceki eksikler; sadece NaN boşluğu olan sütunlar da değişir
+    degisen = np.isnan(matris).any(axis=0)
+    
+    # Sensör hataları (sensor_hatalarini_duzelt ile aynı kurallar)
+    if sensor.any():
+        sensorler = matris[:, sensor]
+        hata_mask = (sensorler < -100) | (sensorler > 2000)
+        hata_sayilari[sensor] = hata_mask.sum(axis=0)
+        en_uzun[sensor] = en_uzun_seri(hata_mask)
+        
+        bosluklu = hata_mask.any(axis=0) | np.isnan(sensorler).any(axis=0)
+        degisen[sensor] |= bosluklu
+        if bosluklu.any():
+            blok = sensorler[:, bosluklu]
+            blok[hata_mask[:, bosluklu]] = np.nan
+            bosluklari_doldur(blok)
+            sensorler[:, bosluklu] = blok
+            matris[:, sensor] = sensorler
+    
+    # Eksik değerler (eksik_degerleri_kontrol_et ile aynı doldurma)
+    eksik = np.isnan(matris).sum(axis=0)
+    if eksik.any():
+        bosluklari_tasi(matris)
+    
+    # Aykırı değer analizi için çeyrekler (pandas quantile ile aynı, float64)
+    q1 = np.full(k, np.nan)
+    q3 = np.full(k, np.nan)
+    for j in np.flatnonzero(sensor if ceyrek is None else ceyrek):
+        kolon = matris[:, j].astype('float64')
+        if not np.isnan(kolon).all():
+            q1[j], q3[j] = np.quantile(kolon, [0.25, 0.75])
+    
+    return {'hata_sayisi': hata_sayilari, 'en_uzun_seri': en_uzun, 'eksik': eksik,
+            'degisen': degisen, 'q1': q1, 'q3': q3}
+
+def _paylasimli_grubu_temizle(paylasim_adi, sekil, tip, bas, son, sensor, ceyrek):
+    """
+    Paylaşımlı bellekteki matrisin [bas, son) sütunlarını temizler (süreç havuzunda çalışır)
+    
+    Matris sütun öncelikli (Fortran) sıradadır; grubun sütunları bellekte
+    bitişiktir ve yerinde değiştirilir. Sadece küçük profil dizileri döner.
+    
+    Returns:
+        tuple: (bas, profil)
+    """
+    paylasim = shared_memory.SharedMemory(name=paylasim_adi)
+    try:
+        matris = np.ndarray(sekil, dtype=tip, buffer=paylasim.buf, order='F')
+        profil = sutun_grubunu_temizle(matris[:, bas:son], sensor, ceyrek)
+        del matris
+    finally:
+        paylasim.close()
+    
+    return bas, profil
 
 class FirinVeriTemizleyici:
     """
     Fırın verileri için temizleme işlemleri yapan sınıf
     """
     
-    def __init__(self, df):
+    def __init__(self, df, calisan_sayisi=1):
         """
         Args:
             df (pd.DataFrame): Temizlenecek DataFrame
+            calisan_sayisi (int): 1'den büyükse sütunlar sensör gruplarına
+                ayrılıp süreç havuzunda paylaşımlı bellek üzerinden temizlenir
+                (None ise çekirdek sayısı)
         """
-        self.df = df.copy()
+        self.df = paylasimli_gorunum(df)
+        self.calisan_sayisi = calisan_sayisi or os.cpu_count()
         self.temizlik_raporu = {
             'baslangic_satir': len(df),
             'silinen_satir': 0,
             'duzeltilen_deger': 0,
             'sorunlar': []
         }
+        
+        # Paralel modda sütun grubu profilleri (eksik sayıları, çeyrekler)
+        self.sutun_profili = None
+        
+        # Zaman tutarlılığı kontrolünde oluşturulan kesinti indeksi
+        self.zaman_indeksi = None
+    
+    def paralel_sutun_temizligi(self):
+        """
+        Ondalıklı sütunları sensör gruplarına bölüp süreç havuzunda temizler
+        
+        Matris tipi toplu moddaki gibi sıcaklık sütunlarından belirlenir;
+        bu tipte olmayan diğer sütunlar sonraki adımlarda toplu işlenir.
+        Sütunlar gruplarına göre sıralanıp bir kez paylaşımlı belleğe
+        (sütun öncelikli) kopyalanır. Her süreç kendi grubunun bitişik
+        sütunlarını yerinde düzeltir, interpolasyon ve doldurmayı yapar,
+        profilini çıkarır; DataFrame süreçlere aktarılmaz (pickle edilmez),
+        sonuç dizileri geri gönderilmez. Değişen sütunlar paylaşımlı
+        bellekten doğrudan DataFrame'e yazılır.
+        
+        Returns:
+            pd.DataFrame: Sütun başına hata_sayisi, en_uzun_seri, eksik, degisen, q1, q3
+        """
+        sicaklik = [col for col in self.df.columns if 'ISI' in col.upper()
+                    and pd.api.types.is_float_dtype(self.df[col])]
+        tip = np.dtype('float32' if (self.df[sicaklik].dtypes == 'float32').all() else 'float64')
+        sutunlar = [col for col in self.df.columns if col in sicaklik or self.df[col].dtype == tip]
+        
+        # Grup sütunları bellekte bitişik olsun diye gruplara göre sıralanır
+        gruplar = {}
+        for col in sutunlar:
+            gruplar.setdefault(sensor_grubu(col), []).append(col)
+        sirali = [col for grup in gruplar.values() for col in grup]
+        sensor = np.array([col in sicaklik for col in sirali])
+        # Çeyrekler aykırı değer analizinin sütunları için (SET hariç sıcaklıklar)
+        ceyrek = sensor & np.array(['SET' not in col.upper() for col in sirali])
+        sekil = (len(self.df), len(sirali))
+        
+        paylasim = shared_memory.SharedMemory(create=True, size=max(1, tip.itemsize * sekil[0] * sekil[1]))
+        try:
+            matris = np.ndarray(sekil, dtype=tip, buffer=paylasim.buf, order='F')
+            for j, col in enumerate(sirali):
+                matris[:, j] = self.df[col].to_numpy(dtype=tip, na_value=np.nan)
+            
+            # Her grup bir görev; [bas, son) sütun aralığı
+            araliklar = []
+            bas = 0
+            for grup in gruplar.values():
+                araliklar.append((bas, bas + len(grup)))
+                bas += len(grup)
+            
+            calisan = min(self.calisan_sayisi, len(araliklar))
+            with ProcessPoolExecutor(max_workers=calisan) as havuz:
+                sonuclar = list(havuz.map(
+                    _paylasimli_grubu_temizle,
+                    [paylasim.name] * len(araliklar),
+                    [sekil] * len(araliklar),
+                    [tip.str] * len(araliklar),
+                    [a for a, _ in araliklar],
+                    [b for _, b in araliklar],
+                    [sensor[a:b] for a, b in araliklar],
+                    [ceyrek[a:b] for a, b in araliklar]
+                ))
+            
+            profil = {ad: np.concatenate([p[ad] for _, p in sorted(sonuclar, key=lambda s: s[0])])
+                      for ad in ('hata_sayisi', 'en_uzun_seri', 'eksik', 'degisen', 'q1', 'q3')}
+            profil = pd.DataFrame(profil, index=sirali)
+            
+            # Sadece değişen sütunlar geri yazılır (doldurmadan önceki maskeye göre;
+            # interpolasyonla kapanan NaN boşlukları da dahil)
+            for j, col in enumerate(sirali):
+                if profil['degisen'].iat[j]:
+                    self.df[col] = matris[:, j]
+            del matris
+        finally:
+            paylasim.close()
+            paylasim.unlink()
+        
+        self.sutun_profili = profil
+        return profil
+    
+    def _sensor_raporu(self, sicaklik_sutunlari, hata_sayilari, en_uzun):
+        """Sensör hatası sayılarını rapora yazar ve yazdırır"""
+        hatali = hata_sayilari > 0
+        duzeltilen_toplam = int(hata_sayilari.sum())
+        
+        self.temizlik_raporu['sensor_hatalari'] = pd.DataFrame({
+            'hata_sayisi': hata_sayilari,
+            'en_uzun_seri': en_uzun
+        }, index=sicaklik_sutunlari)[hatali]
+        
+        if duzeltilen_toplam > 0:
+            for col, satir in self.temizlik_raporu['sensor_hatalari'].iterrows():
+                print(f"\n⚠️  {col}: {satir['hata_sayisi']} hatalı değer bulundu "
+                      f"(en uzun seri: {satir['en_uzun_seri']} ölçüm)")
+                print(f"   ✅ Düzeltildi (interpolasyon)")
+            
+            print(f"\n✅ Toplam {duzeltilen_toplam} sensör hatası düzeltildi!")
+            self.temizlik_raporu['duzeltilen_deger'] += duzeltilen_toplam
+        else:
+            print(f"\n✅ Sensör hatası bulunamadı!")
     
     def sensor_hatalarini_duzelt(self):
         """
         Sıcaklık sensörü hatalarını düzeltir
         (-3276 gibi imkansız değerler)
+        
+        Tüm sıcaklık sütunları tek bir NumPy matrisi olarak ele alınır:
+        hata maskesi, sensör başına hata sayısı, en uzun hata serisi ve
+        doğrusal interpolasyon sütun sütun değil matrisin tamamı üzerinde
+        birer kez hesaplanır. Sensör sütunlarındaki eksik okumalar da
+        hatalı değerler gibi interpolasyonla doldurulur.
         """
         print("\n" + "="*60)
         print("SENSÖR HATALARI DÜZELTİLİYOR")
         print("="*60)
         
         # Sıcaklık sütunlarını bul
-        sicaklik_sutunlari = [col for col in self.df.columns if 'ISI' in col.upper()]
-        
-        duzeltilen_toplam = 0
+        sicaklik_sutunlari = [col for col in self.df.columns if 'ISI' in col.upper()
+                              and pd.api.types.is_numeric_dtype(self.df[col])]
         
-        for col in sicaklik_sutunlari:
-            # İmkansız değerler (negatif veya çok yüksek)
-            # Sıcaklık -273°C'den düşük olamaz (mutlak sıfır)
-            # Endüstriyel fırın 2000°C'den yüksek olamaz
-            
-            hata_mask = (self.df[col] < -100) | (self.df[col] > 2000)
-            hata_sayisi = hata_mask.sum()
+        if not sicaklik_sutunlari:
+            print(f"\n✅ Sensör hatası bulunamadı!")
+            return self
+        
+        # Paralel mod: sensörler ve diğer ondalıklı sütunlar grup grup süreç havuzunda
+        if self.calisan_sayisi > 1 and all(pd.api.types.is_float_dtype(self.df[col]) for col in sicaklik_sutunlari):
+            profil = self.paralel_sutun_temizligi().loc[sicaklik_sutunlari]
+            self._sensor_raporu(sicaklik_sutunlari, profil['hata_sayisi'].to_numpy(),
+                                profil['en_uzun_seri'].to_numpy())
+            return self
+        
+        # Sensörler kompakt şemadaysa matris de float32 kalır
+        tip = 'float32' if (self.df[sicaklik_sutunlari].dtypes == 'float32').all() else 'float64'
+        matris = self.df[sicaklik_sutunlari].to_numpy(dtype=tip, na_value=np.nan)
+        
+        # İmkansız değerler (negatif veya çok yüksek)
+        # Sıcaklık -273°C'den düşük olamaz (mutlak sıfır)
+        # Endüstriyel fırın 2000°C'den yüksek olamaz
+        hata_mask = (matris < -100) | (matris > 2000)
+        hata_sayilari = hata_mask.sum(axis=0)
+        en_uzun = en_uzun_seri(hata_mask)
+        
+        # Sadece hatalı veya eksik okuması olan sütunlar interpolasyona girer
+        bosluklu = (hata_sayilari > 0) | np.isnan(matris).any(axis=0)
+        if bosluklu.any():
+            blok = matris[:, bosluklu]
+            blok[hata_mask[:, bosluklu]] = np.nan
+            bosluklari_doldur(blok)
             
-            if hata_sayisi > 0:
-                print(f"\n⚠️  {col}: {hata_sayisi} hatalı değer bulundu")
-                
-                # Hatalı değerleri NaN yap, sonra interpolate et
-                self.df.loc[hata_mask, col] = np.nan
-                self.df[col] = self.df[col].interpolate(method='linear', limit_direction='both')
-                
-                duzeltilen_toplam += hata_sayisi
-                print(f"   ✅ Düzeltildi (interpolasyon)")
+            for j, col in enumerate(np.asarray(sicaklik_sutunlari)[bosluklu]):
+                self.df[col] = blok[:, j]
         
-        if duzeltilen_toplam > 0:
-            print(f"\n✅ Toplam {duzeltilen_toplam} sensör hatası düzeltildi!")
-            self.temizlik_raporu['duzeltilen_deger'] += duzeltilen_toplam
-        else:
-            print(f"\n✅ Sensör hatası bulunamadı!")
+        self._sensor_raporu(sicaklik_sutunlari, hata_sayilari, en_uzun)
         
         return self
     
@@ -72,7 +414,12 @@ class FirinVeriTemizleyici:
         print("EKSİK DEĞER ANALİZİ")
         print("="*60)
         
-        eksik = self.df.isnull().sum()
+        # Paralel modda ondalıklı sütunlar süreçlerde sayılıp dolduruldu
+        profil = self.sutun_profili
+        diger = self.df.columns if profil is None else self.df.columns.difference(profil.index, sort=False)
+        eksik = self.df[diger].isnull().sum()
+        if profil is not None:
+            eksik = pd.concat([eksik, profil['eksik']]).reindex(self.df.columns)
         eksik_toplam = eksik.sum()
         
         if eksik_toplam > 0:
@@ -82,7 +429,10 @@ class FirinVeriTemizleyici:
                 print(f"   • {col}: {sayi} adet")
             
             # Eksik değerleri doldur (forward fill)
-            self.df = self.df.fillna(method='ffill').fillna(method='bfill')
+            if profil is None:
+                self.df = self.df.ffill().bfill()
+            elif self.df[diger].isna().any().any():
+                self.df[diger] = self.df[diger].ffill().bfill()
             print(f"\n✅ Eksik değerler dolduruldu (forward/backward fill)")
             
             self.temizlik_raporu['sorunlar'].append(
@@ -159,9 +509,14 @@ class FirinVeriTemizleyici:
         
         aykiri_rapor = []
         
+        profil = self.sutun_profili
+        
         for col in sicaklik_sutunlari:
-            Q1 = self.df[col].quantile(0.25)
-            Q3 = self.df[col].quantile(0.75)
+            if profil is not None and col in profil.index:
+                Q1, Q3 = profil.at[col, 'q1'], profil.at[col, 'q3']
+            else:
+                Q1 = self.df[col].quantile(0.25)
+                Q3 = self.df[col].quantile(0.75)
             IQR = Q3 - Q1
             
             lower = Q1 - 1.5 * IQR
@@ -193,25 +548,23 @@ class FirinVeriTemizleyici:
         print("ZAMAN SERİSİ TUTARLILIĞI")
         print("="*60)
         
-        # Tarih sütununu sırala
-        self.df = self.df.sort_values('TARİH').reset_index(drop=True)
-        
-        # Zaman farkını hesapla
-        self.df['ZAMAN_FARKI'] = self.df['TARİH'].diff().dt.total_seconds() / 60  # dakika
+        # Tarih sütununu sırala (birden fazla fırın varsa fırın bazında);
+        # veri zaten sıralıysa sıralama atlanır
+        self.df = ZamanIndeksi.sirala(self.df)
         
-        # Normal aralık: 1-10 dakika (fırın her 3 dakikada kayıt alıyor gibi)
-        anormal_aralikar = ((self.df['ZAMAN_FARKI'] < 0) | 
-                           (self.df['ZAMAN_FARKI'] > 30)).sum()
+        # Kesinti tablosu (30 dakikadan uzun aralıklar) sonraki adımlar için saklanır
+        self.zaman_indeksi = ZamanIndeksi.veriden(self.df, esik_dk=30)
+        anormal_aralikar = self.zaman_indeksi.anormal_sayisi
+        self.temizlik_raporu['zaman_kesintileri'] = self.zaman_indeksi.bosluk_sayisi
         
         if anormal_aralikar > 0:
             print(f"\n⚠️  {anormal_aralikar} anormal zaman aralığı bulundu")
             print(f"   (30 dakikadan uzun veya negatif)")
+            print(f"   Kesinti süresi: {self.zaman_indeksi.kesinti_suresi()/60:.1f} saat, "
+                  f"kapsama: %{self.zaman_indeksi.kapsama()*100:.2f}")
         else:
             print(f"\n✅ Zaman serisi tutarlı!")
         
-        # Geçici sütunu sil
-        self.df = self.df.drop('ZAMAN_FARKI', axis=1)
-        
         return self
     
     def temizlik_raporu_olustur(self):
@@ -270,9 +623,351 @@ class FirinVeriTemizleyici:
         return self.df
 
 
+class FirinAkisTemizleyici:
+    """
+    Fırın verisini parça parça temizleyen akış sınıfı
+    
+    FirinVeriTemizleyici ile aynı adımları (sensör hatası düzeltme, eksik
+    değer doldurma, SET ISI farkları, zaman tutarlılığı) aynı sonuçla
+    uygular, ama tüm geçmişi bellekte tutmaz. Parçalar arasında sadece sınır
+    durumu taşınır: her sütunun son geçerli değeri, son yayınlanan satırın
+    sensör değerleri (interpolasyonun sol ucu) ve sağ ucu henüz gelmemiş
+    boşluk serilerinin satırları. Bellek kullanımı geçmişin uzunluğuna değil
+    en uzun açık boşluğa bağlıdır.
+    
+    Girdi (fırın bazında) zamana göre sıralı gelmelidir; toplu temizleyici
+    veriyi sıralar, akış modu sırasız satırları sadece raporlar. Aykırı
+    değer analizi tüm sütunun çeyreklerini gerektirdiği için akış modunda
+    yayınlanan satırların KLL kantil özetlerinden yaklaşık olarak yapılır
+    (sadece rapor üretir, veriyi değiştirmez).
+    """
+    
+    def __init__(self, azami_bekleme=100000):
+        """
+        Args:
+            azami_bekleme (int): Bekletilecek en fazla satır sayısı; bir boşluk
+                bundan uzun sürerse bekleyen satırlar veri orada bitmiş gibi
+                (ileri doldurmayla) yayınlanır
+        """
+        self.azami_bekleme = azami_bekleme
+        self.temizlik_raporu = {
+            'baslangic_satir': 0,
+            'silinen_satir': 0,
+            'duzeltilen_deger': 0,
+            'sorunlar': []
+        }
+        
+        self.sicaklik_sutunlari = None
+        self.set_ciftleri = None
+        self.aykiri_sutunlari = None
+        self.ozetler = None
+        
+        # Parçalar arası taşınan sınır durumu
+        self._tampon = None
+        self._capa = None
+        self._son_gecerli = {}
+        self.zaman_indeksi = ZamanIndeksi(esik_dk=30)
+        self._acik_hata_serisi = None
+        self._yayinlanan = 0
+        
+        # Rapor sayaçları
+        self._hata_sayilari = None
+        self._en_uzun = None
+        self._eksik = None
+        self._set_ozet = {}
+    
+    def _hazirla(self, parca):
+        """İlk parçadan sütun gruplarını ve sayaçları belirler"""
+        self.sicaklik_sutunlari = [col for col in parca.columns if 'ISI' in col.upper()
+                                   and pd.api.types.is_numeric_dtype(parca[col])]
+        self._tip = 'float32' if (parca[self.sicaklik_sutunlari].dtypes == 'float32').all() else 'float64'
+        
+        # Aykırı değer raporu (aykiri_deger_analizi ile aynı sütunlar) kantil özetlerinden
+        self.aykiri_sutunlari = [col for col in self.sicaklik_sutunlari if 'SET' not in col.upper()]
+        # Rapor eşiği %1 olduğu için özetlerin sıra hatası bunun çok altında tutulur
+        self.ozetler = KantilOzetleri(hata_payi=0.002)
+        
+        # SET ISI - gerçek ISI çiftleri (set_isi_kontrolu ile aynı eşleştirme)
+        self.set_ciftleri = []
+        for set_col in [col for col in parca.columns if 'SET ISI' in col]:
+            gercek_col = set_col.replace('SET ISI', 'ISI').replace('SET', '').strip()
+            if gercek_col in parca.columns and gercek_col != set_col:
+                self.set_ciftleri.append((set_col, gercek_col))
+                self._set_ozet[set_col] = {'toplam': 0.0, 'sayi': 0, 'max': np.nan, 'buyuk': 0}
+        
+        k = len(self.sicaklik_sutunlari)
+        self._hata_sayilari = np.zeros(k, dtype=np.int64)
+        self._en_uzun = np.zeros(k, dtype=np.int64)
+        self._acik_hata_serisi = np.zeros(k, dtype=np.int64)
+        self._eksik = pd.Series(0, index=parca.columns, dtype='int64')
+    
+    def _hatalari_say(self, hata_mask):
+        """Hata sayılarını ve parça sınırını aşan en uzun hata serisini günceller"""
+        self._hata_sayilari += hata_mask.sum(axis=0)
+        
+        sutunlar, ilk, son = _seriler(hata_mask)
+        uzunluk = son - ilk + 1
+        
+        # Önceki parçanın sonundan devam eden seriler
+        bastan = ilk == 0
+        uzunluk[bastan] += self._acik_hata_serisi[sutunlar[bastan]]
+        np.maximum.at(self._en_uzun, sutunlar, uzunluk)
+        
+        self._acik_hata_serisi[:] = 0
+        sonda = son == len(hata_mask) - 1
+        self._acik_hata_serisi[sutunlar[sonda]] = uzunluk[sonda]
+    
+    def _sensorleri_doldur(self, blok, son):
+        """
+        Bloktaki sensör boşluklarını son yayınlanan satırı sol uç alarak doldurur
+        
+        Returns:
+            int: Sağ ucu gelmemiş ilk boşluğun satırı (yoksa len(blok))
+        """
+        n = len(blok)
+        if not self.sicaklik_sutunlari:
+            return n
+        
+        capa = self._capa if self._capa is not None else np.full(len(self.sicaklik_sutunlari), np.nan)
+        matris = np.vstack([
+            np.asarray(capa, dtype=self._tip)[None, :],
+            blok[self.sicaklik_sutunlari].to_numpy(dtype=self._tip, na_value=np.nan)
+        ])
+        
+        bosluklu = np.isnan(matris[1:]).any(axis=0)
+        bosluklari_doldur(matris, acik_son=not son)
+        
+        for j in np.flatnonzero(bosluklu):
+            blok[self.sicaklik_sutunlari[j]] = matris[1:, j]
+        
+        if son or n == 0:
+            return n
+        
+        # Açık serinin başı: son geçerli satırın bir sonrası (çapa satırı hariç)
+        gecerli = ~np.isnan(matris)
+        son_gecerli = n - np.argmax(gecerli[::-1], axis=0)
+        baslangic = np.where(gecerli.any(axis=0), son_gecerli, 0)
+        acik = ~gecerli[-1]
+        
+        return int(baslangic[acik].min()) if acik.any() else n
+    
+    def _yayinla(self, blok, son=False):
+        """
+        Bloğun sonucu kesinleşen satırlarını temizleyip döndürür, kalanı bekletir
+        
+        Args:
+            blok (pd.DataFrame): Bekleyen satırlar + yeni parça (hatalar NaN)
+            son (bool): True ise veri bitti, tüm satırlar yayınlanır
+        
+        Returns:
+            pd.DataFrame: Temizlenmiş satırlar (yayınlanacak satır yoksa None)
+        """
+        n = len(blok)
+        kesim = self._sensorleri_doldur(blok, son)
+        
+        # Henüz hiç geçerli değeri görülmemiş sütunlar geriye doldurulur (bfill)
+        geri_doldur = {}
+        for col in blok.columns:
+            if col in self._son_gecerli or col in self.sicaklik_sutunlari:
+                continue
+            ilk_gecerli = blok[col].first_valid_index()
+            if ilk_gecerli is not None:
+                geri_doldur[col] = blok.at[ilk_gecerli, col]
+            elif not son and blok[col].isna().any():
+                kesim = 0
+        
+        if not son and n - kesim > self.azami_bekleme:
+            print(f"⚠️  {n - kesim} satırlık açık boşluk beklenmeden yayınlanıyor")
+            kesim = self._sensorleri_doldur(blok, son=True)
+        
+        self._tampon = blok.iloc[kesim:].reset_index(drop=True) if kesim < n else None
+        if kesim == 0:
+            return None
+        
+        df = blok.iloc[:kesim].copy()
+        df.index = pd.RangeIndex(self._yayinlanan, self._yayinlanan + kesim)
+        self._yayinlanan += kesim
+        
+        if self.sicaklik_sutunlari:
+            self._capa = df[self.sicaklik_sutunlari].iloc[-1].to_numpy(dtype=self._tip, na_value=np.nan)
+        
+        # Eksik değerler: ileri doldurma, parça başında önceki parçanın son değeri
+        eksik = df.isna().sum()
+        if eksik.any():
+            self._eksik = self._eksik.add(eksik, fill_value=0).astype('int64')
+            df = df.ffill()
+            sinir = {col: deger for col, deger in {**self._son_gecerli, **geri_doldur}.items()
+                     if df[col].isna().any()}
+            if sinir:
+                df = df.fillna(sinir)
+        
+        son_satir = df.iloc[-1]
+        self._son_gecerli.update(son_satir[son_satir.notna()].to_dict())
+        
+        self.ozetler.guncelle(df, self.aykiri_sutunlari)
+        
+        # SET ISI farkları (satır bazlı)
+        for set_col, gercek_col in self.set_ciftleri:
+            fark = abs(df[set_col] - df[gercek_col])
+            df[f'{set_col}_FARK'] = fark
+            
+            ozet = self._set_ozet[set_col]
+            ozet['toplam'] += float(fark.sum())
+            ozet['sayi'] += int(fark.count())
+            ozet['max'] = np.nanmax([ozet['max'], fark.max()])
+            ozet['buyuk'] += int((fark > 50).sum())
+        
+        self._zaman_kontrolu(df)
+        
+        return df
+    
+    def _zaman_kontrolu(self, df):
+        """Parçadaki zaman aralıklarını önceki parçanın son zamanıyla birlikte kontrol eder"""
+        if 'TARİH' not in df.columns:
+            return
+        
+        # İndeks her fırının son zamanını tutar, kesintiler tabloya eklenir
+        self.zaman_indeksi.ekle(df)
+    
+    def parcayi_temizle(self, parca):
+        """
+        Yeni bir veri parçasını temizler
+        
+        Sonucu bir sonraki parçaya bağlı satırlar (ör. sağ komşusu gelmemiş
+        bir interpolasyon boşluğu) bekletilir ve sonraki çağrılarda döner.
+        
+        Args:
+            parca (pd.DataFrame): Ham veri parçası (firin_verileri_akis çıktısı)
+        
+        Returns:
+            pd.DataFrame: Sonucu kesinleşen temiz satırlar (yoksa None)
+        """
+        if self.sicaklik_sutunlari is None:
+            self._hazirla(parca)
+        
+        self.temizlik_raporu['baslangic_satir'] += len(parca)
+        parca = parca.reset_index(drop=True)
+        
+        # Sensör hataları sayılır ve NaN yapılır
+        if self.sicaklik_sutunlari and len(parca) > 0:
+            matris = parca[self.sicaklik_sutunlari].to_numpy(dtype=self._tip, na_value=np.nan, copy=True)
+            hata_mask = (matris < -100) | (matris > 2000)
+            self._hatalari_say(hata_mask)
+            
+            for j in np.flatnonzero(hata_mask.any(axis=0)):
+                kolon = matris[:, j]
+                kolon[hata_mask[:, j]] = np.nan
+                parca[self.sicaklik_sutunlari[j]] = kolon
+        
+        blok = parca if self._tampon is None else pd.concat([self._tampon, parca], ignore_index=True)
+        return self._yayinla(blok)
+    
+    def bitir(self):
+        """
+        Veri bittiğinde bekleyen satırları toplu temizleyicinin son satırlara
+        uyguladığı kurallarla (ileri doldurma) temizler
+        
+        Returns:
+            pd.DataFrame: Kalan temiz satırlar (yoksa None)
+        """
+        if self._tampon is None:
+            return None
+        
+        return self._yayinla(self._tampon, son=True)
+    
+    def temizle(self, parcalar):
+        """
+        Parça akışını temizleyen üreteç; akış bitince raporu yazdırır
+        
+        Args:
+            parcalar: DataFrame parçaları veren yinelenebilir (ör. firin_verileri_akis)
+        
+        Yields:
+            pd.DataFrame: Temizlenmiş parçalar
+        """
+        for parca in parcalar:
+            temiz = self.parcayi_temizle(parca)
+            if temiz is not None:
+                yield temiz
+        
+        temiz = self.bitir()
+        if temiz is not None:
+            yield temiz
+        
+        self.temizlik_raporu_olustur()
+    
+    def temizlik_raporu_olustur(self):
+        """
+        Akış boyunca biriken sayaçlardan temizlik raporunu oluşturur
+        """
+        rapor = self.temizlik_raporu
+        
+        sensor_hatalari = pd.DataFrame({
+            'hata_sayisi': self._hata_sayilari,
+            'en_uzun_seri': self._en_uzun
+        }, index=self.sicaklik_sutunlari or [])
+        rapor['sensor_hatalari'] = sensor_hatalari[sensor_hatalari['hata_sayisi'] > 0]
+        rapor['duzeltilen_deger'] = int(rapor['sensor_hatalari']['hata_sayisi'].sum())
+        
+        rapor['sorunlar'] = []
+        eksik_toplam = int(self._eksik.sum()) if self._eksik is not None else 0
+        if eksik_toplam > 0:
+            rapor['sorunlar'].append(f"{eksik_toplam} eksik değer bulundu ve dolduruldu")
+        
+        buyuk_farklar = [col for col, ozet in self._set_ozet.items() if ozet['max'] > 50]
+        if buyuk_farklar:
+            rapor['sorunlar'].append(f"{len(buyuk_farklar)} bölgede büyük sıcaklık farkı var")
+        
+        # Aykırı değerler (IQR, tüm fırınların birleştirilmiş özetinden; %1'den fazlaysa)
+        aykiri_rapor = []
+        for col in self.aykiri_sutunlari or []:
+            ozet = self.ozetler.ozet(col)
+            if ozet is None or ozet.n == 0:
+                continue
+            _, _, alt, ust = ozet.iqr_sinirlari(1.5)
+            aykirilar = ozet.disinda_kalan(alt, ust)
+            if aykirilar > 0 and aykirilar > self._yayinlanan * 0.01:
+                aykiri_rapor.append({
+                    'Sütun': col,
+                    'Aykırı Sayı': aykirilar,
+                    'Aykırı %': f"{aykirilar/self._yayinlanan*100:.2f}%"
+                })
+        rapor['aykiri_degerler'] = aykiri_rapor
+        
+        print("\n" + "="*60)
+        print("AKIŞ TEMİZLİK RAPORU")
+        print("="*60)
+        
+        print(f"\n📊 İşlenen Satır Sayısı: {rapor['baslangic_satir']}")
+        print(f"📊 Yayınlanan Satır Sayısı: {self._yayinlanan}")
+        print(f"✏️  Düzeltilen Değer: {rapor['duzeltilen_deger']}")
+        
+        rapor['zaman_kesintileri'] = self.zaman_indeksi.bosluk_sayisi
+        if self.zaman_indeksi.anormal_sayisi > 0:
+            print(f"\n⚠️  {self.zaman_indeksi.anormal_sayisi} anormal zaman aralığı bulundu")
+        if self.zaman_indeksi.sirasiz > 0:
+            print(f"⚠️  {self.zaman_indeksi.sirasiz} satır zaman sırasına uymuyor (akış modu sıralamaz)")
+        
+        if aykiri_rapor:
+            print(f"\n⚠️  Toplam {len(aykiri_rapor)} sütunda aykırı değer bulundu (yaklaşık):")
+            for item in aykiri_rapor[:10]:
+                print(f"   • {item['Sütun']}: {item['Aykırı Sayı']} ({item['Aykırı %']})")
+        
+        if rapor['sorunlar']:
+            print(f"\n⚠️  Tespit Edilen Sorunlar:")
+            for i, sorun in enumerate(rapor['sorunlar'], 1):
+                print(f"  {i}. {sorun}")
+        else:
+            print("\n✅ Hiçbir sorun tespit edilmedi!")
+
+
 # Test için
 if __name__ == "__main__":
+    import sys
     from veri_yukleme import FirinVeriYukleyici
+    from veri_kumesi import TembelVeriKumesi
+    from depo import FirinDeposu
+    from bolumlu_kayit import BolumluParquet
     
     # Veri yükle
     yukleyici = FirinVeriYukleyici()
@@ -280,9 +975,23 @@ if __name__ == "__main__":
     
     if df is not None:
         # Temizle
-        temizleyici = FirinVeriTemizleyici(df)
+        # --paralel: sütunlar sensör gruplarına ayrılıp tüm çekirdeklerde temizlenir
+        temizleyici = FirinVeriTemizleyici(df, calisan_sayisi=None if '--paralel' in sys.argv else 1)
         df_temiz = temizleyici.temizle()
         
         # Temizlenmiş veriyi kaydet
         df_temiz.to_csv('data/processed/firin_temiz.csv', index=False)
-        print("\n💾 Temizlenmiş veri 'data/processed/firin_temiz.csv' olarak kaydedildi!")
\ No newline at end of file
+        print("\n💾 Temizlenmiş veri 'data/processed/firin_temiz.csv' olarak kaydedildi!")
+        
+        # Kesinti tablosu (performans analizi tekrar taramadan kullanır)
+        temizleyici.zaman_indeksi.kaydet()
+        
+        # Analiz adımlarının sütun bazlı okuyabilmesi için sütunlu kopya
+        TembelVeriKumesi.kaydet(df_temiz, 'data/processed/firin_temiz.parquet')
+        print("💾 Sütunlu kopya 'data/processed/firin_temiz.parquet' olarak kaydedildi!")
+        
+        # Zaman/fırın sorguları için indeksli veritabanı
+        FirinDeposu().olcumleri_kaydet(df_temiz)
+        
+        # Tarih aralığı raporları için gün/fırın bölümlü kopya
+        BolumluParquet('data/processed/firin_temiz').kaydet(df_temiz)
\ No newline at end of file
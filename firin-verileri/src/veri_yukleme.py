@@ -5,26 +5,39 @@ Bu modül Excel dosyalarını okuyup pandas DataFrame'e dönüştürür.
 
 import pandas as pd
 import os
+import time
 from datetime import datetime
 
+try:
+    from .onbellek import ExcelOnbellek
+    from .veri_semasi import SENSOR_OLMAYANLAR, SENSOR_TIPI, semayi_uygula
+except ImportError:
+    from onbellek import ExcelOnbellek
+    from veri_semasi import SENSOR_OLMAYANLAR, SENSOR_TIPI, semayi_uygula
+
 class FirinVeriYukleyici:
     """
     Fırın Excel dosyalarını yüklemek ve temel bilgileri göstermek için sınıf
     """
     
-    def __init__(self, data_path='data/raw/'):
+    def __init__(self, data_path='data/raw/', onbellek_dizini='data/cache/'):
         """
         Args:
             data_path (str): Veri dosyalarının bulunduğu klasör
+            onbellek_dizini (str): Parquet önbellek klasörü (None ise önbellek kapalı)
         """
         self.data_path = data_path
+        self.onbellek = ExcelOnbellek(onbellek_dizini) if onbellek_dizini else None
         
-    def excel_oku(self, dosya_adi):
+    def excel_oku(self, dosya_adi, yenile=False):
         """
         Excel dosyasını okur ve DataFrame olarak döndürür
         
+        Kaynak dosya değişmediyse veri Excel yerine Parquet önbellekten okunur.
+        
         Args:
             dosya_adi (str): Okunacak Excel dosyasının adı
+            yenile (bool): True ise önbelleği yok say ve Excel'i yeniden ayrıştır
             
         Returns:
             pd.DataFrame: Yüklenen veri
@@ -33,8 +46,24 @@ class FirinVeriYukleyici:
             dosya_yolu = os.path.join(self.data_path, dosya_adi)
             print(f"📂 Dosya okunuyor: {dosya_yolu}")
             
-            # Excel dosyasını oku
-            df = pd.read_excel(dosya_yolu)
+            baslangic = time.perf_counter()
+            df = None
+            
+            if self.onbellek is not None and not yenile:
+                df = self.onbellek.getir(dosya_yolu)
+                if df is not None:
+                    print(f"⚡ Önbellekten yüklendi ({(time.perf_counter() - baslangic)*1000:.0f} ms)")
+            
+            if df is None:
+                # Excel dosyasını oku
+                df = pd.read_excel(dosya_yolu)
+                
+                if self.onbellek is not None:
+                    try:
+                        self.onbellek.kaydet(dosya_yolu, df)
+                        print(f"💾 Önbelleğe yazıldı ({(time.perf_counter() - baslangic)*1000:.0f} ms)")
+                    except Exception as e:
+                        print(f"⚠️  Önbelleğe yazılamadı: {str(e)}")
             
             print(f"✅ Dosya başarıyla yüklendi!")
             print(f"📊 Satır sayısı: {len(df)}")
@@ -49,10 +78,14 @@ class FirinVeriYukleyici:
             print(f"❌ HATA: {str(e)}")
             return None
     
-    def firin_verileri_yukle(self):
+    def firin_verileri_yukle(self, yenile=False, dosya_adi='Fırın Verileri18.xlsx'):
         """
         Fırın verilerini yükler ve temizler
         
+        Args:
+            yenile (bool): True ise önbelleği yok say
+            dosya_adi (str): Fırın Excel dosyasının adı
+        
         Returns:
             pd.DataFrame: Fırın verileri
         """
@@ -60,7 +93,7 @@ class FirinVeriYukleyici:
         print("FIRIN VERİLERİ YÜKLENİYOR")
         print("="*50 + "\n")
         
-        df = self.excel_oku('Fırın Verileri18.xlsx')
+        df = self.excel_oku(dosya_adi, yenile=yenile)
         
         if df is None:
             return None
@@ -69,19 +102,91 @@ class FirinVeriYukleyici:
         for i, col in enumerate(df.columns, 1):
             print(f"  {i}. {col}")
         
-        # Tarih ve saat sütunlarını datetime'a çevir
+        # Kompakt şema: TARİH + SAAT tek zaman damgası ve gruplama anahtarları
+        df = semayi_uygula(df)
+        
         if 'TARİH' in df.columns:
-            df['TARİH'] = pd.to_datetime(df['TARİH'], errors='coerce')
             print(f"\n📅 Tarih Aralığı: {df['TARİH'].min()} - {df['TARİH'].max()}")
         
-        if 'SAAT' in df.columns:
-            # Sadece saat bilgisi var, time formatına çevir
-            df['SAAT'] = pd.to_datetime(df['SAAT'], format='%H:%M:%S', errors='coerce').dt.time
-        
         print("\n✅ Veri yükleme tamamlandı!")
         
         return df
     
+    def firin_verileri_akis(self, parca_boyutu=10000, dosya_adi='Fırın Verileri18.xlsx'):
+        """
+        Fırın verilerini parça parça okuyan üreteç (generator)
+        
+        Çalışma kitabı openpyxl salt-okunur modunda satır satır okunur;
+        bellekte aynı anda en fazla bir parça tutulur. Her parça tipli
+        NumPy sütunlarından oluşan bir DataFrame olarak döndürülür.
+        
+        Args:
+            parca_boyutu (int): Her parçadaki satır sayısı
+            dosya_adi (str): Okunacak Excel dosyasının adı
+        
+        Yields:
+            pd.DataFrame: Sırayla okunan veri parçaları
+        """
+        from openpyxl import load_workbook
+        
+        dosya_yolu = os.path.join(self.data_path, dosya_adi)
+        print(f"📂 Dosya akış modunda okunuyor: {dosya_yolu} (parça: {parca_boyutu} satır)")
+        
+        kitap = load_workbook(dosya_yolu, read_only=True, data_only=True)
+        try:
+            satirlar = kitap.active.iter_rows(values_only=True)
+            basliklar = [str(b).strip() if b is not None else f'Unnamed: {i}'
+                         for i, b in enumerate(next(satirlar, []))]
+            
+            tampon = []
+            parca_no = 0
+            toplam_satir = 0
+            
+            for satir in satirlar:
+                tampon.append(satir)
+                if len(tampon) >= parca_boyutu:
+                    parca_no += 1
+                    toplam_satir += len(tampon)
+                    yield self._parcayi_donustur(basliklar, tampon)
+                    tampon = []
+            
+            if tampon:
+                parca_no += 1
+                toplam_satir += len(tampon)
+                yield self._parcayi_donustur(basliklar, tampon)
+            
+            print(f"✅ Akış tamamlandı: {parca_no} parça, {toplam_satir} satır")
+        finally:
+            kitap.close()
+    
+    def _parcayi_donustur(self, basliklar, satirlar):
+        """
+        Ham satır listesini sütun sütun tipli NumPy dizilerine çevirir
+        
+        Parça, firin_verileri_yukle ile aynı kompakt şemaya sahiptir; zaman
+        ve kimlik sütunları (ör. FIRIN KODU) sayıya çevrilmeden bırakılır.
+        
+        Args:
+            basliklar (list): Sütun isimleri
+            satirlar (list): openpyxl'den gelen satır tuple'ları
+        
+        Returns:
+            pd.DataFrame: Tipli veri parçası
+        """
+        sutun_sayisi = len(basliklar)
+        sutunlar = {}
+        
+        for i, baslik in enumerate(basliklar):
+            ham = pd.Series([s[i] if i < len(s) else None for s in satirlar], dtype=object)
+            
+            if baslik in SENSOR_OLMAYANLAR:
+                sutunlar[baslik] = ham
+            else:
+                sutunlar[baslik] = pd.to_numeric(ham, errors='coerce').to_numpy(dtype=SENSOR_TIPI)
+        
+        df = pd.DataFrame(sutunlar, columns=basliklar[:sutun_sayisi], copy=False)
+        return semayi_uygula(df, rapor=False)
+    
     def veri_bilgisi_goster(self, df, baslik="VERİ BİLGİSİ"):
         """
         DataFrame hakkında detaylı bilgi gösterir
@@ -130,7 +235,7 @@ class FirinVeriYukleyici:
         
         print(f"\n📊 Sıcaklık Sensörleri:")
         for sensor in sicaklik_sutunlari:
-            if df[sensor].dtype in ['int64', 'float64']:
+            if pd.api.types.is_numeric_dtype(df[sensor]):
                 min_val = df[sensor].min()
                 max_val = df[sensor].max()
                 mean_val = df[sensor].mean()
@@ -0,0 +1,411 @@
+"""
+Zaman İndeksi Modülü
+Bu modül fırın verisinin zaman eksenini bir kez tarayıp kesintileri (iki kayıt
+arasında eşikten uzun süren boşlukları) küçük bir tabloda saklar. Tablo
+başlangıç zamanına göre sıralı tutulur; bir zaman aralığındaki kesintiler,
+kesinti süresi ve kapsama oranı ikili arama ile O(log n) sürede bulunur.
+İndeks parça parça (akış modunda) oluşturulabilir ve diske kaydedilip sonraki
+adımlarda yeniden kullanılabilir.
+"""
+
+import json
+import os
+import numpy as np
+import pandas as pd
+
+# Fırın kodu sütunu olmayan veriler bu fırına yazılır
+VARSAYILAN_FIRIN = 'TUMU'
+
+# İndeksin varsayılan kayıt yeri
+INDEKS_DOSYASI = 'data/processed/firin_zaman_indeksi.json'
+
+# Nanosaniye cinsinden bir dakika
+DAKIKA_NS = 60 * 10**9
+
+class ZamanIndeksi:
+    """
+    Fırın bazında zaman aralıkları ve kesinti tablosu
+    
+    Girdi fırın bazında zamana göre sıralı olmalıdır (sirali_mi / sirala).
+    Geriye giden zamanlar kesinti sayılmaz, sırasız kayıt olarak sayılır.
+    """
+    
+    def __init__(self, esik_dk=30, kayit_araligi_dk=None):
+        """
+        Args:
+            esik_dk (float): Bu süreden (dakika) uzun kayıt aralıkları kesintidir
+            kayit_araligi_dk (float): Nominal kayıt aralığı (dakika); None ise
+                kesintiler dışındaki kayıt aralıklarının medyanı kullanılır
+        """
+        self.esik_dk = esik_dk
+        self.kayit_araligi_dk = kayit_araligi_dk
+        self.sirasiz = 0
+        self.firinlar = {}
+        self._bosluklar = {}
+        self._tablolar = {}
+    
+    @staticmethod
+    def _zamanlar(df):
+        """Fırın kodu -> int64 ns zamanlar; NaT satırları atlanır"""
+        zaman = df['TARİH'].to_numpy(dtype='datetime64[ns]').view('int64')
+        gecerli = zaman != np.iinfo(np.int64).min
+        
+        if 'FIRIN KODU' not in df.columns:
+            return {VARSAYILAN_FIRIN: zaman[gecerli]}
+        
+        kodlar = df['FIRIN KODU'].astype(object).to_numpy()
+        return {str(kod): zaman[gecerli & (kodlar == kod)] for kod in pd.unique(kodlar[gecerli])}
+    
+    @staticmethod
+    def sirali_mi(df):
+        """
+        Veri fırın kodu ve TARİH'e göre zaten sıralı mı (sort_values gerekmez mi)
+        
+        Args:
+            df (pd.DataFrame): TARİH (ve varsa FIRIN KODU) sütunlu veri
+        
+        Returns:
+            bool: Sıralıysa True (eksik zaman veya fırın kodu varsa False)
+        """
+        zaman = df['TARİH']
+        if zaman.isna().any():
+            return False
+        
+        if 'FIRIN KODU' not in df.columns:
+            return bool(zaman.is_monotonic_increasing)
+        
+        kod = df['FIRIN KODU']
+        if kod.isna().any():
+            return False
+        kodlar = kod.cat.codes.to_numpy() if isinstance(kod.dtype, pd.CategoricalDtype) else kod.to_numpy()
+        t = zaman.to_numpy(dtype='datetime64[ns]').view('int64')
+        
+        artan_kod = kodlar[1:] > kodlar[:-1]
+        ayni_kod = kodlar[1:] == kodlar[:-1]
+        return bool(np.all(artan_kod | (ayni_kod & (t[1:] >= t[:-1]))))
+    
+    @classmethod
+    def sirala(cls, df):
+        """
+        Veriyi fırın kodu ve TARİH'e göre sıralar; zaten sıralıysa sıralamayı atlar
+        
+        Args:
+            df (pd.DataFrame): Veri
+        
+        Returns:
+            pd.DataFrame: Sıralı veri (RangeIndex ile)
+        """
+        if cls.sirali_mi(df):
+            if isinstance(df.index, pd.RangeIndex) and df.index.start == 0 and df.index.step == 1:
+                return df
+            return df.reset_index(drop=True)
+        
+        sutunlar = ['FIRIN KODU', 'TARİH'] if 'FIRIN KODU' in df.columns else 'TARİH'
+        return df.sort_values(sutunlar).reset_index(drop=True)
+    
+    @classmethod
+    def veriden(cls, df, esik_dk=30, kayit_araligi_dk=None):
+        """
+        Sıralı veriden indeks oluşturur
+        
+        Args:
+            df (pd.DataFrame): Fırın bazında zamana göre sıralı veri
+            esik_dk (float): Kesinti eşiği (dakika)
+            kayit_araligi_dk (float): Nominal kayıt aralığı (dakika, opsiyonel)
+        
+        Returns:
+            ZamanIndeksi: Oluşturulan indeks
+        """
+        return cls(esik_dk, kayit_araligi_dk).ekle(df)
+    
+    def ekle(self, df):
+        """
+        Yeni kayıtları indekse ekler (önceki parçanın son zamanından devam eder)
+        
+        Args:
+            df (pd.DataFrame): TARİH (ve varsa FIRIN KODU) sütunlu parça
+        
+        Returns:
+            ZamanIndeksi: Kendisi
+        """
+        if df is None or len(df) == 0:
+            return self
+        
+        esik = self.esik_dk * DAKIKA_NS
+        
+        for kod, t in self._zamanlar(df).items():
+            if len(t) == 0:
+                continue
+            
+            firin = self.firinlar.get(kod)
+            if firin is None:
+                firin = self.firinlar[kod] = {'ilk': int(t[0]), 'son': int(t[0]), 'satir': 0,
+                                              'araliklar': {}}
+                onceki = t[:-1]
+                sonraki = t[1:]
+            else:
+                onceki = np.concatenate(([firin['son']], t[:-1]))
+                sonraki = t
+            
+            fark = sonraki - onceki
+            bosluk = fark > esik
+            geri = fark < 0
+            normal = ~bosluk & ~geri
+            
+            if bosluk.any():
+                self._bosluklar.setdefault(kod, []).append((onceki[bosluk], sonraki[bosluk]))
+                self._tablolar.pop(kod, None)
+            
+            self.sirasiz += int(geri.sum())
+            firin['satir'] += len(t)
+            firin['son'] = int(t[-1])
+            firin['ilk'] = min(firin['ilk'], int(t.min()))
+            # Normal aralıkların saniye bazında dağılımı (medyan kayıt aralığı için);
+            # kayıtlar sabit aralıkla alındığından tablo birkaç değerle sınırlı kalır
+            saniyeler, sayilar = np.unique(fark[normal] // 10**9, return_counts=True)
+            araliklar = firin.setdefault('araliklar', {})
+            for saniye, sayi in zip(saniyeler.tolist(), sayilar.tolist()):
+                araliklar[str(saniye)] = araliklar.get(str(saniye), 0) + sayi
+        
+        return self
+    
+    def _tablo(self, kod):
+        """Fırının (başlangıç, bitiş, kümülatif süre) dizileri; başlangıca göre sıralı"""
+        tablo = self._tablolar.get(kod)
+        if tablo is None:
+            parcalar = self._bosluklar.get(kod, [])
+            bas = np.concatenate([p[0] for p in parcalar]) if parcalar else np.empty(0, dtype=np.int64)
+            bit = np.concatenate([p[1] for p in parcalar]) if parcalar else np.empty(0, dtype=np.int64)
+            sira = np.argsort(bas, kind='stable')
+            bas, bit = bas[sira], bit[sira]
+            kumulatif = np.concatenate(([0], np.cumsum(bit - bas)))
+            tablo = self._tablolar[kod] = (bas, bit, kumulatif)
+        return tablo
+    
+    def _kodlar(self, firin):
+        return list(self.firinlar) if firin is None else [str(firin)]
+    
+    @staticmethod
+    def _ns(zaman, varsayilan):
+        return varsayilan if zaman is None else pd.Timestamp(zaman).as_unit('ns').value
+    
+    @property
+    def bosluk_sayisi(self):
+        """Toplam kesinti sayısı"""
+        return sum(len(self._tablo(kod)[0]) for kod in self.firinlar)
+    
+    @property
+    def anormal_sayisi(self):
+        """Eşikten uzun veya geriye giden kayıt aralıklarının sayısı"""
+        return self.bosluk_sayisi + self.sirasiz
+    
+    def ornekleme_dk(self, firin=None):
+        """
+        Nominal kayıt aralığı (dakika)
+        
+        Verilmişse yapılandırılan aralık, verilmemişse kesintiler dışındaki
+        kayıt aralıklarının medyanıdır. Ortalama kullanılmaz: eksik kayıtlar
+        ortalamayı büyütür ve beklenen kayıt sayısı gerçek sayıya eşitlenir.
+        
+        Args:
+            firin (str): Fırın kodu (None ise tüm fırınlar)
+        
+        Returns:
+            float: Kayıt aralığı (aralık yoksa NaN)
+        """
+        if self.kayit_araligi_dk is not None:
+            return float(self.kayit_araligi_dk)
+        
+        dagilim = {}
+        for kod in self._kodlar(firin):
+            if kod in self.firinlar:
+                for saniye, sayi in self.firinlar[kod].get('araliklar', {}).items():
+                    dagilim[int(saniye)] = dagilim.get(int(saniye), 0) + sayi
+        if not dagilim:
+            return float('nan')
+        
+        saniyeler = np.array(sorted(dagilim))
+        kumulatif = np.cumsum([dagilim[saniye] for saniye in saniyeler])
+        medyan = saniyeler[np.searchsorted(kumulatif, kumulatif[-1] / 2)]
+        return float(medyan) / 60
+    
+    def bosluklar(self, baslangic=None, bitis=None, firin=None):
+        """
+        [baslangic, bitis] aralığıyla kesişen kesintiler
+        
+        Args:
+            baslangic: Aralık başı (None ise verinin başı)
+            bitis: Aralık sonu (None ise verinin sonu)
+            firin (str): Fırın kodu (None ise tüm fırınlar)
+        
+        Returns:
+            pd.DataFrame: FIRIN KODU, BASLANGIC, BITIS, SURE_DK sütunlu tablo
+        """
+        bas_ns = self._ns(baslangic, np.iinfo(np.int64).min)
+        bit_ns = self._ns(bitis, np.iinfo(np.int64).max)
+        
+        satirlar = []
+        for kod in self._kodlar(firin):
+            if kod not in self.firinlar:
+                continue
+            bas, bit, _ = self._tablo(kod)
+            # Kesintiler örtüşmez: bitişler de başlangıçlar gibi sıralıdır
+            i = np.searchsorted(bit, bas_ns, side='right')
+            j = np.searchsorted(bas, bit_ns, side='left')
+            satirlar.append(pd.DataFrame({
+                'FIRIN KODU': kod,
+                'BASLANGIC': pd.to_datetime(bas[i:j]),
+                'BITIS': pd.to_datetime(bit[i:j]),
+                'SURE_DK': (bit[i:j] - bas[i:j]) / DAKIKA_NS
+            }))
+        
+        if not satirlar:
+            return pd.DataFrame(columns=['FIRIN KODU', 'BASLANGIC', 'BITIS', 'SURE_DK'])
+        return pd.concat(satirlar, ignore_index=True)
+    
+    def kesinti_suresi(self, baslangic=None, bitis=None, firin=None):
+        """
+        [baslangic, bitis] aralığına düşen toplam kesinti süresi (dakika)
+        
+        Kümülatif süreler sayesinde kesinti sayısından bağımsız, iki ikili
+        arama ve uçtaki iki kesintinin kırpılmasıyla hesaplanır.
+        
+        Returns:
+            float: Kesinti süresi (dakika)
+        """
+        bas_ns = self._ns(baslangic, np.iinfo(np.int64).min)
+        bit_ns = self._ns(bitis, np.iinfo(np.int64).max)
+        
+        toplam = 0
+        for kod in self._kodlar(firin):
+            if kod not in self.firinlar:
+                continue
+            bas, bit, kumulatif = self._tablo(kod)
+            i = np.searchsorted(bit, bas_ns, side='right')
+            j = np.searchsorted(bas, bit_ns, side='left')
+            if i >= j:
+                continue
+            sure = int(kumulatif[j] - kumulatif[i])
+            # Aralığın dışına taşan uç kesintiler kırpılır
+            sure -= max(0, bas_ns - int(bas[i]))
+            sure -= max(0, int(bit[j - 1]) - bit_ns)
+            toplam += sure
+        
+        return toplam / DAKIKA_NS
+    
+    def sure_dk(self, baslangic=None, bitis=None, firin=None):
+        """Fırınların kayıt dönemlerinin [baslangic, bitis] ile kesişen toplam süresi (dakika)"""
+        bas_ns = self._ns(baslangic, np.iinfo(np.int64).min)
+        bit_ns = self._ns(bitis, np.iinfo(np.int64).max)
+        
+        toplam = 0
+        for kod in self._kodlar(firin):
+            firin_bilgi = self.firinlar.get(kod)
+            if firin_bilgi is not None:
+                toplam += max(0, min(bit_ns, firin_bilgi['son']) - max(bas_ns, firin_bilgi['ilk']))
+        return toplam / DAKIKA_NS
+    
+    def kapsama(self, baslangic=None, bitis=None, firin=None):
+        """
+        Kayıt döneminin kesintisiz (veri alınan) kısmının oranı
+        
+        Returns:
+            float: 0-1 arası kapsama oranı (süre yoksa NaN)
+        """
+        sure = self.sure_dk(baslangic, bitis, firin)
+        if sure <= 0:
+            return float('nan')
+        return 1 - self.kesinti_suresi(baslangic, bitis, firin) / sure
+    
+    def bosluk_mu(self, zaman, firin=None):
+        """
+        Verilen an bir kesintinin içinde mi
+        
+        Returns:
+            bool: Herhangi bir fırında (veya verilen fırında) kesinti varsa True
+        """
+        t = self._ns(zaman, 0)
+        for kod in self._kodlar(firin):
+            if kod not in self.firinlar:
+                continue
+            bas, bit, _ = self._tablo(kod)
+            i = np.searchsorted(bas, t, side='right') - 1
+            if i >= 0 and t < bit[i]:
+                return True
+        return False
+    
+    def beklenen_kayit(self, firin=None):
+        """
+        Kesintiler dışındaki sürede nominal kayıt aralığıyla beklenen kayıt sayısı
+        
+        Her kesintisiz dönem süre / aralık + 1 kayıt içerir; dönem sayısı fırın
+        sayısı ile kesinti sayısının toplamıdır. Dönem içindeki eksik kayıtlar
+        kayıt oranını düşürür.
+        
+        Returns:
+            float: Beklenen kayıt sayısı
+        """
+        kodlar = [k for k in self._kodlar(firin) if k in self.firinlar]
+        ornekleme = self.ornekleme_dk(firin)
+        if not ornekleme or np.isnan(ornekleme):
+            return float(sum(self.firinlar[k]['satir'] for k in kodlar))
+        
+        calisma = self.sure_dk(firin=firin) - self.kesinti_suresi(firin=firin)
+        donemler = len(kodlar) + sum(len(self._tablo(k)[0]) for k in kodlar)
+        return calisma / ornekleme + donemler
+    
+    def uyumlu_mu(self, df):
+        """
+        İndeks bu veriden mi oluşturuldu (satır sayısı ve zaman aralığı fırın bazında aynı mı)
+        
+        Args:
+            df (pd.DataFrame): Karşılaştırılacak veri
+        
+        Returns:
+            bool: Uyumluysa True
+        """
+        zamanlar = self._zamanlar(df)
+        if set(zamanlar) != set(self.firinlar):
+            return False
+        return all(len(t) == self.firinlar[kod]['satir'] and int(t.min()) == self.firinlar[kod]['ilk']
+                   and int(t.max()) == self.firinlar[kod]['son'] for kod, t in zamanlar.items())
+    
+    def kaydet(self, yol=INDEKS_DOSYASI):
+        """İndeksi (fırın bilgileri ve kesinti tablosu) JSON dosyasına yazar"""
+        klasor = os.path.dirname(yol)
+        if klasor:
+            os.makedirs(klasor, exist_ok=True)
+        
+        veri = {
+            'esik_dk': self.esik_dk,
+            'kayit_araligi_dk': self.kayit_araligi_dk,
+            'sirasiz': self.sirasiz,
+            'firinlar': self.firinlar,
+            'bosluklar': {kod: [self._tablo(kod)[0].tolist(), self._tablo(kod)[1].tolist()]
+                          for kod in self.firinlar}
+        }
+        with open(yol, 'w', encoding='utf-8') as f:
+            json.dump(veri, f, ensure_ascii=False)
+        
+        print(f"💾 Zaman indeksi ({self.bosluk_sayisi} kesinti) '{yol}' dosyasına kaydedildi")
+    
+    @classmethod
+    def yukle(cls, yol=INDEKS_DOSYASI):
+        """
+        Kaydedilmiş indeksi okur
+        
+        Returns:
+            ZamanIndeksi: İndeks (dosya yoksa None)
+        """
+        if not os.path.exists(yol):
+            return None
+        
+        with open(yol, 'r', encoding='utf-8') as f:
+            veri = json.load(f)
+        
+        indeks = cls(veri['esik_dk'], veri.get('kayit_araligi_dk'))
+        indeks.sirasiz = veri['sirasiz']
+        indeks.firinlar = veri['firinlar']
+        indeks._bosluklar = {kod: [(np.asarray(bas, dtype=np.int64), np.asarray(bit, dtype=np.int64))]
+                             for kod, (bas, bit) in veri['bosluklar'].items()}
+        return indeks
@@ -0,0 +1,8 @@
+# ortak/__init__.py
+"""
+Ortak Modüller
+Enjeksiyon presi ve fırın projelerinin paylaştığı altyapı: disk önbelleği,
+tembel veri kümesi, işlem bağlamı, kantil özetleri ve veri sunucusu.
+Projelere özgü varsayılanlar (grup sütunu, port) her projenin src/
+klasöründeki aynı adlı modülde verilir.
+"""
@@ -0,0 +1,132 @@
+"""
+İşlem Bağlamı Modülü
+Bu modül analiz adımlarının temizlenmiş veriyi kopyalamadan paylaşmasını
+sağlar. Adımlar ortak çerçevenin copy-on-write görünümünü alır; bir adımın
+eklediği türetilmiş sütunlar (HIZ_ORANI, *_FARK, ...) sadece o adımın
+görünümünde kalır, ortak çerçeve hiç değişmez ve tekrar kopyalanmaz.
+Adımların bellek kullanımı tracemalloc ile ölçülebilir.
+"""
+
+import time
+import tracemalloc
+from contextlib import contextmanager
+import pandas as pd
+
+from .veri_kumesi import TembelVeriKumesi
+
+# pandas 3'te copy-on-write her zaman açıktır; 2.x'te görünümlerin ortak
+# veriyi değiştirmemesi için açılması gerekir
+if int(pd.__version__.split('.')[0]) < 3:
+    pd.set_option('mode.copy_on_write', True)
+
+def paylasimli_gorunum(df):
+    """
+    DataFrame'in veriyi kopyalamayan (copy-on-write) görünümünü döndürür
+    
+    Görünüme sütun eklemek veya görünümdeki bir sütunu değiştirmek sadece
+    o sütun için yeni bellek ayırır; kaynak DataFrame etkilenmez.
+    
+    Args:
+        df (pd.DataFrame): Paylaşılacak veri
+    
+    Returns:
+        pd.DataFrame: Sığ (shallow) kopya
+    """
+    return df.copy(deep=False)
+
+class IslemBaglami:
+    """
+    Analiz adımlarının paylaştığı tek temiz veri çerçevesi ve bellek ölçümleri
+    """
+    
+    def __init__(self, df, olcum=False):
+        """
+        Args:
+            df (pd.DataFrame): Tüm adımların paylaşacağı temizlenmiş veri
+            olcum (bool): True ise olc() ile sarılan adımların bellek
+                kullanımı tracemalloc ile ölçülür
+        """
+        self.df = df
+        self.olcum = olcum
+        self.olcumler = []
+    
+    def kume(self):
+        """
+        Ortak çerçeve üzerinde bir veri kümesi açar
+        
+        Adımların veri_kumesinden() ile seçtiği sütunlar diskten okunmaz,
+        ortak çerçevenin belleğini paylaşır.
+        
+        Returns:
+            TembelVeriKumesi: Bellekteki çerçeveye bağlı veri kümesi
+        """
+        return TembelVeriKumesi(self.df)
+    
+    def gorunum(self, sutunlar=None):
+        """
+        Ortak çerçevenin (istenen sütunlarının) copy-on-write görünümü
+        
+        Args:
+            sutunlar (list): Görünümdeki sütunlar (None ise tümü)
+        
+        Returns:
+            pd.DataFrame: Görünüm
+        """
+        if sutunlar is None:
+            return paylasimli_gorunum(self.df)
+        return self.df[list(sutunlar)]
+    
+    @contextmanager
+    def olc(self, adim):
+        """
+        Bloğun içinde çalışan adımın bellek kullanımını ölçer
+        
+        Ölçüm kapalıysa hiçbir şey yapmaz. Açıksa adımın tepe bellek
+        kullanımı ve adımdan sonra bellekte kalan kısmı kaydedilir.
+        
+        Args:
+            adim (str): Adım adı
+        """
+        if not self.olcum:
+            yield
+            return
+        
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+        
+        onceki, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        baslangic = time.perf_counter()
+        
+        try:
+            yield
+        finally:
+            sonraki, tepe = tracemalloc.get_traced_memory()
+            self.olcumler.append({
+                'adim': adim,
+                'tepe_mb': (tepe - onceki) / (1024 * 1024),
+                'kalan_mb': (sonraki - onceki) / (1024 * 1024),
+                'sure_sn': time.perf_counter() - baslangic
+            })
+    
+    def olcum_raporu(self):
+        """
+        Adımların bellek ölçümlerini veri boyutuyla karşılaştırarak yazdırır
+        
+        Returns:
+            pd.DataFrame: Adım bazında ölçümler
+        """
+        veri_mb = self.df.memory_usage(deep=True).sum() / (1024 * 1024)
+        rapor = pd.DataFrame(self.olcumler)
+        
+        print("\n" + "="*60)
+        print("BELLEK ÖLÇÜMÜ")
+        print("="*60)
+        print(f"\n📊 Ortak temiz veri: {veri_mb:.2f} MB")
+        
+        for olcum in self.olcumler:
+            print(f"   • {olcum['adim']}: tepe +{olcum['tepe_mb']:.2f} MB "
+                  f"({olcum['tepe_mb'] / veri_mb:.2f}x veri), "
+                  f"adımdan sonra kalan +{olcum['kalan_mb']:.2f} MB, {olcum['sure_sn']:.1f} sn")
+        
+        return rapor
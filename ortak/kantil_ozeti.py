@@ -0,0 +1,401 @@
+"""
+Kantil Özeti Modülü
+Bu modül sütun değerlerinin dağılımını sabit boyutlu, birleştirilebilir KLL
+kantil özetleriyle (Karnin-Lang-Liberty sketch) tutar. Özetler parça parça
+güncellenir, farklı gün ve makinelerin (fırınların) özetleri
+birleştirilebilir ve IQR sınırları tüm sütunu bellekte tutmadan yaklaşık
+olarak hesaplanır. Grup sütunu projeye göre değişir (GRUP_SUTUNU).
+"""
+
+import json
+import os
+import numpy as np
+import pandas as pd
+
+# Grup sütunu olmayan (veya boş olan) veriler bu gruba yazılır
+VARSAYILAN_GRUP = 'TUMU'
+
+# Özetlerin varsayılan kayıt yeri
+OZET_DOSYASI = 'data/processed/kantil_ozetleri.json'
+
+class KLLOzeti:
+    """
+    Tek bir sütun için birleştirilebilir KLL kantil özeti
+    
+    Seviye h'deki her değer 2^h gözlemi temsil eder. Bir seviye kapasitesini
+    aşınca sıralanır ve rastgele tek/çift konumdaki yarısı bir üst seviyeye
+    taşınır. Bellek O(k) kalır; kantil sorgularının sıra hatası yaklaşık
+    hata_payi kadardır (n'den bağımsız).
+    """
+    
+    # Alt seviyelerin kapasite küçülme oranı
+    C = 2 / 3
+    
+    def __init__(self, hata_payi=0.01, k=None, tohum=0):
+        """
+        Args:
+            hata_payi (float): Hedeflenen normalize sıra hatası (0.01 = %1)
+            k (int): Üst seviye kapasitesi (verilirse hata_payi'nden öncelikli)
+            tohum (int): Sıkıştırma için rastgele sayı üreteci tohumu
+        """
+        self.k = int(k) if k is not None else max(8, int(np.ceil(1.7 / hata_payi)))
+        self.n = 0
+        self.min = np.inf
+        self.max = -np.inf
+        self.seviyeler = [np.empty(0)]
+        self._rng = np.random.default_rng(tohum)
+    
+    @property
+    def hata_payi(self):
+        """k için beklenen yaklaşık normalize sıra hatası"""
+        return 1.7 / self.k
+    
+    def _kapasite(self, h):
+        """Seviye h'nin kapasitesi (en üst seviye k, aşağı doğru küçülür)"""
+        return max(2, int(np.ceil(self.k * self.C ** (len(self.seviyeler) - 1 - h))))
+    
+    def ekle(self, degerler):
+        """
+        Değerleri özete ekler (NaN değerler atlanır)
+        
+        Args:
+            degerler (array-like): Eklenecek değerler
+        
+        Returns:
+            KLLOzeti: Kendisi (zincirleme kullanım için)
+        """
+        d = np.asarray(degerler, dtype='float64').ravel()
+        d = d[~np.isnan(d)]
+        if len(d) == 0:
+            return self
+        
+        self.n += len(d)
+        self.min = min(self.min, d.min())
+        self.max = max(self.max, d.max())
+        self.seviyeler[0] = np.concatenate([self.seviyeler[0], d])
+        self._sikistir()
+        
+        return self
+    
+    def birlestir(self, diger):
+        """
+        Başka bir özeti bu özete katar
+        
+        Args:
+            diger (KLLOzeti): Birleştirilecek özet (değişmez)
+        
+        Returns:
+            KLLOzeti: Kendisi
+        """
+        if diger.n == 0:
+            return self
+        
+        while len(self.seviyeler) < len(diger.seviyeler):
+            self.seviyeler.append(np.empty(0))
+        for h, seviye in enumerate(diger.seviyeler):
+            self.seviyeler[h] = np.concatenate([self.seviyeler[h], seviye])
+        
+        self.n += diger.n
+        self.min = min(self.min, diger.min)
+        self.max = max(self.max, diger.max)
+        self._sikistir()
+        
+        return self
+    
+    def _sikistir(self):
+        """Toplam boyut kapasiteyi aşmayana kadar en alttaki dolu seviyeyi sıkıştırır"""
+        while True:
+            kapasiteler = [self._kapasite(h) for h in range(len(self.seviyeler))]
+            if sum(len(s) for s in self.seviyeler) <= sum(kapasiteler):
+                return
+            
+            h = next(h for h, s in enumerate(self.seviyeler) if len(s) >= kapasiteler[h])
+            seviye = np.sort(self.seviyeler[h])
+            
+            # Tek sayıda değer varsa biri bu seviyede kalır
+            cift = len(seviye) - len(seviye) % 2
+            baslangic = int(self._rng.integers(2))
+            
+            if h + 1 == len(self.seviyeler):
+                self.seviyeler.append(np.empty(0))
+            self.seviyeler[h + 1] = np.concatenate([self.seviyeler[h + 1], seviye[baslangic:cift:2]])
+            self.seviyeler[h] = seviye[cift:]
+    
+    def _agirlikli_degerler(self):
+        """Sıralı değerleri ve kümülatif ağırlıklarını döndürür"""
+        degerler = np.concatenate(self.seviyeler)
+        agirliklar = np.concatenate([np.full(len(s), 2 ** h, dtype=np.int64)
+                                     for h, s in enumerate(self.seviyeler)])
+        sira = np.argsort(degerler, kind='stable')
+        return degerler[sira], np.cumsum(agirliklar[sira])
+    
+    def kantiller(self, olasiliklar):
+        """
+        Yaklaşık kantilleri döndürür
+        
+        Args:
+            olasiliklar (array-like): 0-1 arası olasılıklar
+        
+        Returns:
+            np.ndarray: Kantil değerleri (özet boşsa NaN)
+        """
+        q = np.atleast_1d(np.asarray(olasiliklar, dtype='float64'))
+        if self.n == 0:
+            return np.full(len(q), np.nan)
+        
+        degerler, kumulatif = self._agirlikli_degerler()
+        indeks = np.searchsorted(kumulatif, q * kumulatif[-1], side='left')
+        sonuc = degerler[np.clip(indeks, 0, len(degerler) - 1)]
+        
+        # Uç olasılıklar kesin min/max'tır
+        sonuc = np.where(q <= 0, self.min, sonuc)
+        return np.where(q >= 1, self.max, sonuc)
+    
+    def kantil(self, olasilik):
+        """Tek bir olasılık için yaklaşık kantil"""
+        return float(self.kantiller([olasilik])[0])
+    
+    def sira(self, deger, dahil=False):
+        """
+        Değerin yaklaşık normalize sırası (CDF)
+        
+        Args:
+            deger (float): Sorgu değeri
+            dahil (bool): True ise değere eşit olanlar da sayılır (<=)
+        
+        Returns:
+            float: deger'den küçük (veya eşit) gözlemlerin oranı
+        """
+        if self.n == 0:
+            return np.nan
+        
+        degerler, kumulatif = self._agirlikli_degerler()
+        indeks = np.searchsorted(degerler, deger, side='right' if dahil else 'left')
+        return float(kumulatif[indeks - 1] / kumulatif[-1]) if indeks > 0 else 0.0
+    
+    def iqr_sinirlari(self, katsayi=1.5):
+        """
+        IQR yöntemiyle alt/üst aykırı değer sınırları
+        
+        Returns:
+            tuple: (Q1, Q3, alt sınır, üst sınır)
+        """
+        q1, q3 = self.kantiller([0.25, 0.75])
+        iqr = q3 - q1
+        return float(q1), float(q3), float(q1 - katsayi * iqr), float(q3 + katsayi * iqr)
+    
+    def disinda_kalan(self, alt, ust):
+        """
+        [alt, ust] aralığının dışında kalan gözlemlerin yaklaşık sayısı
+        
+        Returns:
+            int: Aralık dışındaki tahmini gözlem sayısı
+        """
+        if self.n == 0:
+            return 0
+        oran = self.sira(alt) + (1 - self.sira(ust, dahil=True))
+        return int(round(oran * self.n))
+    
+    def sozluk(self):
+        """Özeti JSON'a yazılabilir sözlüğe çevirir"""
+        return {
+            'k': self.k,
+            'n': self.n,
+            'min': float(self.min) if self.n else None,
+            'max': float(self.max) if self.n else None,
+            'seviyeler': [s.tolist() for s in self.seviyeler]
+        }
+    
+    @classmethod
+    def sozlukten(cls, veri):
+        """sozluk() çıktısından özeti geri oluşturur"""
+        ozet = cls(k=veri['k'])
+        ozet.n = veri['n']
+        if ozet.n:
+            ozet.min, ozet.max = veri['min'], veri['max']
+        ozet.seviyeler = [np.asarray(s, dtype='float64') for s in veri['seviyeler']]
+        return ozet
+
+class KantilOzetleri:
+    """
+    Grup (makine, fırın) ve sütun bazında KLL özetleri
+    
+    Projeler GRUP_SUTUNU'nu kendi grup sütunlarıyla ezer.
+    """
+    
+    # Varsayılan grup sütunu (None ise tüm satırlar VARSAYILAN_GRUP'a yazılır)
+    GRUP_SUTUNU = None
+    
+    def __init__(self, grup_sutunu=None, hata_payi=0.01):
+        """
+        Args:
+            grup_sutunu (str): Özetlerin ayrıldığı sütun (None ise GRUP_SUTUNU)
+            hata_payi (float): Yeni özetler için hedeflenen sıra hatası
+        """
+        self.grup_sutunu = self.GRUP_SUTUNU if grup_sutunu is None else grup_sutunu
+        self.hata_payi = hata_payi
+        self.ozetler = {}
+    
+    def _ozet(self, grup, sutun):
+        """Grup/sütun özetini döndürür, yoksa oluşturur"""
+        return self.ozetler.setdefault(grup, {}).setdefault(sutun, KLLOzeti(self.hata_payi))
+    
+    @classmethod
+    def veriden(cls, df, sutunlar=None, grup_sutunu=None, hata_payi=0.01):
+        """
+        DataFrame'den yeni özetler oluşturur
+        
+        Args:
+            df (pd.DataFrame): Kaynak veri
+            sutunlar (list): Özetlenecek sütunlar (None ise tüm sayısal sütunlar)
+            grup_sutunu (str): Grup sütunu (None ise GRUP_SUTUNU)
+            hata_payi (float): Hedeflenen sıra hatası
+        
+        Returns:
+            KantilOzetleri: Oluşturulan özetler
+        """
+        return cls(grup_sutunu, hata_payi).guncelle(df, sutunlar)
+    
+    def guncelle(self, df, sutunlar=None):
+        """
+        Yeni satırları ilgili grubun özetlerine ekler
+        
+        Args:
+            df (pd.DataFrame): Yeni satırlar
+            sutunlar (list): Özetlenecek sütunlar (None ise tüm sayısal sütunlar)
+        
+        Returns:
+            KantilOzetleri: Kendisi
+        """
+        if df is None or len(df) == 0:
+            return self
+        
+        if sutunlar is None:
+            sutunlar = [col for col in df.columns if col != self.grup_sutunu
+                        and pd.api.types.is_numeric_dtype(df[col]) and not pd.api.types.is_bool_dtype(df[col])]
+        else:
+            sutunlar = [col for col in sutunlar if col in df.columns]
+        
+        if self.grup_sutunu in df.columns:
+            gruplar = df[self.grup_sutunu].astype(object).where(df[self.grup_sutunu].notna(), VARSAYILAN_GRUP)
+        else:
+            gruplar = pd.Series(VARSAYILAN_GRUP, index=df.index)
+        
+        matris = {col: df[col].to_numpy(dtype='float64', na_value=np.nan) for col in sutunlar}
+        for grup, indeks in df.groupby(gruplar, sort=False).indices.items():
+            for col in sutunlar:
+                self._ozet(str(grup), col).ekle(matris[col][indeks])
+        
+        return self
+    
+    def birlestir(self, diger):
+        """
+        Başka bir özet kümesini (ör. başka gün veya makine) bu kümeye katar
+        
+        Args:
+            diger (KantilOzetleri): Birleştirilecek özetler
+        
+        Returns:
+            KantilOzetleri: Kendisi
+        """
+        for grup, sutunlar in diger.ozetler.items():
+            for col, ozet in sutunlar.items():
+                self._ozet(grup, col).birlestir(ozet)
+        return self
+    
+    @property
+    def gruplar(self):
+        """Özeti bulunan gruplar"""
+        return list(self.ozetler)
+    
+    def ozet(self, sutun, grup=None):
+        """
+        Bir sütunun özeti
+        
+        Args:
+            sutun (str): Sütun adı
+            grup (str): Grup kodu (None ise tüm gruplar birleştirilir)
+        
+        Returns:
+            KLLOzeti: Özet (sütun yoksa None)
+        """
+        if grup is not None:
+            return self.ozetler.get(str(grup), {}).get(sutun)
+        
+        parcalar = [sutunlar[sutun] for sutunlar in self.ozetler.values() if sutun in sutunlar]
+        if not parcalar:
+            return None
+        if len(parcalar) == 1:
+            return parcalar[0]
+        
+        toplam = KLLOzeti(k=parcalar[0].k)
+        for parca in parcalar:
+            toplam.birlestir(parca)
+        return toplam
+    
+    def iqr_sinirlari(self, sutun, katsayi=1.5, grup=None):
+        """
+        Sütunun özetten hesaplanan IQR sınırları
+        
+        Returns:
+            tuple: (Q1, Q3, alt sınır, üst sınır)
+        """
+        ozet = self.ozet(sutun, grup)
+        if ozet is None:
+            raise KeyError(f"Kantil özeti olmayan sütun: {sutun}")
+        return ozet.iqr_sinirlari(katsayi)
+    
+    def sinirlar(self, esikler, grup=None):
+        """
+        Birden çok parametre için alt/üst sınırlar
+        
+        Args:
+            esikler (dict): Parametre -> IQR katsayısı
+            grup (str): Grup kodu (None ise tüm gruplar)
+        
+        Returns:
+            dict: Parametre -> (alt sınır, üst sınır)
+        """
+        sinirlar = {}
+        for col, katsayi in esikler.items():
+            ozet = self.ozet(col, grup)
+            if ozet is not None and ozet.n > 0:
+                _, _, alt, ust = ozet.iqr_sinirlari(katsayi)
+                sinirlar[col] = (alt, ust)
+        return sinirlar
+    
+    def kaydet(self, yol=OZET_DOSYASI):
+        """Özetleri JSON dosyasına yazar"""
+        klasor = os.path.dirname(yol)
+        if klasor:
+            os.makedirs(klasor, exist_ok=True)
+        
+        veri = {
+            'grup_sutunu': self.grup_sutunu,
+            'hata_payi': self.hata_payi,
+            'ozetler': {grup: {col: ozet.sozluk() for col, ozet in sutunlar.items()}
+                        for grup, sutunlar in self.ozetler.items()}
+        }
+        with open(yol, 'w', encoding='utf-8') as f:
+            json.dump(veri, f, ensure_ascii=False)
+        
+        print(f"💾 {sum(len(s) for s in self.ozetler.values())} kantil özeti '{yol}' dosyasına kaydedildi")
+    
+    @classmethod
+    def yukle(cls, yol=OZET_DOSYASI):
+        """
+        JSON dosyasından özetleri okur
+        
+        Returns:
+            KantilOzetleri: Okunan özetler (dosya yoksa None)
+        """
+        if not os.path.exists(yol):
+            return None
+        
+        with open(yol, encoding='utf-8') as f:
+            veri = json.load(f)
+        
+        ozetler = cls(veri['grup_sutunu'], veri['hata_payi'])
+        ozetler.ozetler = {grup: {col: KLLOzeti.sozlukten(o) for col, o in sutunlar.items()}
+                           for grup, sutunlar in veri['ozetler'].items()}
+        return ozetler
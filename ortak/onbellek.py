@@ -0,0 +1,251 @@
+"""
+Önbellek Modülü
+Bu modül Excel'den ayrıştırılan verileri sütunlu formatta (Parquet) diskte
+saklar. Kaynak dosya değişmediği sürece sonraki çalıştırmalar Excel'i yeniden
+ayrıştırmaz.
+"""
+
+import os
+import json
+import time
+import hashlib
+from contextlib import contextmanager
+import pandas as pd
+
+# İndeks kilidi: POSIX'te fcntl, Windows'ta msvcrt
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+    import msvcrt
+
+class ExcelOnbellek:
+    """
+    Ayrıştırılmış DataFrame'leri Parquet olarak saklayan disk önbelleği
+    
+    Anahtar: dosya yolu + boyut + değiştirilme zamanı + içerik özeti (hash)
+    Tahliye: en uzun süredir kullanılmayan kayıt önce silinir (LRU)
+    
+    Paralel yükleyiciler (coklu_yukleme) aynı önbelleği kullanır; indeksin
+    her oku-değiştir-yaz adımı bir kilit dosyasıyla sıraya konur.
+    """
+    
+    INDEKS_DOSYASI = 'indeks.json'
+    
+    def __init__(self, onbellek_dizini='data/cache/', max_boyut_mb=500, max_kayit=20):
+        """
+        Args:
+            onbellek_dizini (str): Önbellek dosyalarının tutulacağı klasör
+            max_boyut_mb (float): Önbelleğin diskte kaplayabileceği en fazla alan (MB)
+            max_kayit (int): Önbellekte tutulacak en fazla kayıt sayısı
+        """
+        self.onbellek_dizini = onbellek_dizini
+        self.max_boyut_bayt = int(max_boyut_mb * 1024 * 1024)
+        self.max_kayit = max_kayit
+    
+    def _indeks_yolu(self):
+        return os.path.join(self.onbellek_dizini, self.INDEKS_DOSYASI)
+    
+    def _indeks_oku(self):
+        try:
+            with open(self._indeks_yolu(), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+    
+    def _indeks_yaz(self, indeks):
+        os.makedirs(self.onbellek_dizini, exist_ok=True)
+        # Paralel yükleyiciler aynı indeksi yazabilir; geçici dosya sürece özel
+        gecici_yol = f'{self._indeks_yolu()}.{os.getpid()}.tmp'
+        with open(gecici_yol, 'w', encoding='utf-8') as f:
+            json.dump(indeks, f, indent=2, ensure_ascii=False)
+        os.replace(gecici_yol, self._indeks_yolu())
+    
+    @contextmanager
+    def _indeks_kilidi(self):
+        """İndeksin okunup yeniden yazıldığı bloğu süreçler arasında kilitler"""
+        os.makedirs(self.onbellek_dizini, exist_ok=True)
+        with open(f'{self._indeks_yolu()}.lock', 'a+b') as kilit:
+            if fcntl is not None:
+                fcntl.flock(kilit.fileno(), fcntl.LOCK_EX)
+            else:
+                kilit.seek(0)
+                msvcrt.locking(kilit.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(kilit.fileno(), fcntl.LOCK_UN)
+                else:
+                    kilit.seek(0)
+                    msvcrt.locking(kilit.fileno(), msvcrt.LK_UNLCK, 1)
+    
+    @staticmethod
+    def icerik_ozeti(dosya_yolu, blok_boyutu=1024 * 1024):
+        """
+        Dosya içeriğinin özetini (BLAKE2b) hesaplar
+        
+        Args:
+            dosya_yolu (str): Özeti alınacak dosya
+            blok_boyutu (int): Okuma blok boyutu (bayt)
+        
+        Returns:
+            str: Hex formatında içerik özeti
+        """
+        ozet = hashlib.blake2b(digest_size=16)
+        with open(dosya_yolu, 'rb') as f:
+            for blok in iter(lambda: f.read(blok_boyutu), b''):
+                ozet.update(blok)
+        return ozet.hexdigest()
+    
+    def anahtar_olustur(self, dosya_yolu, surum=None):
+        """
+        Kaynak dosya için önbellek anahtarını oluşturur
+        
+        Args:
+            dosya_yolu (str): Kaynak Excel dosyası
+            surum (str): Saklanan tabloya uygulanan dönüşümün sürümü; dönüşüm
+                değişince eski kayıtlar kullanılmaz
+        
+        Returns:
+            str: Önbellek anahtarı
+        """
+        durum = os.stat(dosya_yolu)
+        parcalar = [
+            os.path.abspath(dosya_yolu),
+            str(durum.st_size),
+            str(durum.st_mtime_ns),
+            self.icerik_ozeti(dosya_yolu)
+        ]
+        if surum is not None:
+            parcalar.append(str(surum))
+        return hashlib.blake2b('|'.join(parcalar).encode('utf-8'), digest_size=16).hexdigest()
+    
+    def getir(self, dosya_yolu, surum=None):
+        """
+        Kaynak dosya değişmemişse önbellekteki DataFrame'i döndürür
+        
+        Args:
+            dosya_yolu (str): Kaynak Excel dosyası
+            surum (str): Dönüşüm sürümü (kaydet ile aynı olmalı)
+        
+        Returns:
+            pd.DataFrame: Önbellekteki veri (yoksa None)
+        """
+        anahtar = self.anahtar_olustur(dosya_yolu, surum)
+        kayit = self._indeks_oku().get(anahtar)
+        
+        if kayit is None:
+            return None
+        
+        onbellek_yolu = os.path.join(self.onbellek_dizini, kayit['dosya'])
+        try:
+            if kayit['format'] == 'parquet':
+                df = pd.read_parquet(onbellek_yolu)
+            else:
+                df = pd.read_pickle(onbellek_yolu)
+        except Exception:
+            # Bozuk veya silinmiş önbellek dosyası - kaydı düşür
+            with self._indeks_kilidi():
+                indeks = self._indeks_oku()
+                indeks.pop(anahtar, None)
+                self._indeks_yaz(indeks)
+            return None
+        
+        self._erisimi_guncelle(anahtar)
+        return df
+    
+    def _erisimi_guncelle(self, anahtar):
+        """Kaydın son erişim zamanını (LRU sırası) günceller"""
+        with self._indeks_kilidi():
+            indeks = self._indeks_oku()
+            if anahtar in indeks:
+                indeks[anahtar]['son_erisim'] = time.time()
+                self._indeks_yaz(indeks)
+    
+    def kaydet(self, dosya_yolu, df, surum=None):
+        """
+        DataFrame'i önbelleğe yazar, aynı kaynağın eski kayıtlarını siler
+        
+        Tablo Parquet'e yazılabilmesi için tiplendirilmiş olmalıdır; Arrow'a
+        çevrilemeyen (karışık tipli sütunlu) tablolar uyarıyla pickle olarak
+        saklanır.
+        
+        Args:
+            dosya_yolu (str): Kaynak Excel dosyası
+            df (pd.DataFrame): Saklanacak veri
+            surum (str): Dönüşüm sürümü (bkz. anahtar_olustur)
+        """
+        os.makedirs(self.onbellek_dizini, exist_ok=True)
+        anahtar = self.anahtar_olustur(dosya_yolu, surum)
+        
+        format_ = 'parquet'
+        hedef = os.path.join(self.onbellek_dizini, f'{anahtar}.parquet')
+        try:
+            df.to_parquet(hedef)
+        except Exception as e:
+            print(f"⚠️  Önbellek Parquet'e yazılamadı, pickle kullanılıyor: {str(e)}")
+            if os.path.exists(hedef):
+                os.remove(hedef)
+            format_ = 'pickle'
+            hedef = os.path.join(self.onbellek_dizini, f'{anahtar}.pkl')
+            df.to_pickle(hedef)
+        
+        kaynak = os.path.abspath(dosya_yolu)
+        
+        with self._indeks_kilidi():
+            indeks = self._indeks_oku()
+            
+            # Aynı kaynağın eski (geçersiz) kayıtları artık kullanılamaz
+            for eski_anahtar in [a for a, k in indeks.items() if k['kaynak'] == kaynak and a != anahtar]:
+                self._kayit_sil(indeks, eski_anahtar)
+            
+            indeks[anahtar] = {
+                'kaynak': kaynak,
+                'dosya': os.path.basename(hedef),
+                'format': format_,
+                'boyut_bayt': os.path.getsize(hedef),
+                'son_erisim': time.time()
+            }
+            
+            self._tahliye_et(indeks)
+            self._indeks_yaz(indeks)
+    
+    def _kayit_sil(self, indeks, anahtar):
+        kayit = indeks.pop(anahtar, None)
+        if kayit is None:
+            return
+        yol = os.path.join(self.onbellek_dizini, kayit['dosya'])
+        if os.path.exists(yol):
+            os.remove(yol)
+    
+    def _tahliye_et(self, indeks):
+        """
+        Kayıt sayısı veya toplam boyut sınırı aşılırsa en eski kayıtları siler
+        """
+        sirali = sorted(indeks.items(), key=lambda x: x[1]['son_erisim'])
+        toplam_boyut = sum(k['boyut_bayt'] for _, k in sirali)
+        
+        while sirali and (len(sirali) > self.max_kayit or toplam_boyut > self.max_boyut_bayt):
+            # Son eklenen kaydı tek başına sınırı aşsa bile tut
+            if len(sirali) == 1:
+                break
+            anahtar, kayit = sirali.pop(0)
+            toplam_boyut -= kayit['boyut_bayt']
+            self._kayit_sil(indeks, anahtar)
+    
+    def gecersiz_kil(self, dosya_yolu=None):
+        """
+        Önbellek kayıtlarını siler
+        
+        Args:
+            dosya_yolu (str): Sadece bu kaynağın kayıtlarını sil (None ise tümü)
+        """
+        kaynak = os.path.abspath(dosya_yolu) if dosya_yolu else None
+        
+        with self._indeks_kilidi():
+            indeks = self._indeks_oku()
+            for anahtar in list(indeks.keys()):
+                if kaynak is None or indeks[anahtar]['kaynak'] == kaynak:
+                    self._kayit_sil(indeks, anahtar)
+            self._indeks_yaz(indeks)
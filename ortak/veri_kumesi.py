@@ -0,0 +1,94 @@
+"""
+Veri Kümesi Modülü
+Bu modül temizlenmiş veriyi sütunlu (Parquet) olarak saklar ve analiz
+adımlarına sadece ihtiyaç duydukları sütunları yükler (tembel yükleme).
+"""
+
+import os
+import pandas as pd
+
+class TembelVeriKumesi:
+    """
+    Sütunları sadece istendiğinde belleğe alan veri kümesi
+    
+    Her analiz sınıfı gerekli_sutunlar() ile kullandığı sütunları bildirir;
+    veri_kumesinden() bu sütunları seçip sınıfı oluşturur.
+    """
+    
+    def __init__(self, kaynak):
+        """
+        Args:
+            kaynak (str | pd.DataFrame): Parquet dosya yolu veya bellekteki DataFrame
+        """
+        self.kaynak = kaynak
+        
+        if isinstance(kaynak, pd.DataFrame):
+            self._sutunlar = kaynak.columns.tolist()
+            self._satir_sayisi = len(kaynak)
+        else:
+            import pyarrow.parquet as pq
+            
+            meta = pq.ParquetFile(kaynak).metadata
+            self._sutunlar = [meta.schema.column(i).name for i in range(meta.num_columns)]
+            self._satir_sayisi = meta.num_rows
+    
+    @classmethod
+    def kaydet(cls, df, yol):
+        """
+        DataFrame'i Parquet olarak kaydeder ve üzerinde bir veri kümesi açar
+        
+        Args:
+            df (pd.DataFrame): Saklanacak veri
+            yol (str): Parquet dosya yolu
+        
+        Returns:
+            TembelVeriKumesi: Kaydedilen dosyaya bağlı veri kümesi
+        """
+        klasor = os.path.dirname(yol)
+        if klasor:
+            os.makedirs(klasor, exist_ok=True)
+        df.to_parquet(yol, index=False)
+        return cls(yol)
+    
+    @property
+    def sutunlar(self):
+        """Veri kümesindeki tüm sütun isimleri"""
+        return list(self._sutunlar)
+    
+    def __len__(self):
+        return self._satir_sayisi
+    
+    def sec(self, sutunlar=None):
+        """
+        Sadece istenen sütunları belleğe alır
+        
+        Args:
+            sutunlar (list): Yüklenecek sütunlar (None ise tümü)
+        
+        Returns:
+            pd.DataFrame: Seçilen sütunlar
+        """
+        if sutunlar is None:
+            sutunlar = self._sutunlar
+        else:
+            eksik = [s for s in sutunlar if s not in self._sutunlar]
+            if eksik:
+                raise KeyError(f"Veri kümesinde olmayan sütunlar: {eksik}")
+        
+        if isinstance(self.kaynak, pd.DataFrame):
+            return self.kaynak[list(sutunlar)]
+        
+        return pd.read_parquet(self.kaynak, columns=list(sutunlar))
+
+def sutunlari_filtrele(mevcut, gerekli):
+    """
+    Gerekli sütunlardan veri kümesinde bulunanları sırasıyla döndürür
+    
+    Args:
+        mevcut (list): Veri kümesindeki sütunlar
+        gerekli (list): Analizin kullandığı sütunlar
+    
+    Returns:
+        list: Yüklenecek sütunlar
+    """
+    return [col for col in mevcut if col in gerekli]
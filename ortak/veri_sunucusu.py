@@ -0,0 +1,359 @@
+"""
+Veri Sunucusu Modülü
+Bu modül pres baskılarını ve fırın ölçümlerini Excel dışa aktarımı
+beklemeden doğrudan ağ üzerinden alan asyncio tabanlı bir sunucu içerir
+(harici mesaj kuyruğu gerekmez). TCP veya UDP üzerinden satır satır JSON
+ya da CSV kayıtlar kabul edilir, sütunlu tamponlarda partilere toplanır ve
+dolan partiler temizleme/anomali adımlarına verilir.
+
+Protokol (her satır bir kayıt):
+    {"TARİH": "2025-01-07 08:00:00", "KALIP NO": 3, "BASKI NO": 1201, ...}
+    {"FIRIN KODU": "F1", "TARİH": "2024-11-01 08:00:00", "GİRİŞ ISI": 512, ...}
+    veya CSV: bağlantının ilk CSV satırı başlık, sonrakiler kayıt
+UDP'de her datagram kendi içinde tamdır (CSV ise ilk satırı başlıktır).
+
+Geri basınç: parti kuyruğu doluyken TCP bağlantıları okunmaz; işletim
+sisteminin TCP tamponları dolunca istemcinin yazması yavaşlar. UDP'de geri
+basınç mümkün olmadığından kuyruk doluyken gelen partiler düşürülür ve sayılır.
+"""
+
+import pandas as pd
+import asyncio
+import csv
+import json
+import time
+
+class SutunTamponu:
+    """
+    Kayıtları satır yerine sütun listelerinde biriktiren tampon
+    """
+    
+    def __init__(self):
+        self.sutunlar = {}
+        self.satir_sayisi = 0
+    
+    def __len__(self):
+        return self.satir_sayisi
+    
+    def ekle(self, kayit):
+        """
+        Tek bir kaydı tampona ekler
+        
+        Args:
+            kayit (dict): Sütun -> değer
+        """
+        # Partinin ortasında gelen yeni sütunlar önceki satırlar için boş doldurulur
+        for col in kayit:
+            if col not in self.sutunlar:
+                self.sutunlar[col] = [None] * self.satir_sayisi
+        
+        for col, degerler in self.sutunlar.items():
+            degerler.append(kayit.get(col))
+        self.satir_sayisi += 1
+    
+    def bosalt(self):
+        """
+        Tampondaki kayıtları DataFrame olarak döndürür ve tamponu sıfırlar
+        
+        Returns:
+            pd.DataFrame: Biriken parti
+        """
+        df = pd.DataFrame(self.sutunlar)
+        self.sutunlar = {}
+        self.satir_sayisi = 0
+        return df
+
+def satiri_coz(satir, baslik=None):
+    """
+    Bir JSON veya CSV satırını kayda çevirir
+    
+    Args:
+        satir (bytes | str): Tek satır
+        baslik (list): Bu bağlantıdaki CSV başlığı (yoksa None)
+    
+    Returns:
+        tuple: (kayıt dict'i veya None, güncel başlık)
+    """
+    if isinstance(satir, bytes):
+        satir = satir.decode('utf-8')
+    satir = satir.strip().lstrip('\ufeff')
+    
+    if not satir:
+        return None, baslik
+    
+    if satir.startswith('{'):
+        return json.loads(satir), baslik
+    
+    alanlar = next(csv.reader([satir]))
+    if baslik is None:
+        # İlk CSV satırı başlıktır
+        return None, [a.strip() for a in alanlar]
+    
+    return {col: (deger if deger != '' else None) for col, deger in zip(baslik, alanlar)}, baslik
+
+class VeriSunucusu:
+    """
+    Kayıtları TCP/UDP üzerinden alıp partiler halinde işleyiciye veren sunucu
+    """
+    
+    # Port verilmezse dinlenen TCP portu (projeler kendi portlarıyla ezer)
+    VARSAYILAN_PORT = 9009
+    
+    def __init__(self, isleyici, parti_boyutu=1000, bekleme_suresi=1.0, kuyruk_boyutu=8,
+                 host='127.0.0.1', port=None, udp_port=None):
+        """
+        Args:
+            isleyici (callable): DataFrame partisini işleyen fonksiyon
+                (iş parçacığında çalışır, olay döngüsünü bloklamaz)
+            parti_boyutu (int): Bu kadar kayıt birikince parti işlenir
+            bekleme_suresi (float): Dolmayan parti en geç bu süre sonra işlenir (sn)
+            kuyruk_boyutu (int): İşlenmeyi bekleyen en fazla parti sayısı
+            host (str): Dinlenecek adres
+            port (int): TCP portu (None ise VARSAYILAN_PORT)
+            udp_port (int): UDP portu (None ise UDP kapalı)
+        """
+        self.isleyici = isleyici
+        self.parti_boyutu = parti_boyutu
+        self.bekleme_suresi = bekleme_suresi
+        self.kuyruk_boyutu = kuyruk_boyutu
+        self.host = host
+        self.port = self.VARSAYILAN_PORT if port is None else port
+        self.udp_port = udp_port
+        
+        self.tampon = SutunTamponu()
+        self.kuyruk = None
+        self.istatistik = {
+            'baglanti': 0, 'alinan': 0, 'hatali': 0,
+            'islenen': 0, 'parti': 0, 'dusurulen': 0, 'isleme_hatasi': 0
+        }
+    
+    def _kayit_ekle(self, kayit):
+        """Kaydı tampona ekler; parti dolduysa tamponu boşaltıp döndürür"""
+        self.tampon.ekle(kayit)
+        self.istatistik['alinan'] += 1
+        
+        if len(self.tampon) >= self.parti_boyutu:
+            return self.tampon.bosalt()
+        return None
+    
+    @staticmethod
+    async def _satir_oku(reader):
+        """
+        Bağlantıdan bir satır okur; akış sınırını (64 KB) aşan satırı sonuna
+        kadar okuyup atar, bağlantı açık kalır
+        
+        Returns:
+            bytes: Satır (bağlantı kapandıysa b''); sınırı aşan satırda None
+        """
+        try:
+            return await reader.readuntil(b'\n')
+        except asyncio.IncompleteReadError as e:
+            # Satır sonu olmadan kapanan bağlantının son satırı
+            return e.partial
+        except asyncio.LimitOverrunError:
+            pass
+        
+        # Tampondaki kısım atılır, satır sonu gelene kadar okumaya devam edilir
+        while True:
+            try:
+                await reader.readuntil(b'\n')
+                return None
+            except asyncio.LimitOverrunError as e:
+                await reader.readexactly(e.consumed)
+            except asyncio.IncompleteReadError:
+                return None
+    
+    async def _baglanti_isle(self, reader, writer):
+        """Tek bir TCP bağlantısından gelen satırları okur"""
+        self.istatistik['baglanti'] += 1
+        baslik = None
+        
+        try:
+            while True:
+                satir = await self._satir_oku(reader)
+                if satir is None:
+                    self.istatistik['hatali'] += 1
+                    continue
+                if not satir:
+                    break
+                
+                try:
+                    kayit, baslik = satiri_coz(satir, baslik)
+                except (ValueError, csv.Error):
+                    self.istatistik['hatali'] += 1
+                    continue
+                
+                if kayit is None:
+                    continue
+                
+                parti = self._kayit_ekle(kayit)
+                if parti is not None:
+                    # Kuyruk doluysa burada beklenir; bu sürede soket okunmaz
+                    await self.kuyruk.put(parti)
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+    
+    def _datagram_isle(self, veri):
+        """Tek bir UDP datagramındaki satırları işler"""
+        baslik = None
+        
+        for satir in veri.splitlines():
+            try:
+                kayit, baslik = satiri_coz(satir, baslik)
+            except (ValueError, csv.Error):
+                self.istatistik['hatali'] += 1
+                continue
+            
+            if kayit is None:
+                continue
+            
+            parti = self._kayit_ekle(kayit)
+            if parti is not None:
+                try:
+                    self.kuyruk.put_nowait(parti)
+                except asyncio.QueueFull:
+                    self.istatistik['dusurulen'] += len(parti)
+    
+    async def _zamanlayici(self):
+        """Yavaş akışlarda dolmayan partileri de belirli aralıklarla işler"""
+        while True:
+            await asyncio.sleep(self.bekleme_suresi)
+            if len(self.tampon) > 0:
+                await self.kuyruk.put(self.tampon.bosalt())
+    
+    async def _isci(self):
+        """Kuyruktaki partileri sırayla işleyiciye verir"""
+        dongu = asyncio.get_running_loop()
+        
+        while True:
+            parti = await self.kuyruk.get()
+            try:
+                # pandas işleri olay döngüsünü bloklamasın diye iş parçacığında
+                await dongu.run_in_executor(None, self.isleyici, parti)
+                self.istatistik['islenen'] += len(parti)
+                self.istatistik['parti'] += 1
+            except Exception as e:
+                self.istatistik['isleme_hatasi'] += 1
+                print(f"❌ Parti işlenemedi ({len(parti)} kayıt): {e}")
+            finally:
+                self.kuyruk.task_done()
+    
+    async def calistir(self, sure=None):
+        """
+        Sunucuyu başlatır; durdurulana kadar (Ctrl+C) veya verilen süre boyunca çalışır
+        
+        Args:
+            sure (float): Çalışma süresi (sn, None ise süresiz)
+        """
+        dongu = asyncio.get_running_loop()
+        self.kuyruk = asyncio.Queue(maxsize=self.kuyruk_boyutu)
+        
+        sunucu = await asyncio.start_server(self._baglanti_isle, self.host, self.port)
+        print(f"📡 TCP dinleniyor: {self.host}:{self.port}")
+        
+        udp = None
+        if self.udp_port is not None:
+            udp, _ = await dongu.create_datagram_endpoint(
+                lambda: _UdpProtokolu(self), local_addr=(self.host, self.udp_port)
+            )
+            print(f"📡 UDP dinleniyor: {self.host}:{self.udp_port}")
+        
+        gorevler = [asyncio.create_task(self._isci()), asyncio.create_task(self._zamanlayici())]
+        
+        try:
+            async with sunucu:
+                if sure is None:
+                    await sunucu.serve_forever()
+                else:
+                    await asyncio.sleep(sure)
+        except asyncio.CancelledError:
+            pass
+        finally:
+            sunucu.close()
+            if udp is not None:
+                udp.close()
+            
+            # Kalan kayıtları işleyip çık
+            if len(self.tampon) > 0:
+                await self.kuyruk.put(self.tampon.bosalt())
+            await self.kuyruk.join()
+            
+            for gorev in gorevler:
+                gorev.cancel()
+            
+            self.ozet_yazdir()
+    
+    def ozet_yazdir(self):
+        """Sunucu istatistiklerini yazdırır"""
+        i = self.istatistik
+        print(f"\n📊 {i['baglanti']} bağlantı, {i['alinan']} kayıt alındı, "
+              f"{i['islenen']} kayıt {i['parti']} partide işlendi")
+        if i['hatali'] or i['dusurulen'] or i['isleme_hatasi']:
+            print(f"⚠️  {i['hatali']} hatalı satır, {i['dusurulen']} düşürülen kayıt, "
+                  f"{i['isleme_hatasi']} işlenemeyen parti")
+
+class _UdpProtokolu(asyncio.DatagramProtocol):
+    """UDP datagramlarını sunucuya ileten protokol"""
+    
+    def __init__(self, sunucu):
+        self.sunucu = sunucu
+    
+    def datagram_received(self, veri, adres):
+        self.sunucu._datagram_isle(veri)
+
+async def tekrar_oynat(dosya_yolu, host='127.0.0.1', port=9009, hiz=None,
+                       baglanti_sayisi=1, bicim='json'):
+    """
+    CSV dosyasındaki kayıtları sunucuya gönderir (test istemcisi)
+    
+    Kayıtlar bağlantılar arasında sırayla paylaştırılır.
+    
+    Args:
+        dosya_yolu (str): Gönderilecek CSV (ör. data/processed/enjeksiyon_temiz.csv)
+        host (str): Sunucu adresi
+        port (int): Sunucu TCP portu
+        hiz (float): Saniyede gönderilecek toplam kayıt (None ise sınırsız)
+        baglanti_sayisi (int): Eşzamanlı bağlantı sayısı
+        bicim (str): 'json' veya 'csv'
+    
+    Returns:
+        float: Gönderim süresi (sn)
+    """
+    df = pd.read_csv(dosya_yolu, dtype=str)
+    
+    if bicim == 'json':
+        satirlar = [json.dumps({k: v for k, v in kayit.items() if pd.notna(v)}, ensure_ascii=False)
+                    for kayit in df.to_dict('records')]
+        baslik = None
+    else:
+        satirlar = df.to_csv(index=False, header=False).splitlines()
+        baslik = ','.join(df.columns)
+    
+    async def gonder(parca):
+        _, writer = await asyncio.open_connection(host, port)
+        if baslik is not None:
+            writer.write((baslik + '\n').encode('utf-8'))
+        
+        aralik = baglanti_sayisi / hiz if hiz else 0
+        sonraki = time.monotonic()
+        for satir in parca:
+            writer.write((satir + '\n').encode('utf-8'))
+            # drain sunucu yavaşladığında (geri basınç) burada bekler
+            await writer.drain()
+            if aralik:
+                sonraki += aralik
+                await asyncio.sleep(max(0, sonraki - time.monotonic()))
+        
+        writer.close()
+        await writer.wait_closed()
+    
+    baslangic = time.monotonic()
+    await asyncio.gather(*(gonder(satirlar[i::baglanti_sayisi]) for i in range(baglanti_sayisi)))
+    sure = time.monotonic() - baslangic
+    
+    print(f"📤 {len(satirlar)} kayıt {baglanti_sayisi} bağlantıyla {sure:.1f} sn'de gönderildi "
+          f"({len(satirlar) / sure if sure else 0:.0f} kayıt/sn)")
+    
+    return sure